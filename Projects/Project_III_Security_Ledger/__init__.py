@@ -26,9 +26,11 @@ __stability__ = "LTS"
 # PUBLIC API (EXPLICIT)
 # ------------------------------------------------------------
 from .secure_vault import FBCSecureVault
+from .ledger_writer import LedgerBackpressureError
 
 __all__ = [
     "FBCSecureVault",
+    "LedgerBackpressureError",
     "__version__",
     "__package_role__",
     "__classification__",
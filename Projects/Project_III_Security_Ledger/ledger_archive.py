@@ -0,0 +1,509 @@
+# ============================================================
+# FBC DIGITAL SYSTEMS
+# Project III – Security Ledger
+# File: ledger_archive.py
+#
+# DESCRIPTION:
+# Segment rotation for the append-only ledgers.
+# - The active segment is sealed into a gzip archive
+# - A chained seal block (Merkle root, block range, archive
+#   digest of every sealed segment) heads the new segment
+# - Archives are validated against their seal by digest,
+#   or decompressed and re-verified on request
+# - Each archive gets a project/node/time index sidecar
+#   (digest recorded in the seal) so find() covers sealed
+#   history without decompressing unmatched segments
+# - LedgerSegments wires rotation and sealed lookups into
+#   the sector and global vaults
+#
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ============================================================
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .ledger_index import LedgerIndex, TimeBound, _to_epoch
+from .ledger_merkle import MerkleAccumulator, MerkleTree
+from .ledger_verify import GENESIS_PREVIOUS_HASH, block_hash, verify_chain
+
+# ============================================================
+# ARCHIVE CONSTANTS
+# ============================================================
+SEAL_PROJECT_ID = "LEDGER_SEAL"
+
+DEFAULT_SEGMENT_BYTES = int(os.getenv("FBC_LEDGER_SEGMENT_BYTES", 256 * 1024 * 1024))
+
+_COPY_CHUNK_BYTES = 1 << 20
+
+
+# ============================================================
+# LAYOUT
+# ============================================================
+def archive_dir(storage) -> Path:
+    """`<stem>.segments/` next to the active segment."""
+    return storage.path.with_name(f"{storage.path.stem}.segments")
+
+
+def sealed_segments(storage) -> List[Dict[str, Any]]:
+    """Summaries recorded by the seal heading the active segment."""
+    head = next(storage.scan(), None)
+    if head is None or head[1].get("project_id") != SEAL_PROJECT_ID:
+        return []
+    return list(head[1].get("segments", []))
+
+
+def _index_name(archive_name: str) -> str:
+    """`<stem>-000001.jsonl.gz` -> `<stem>-000001.idx.json`."""
+    return archive_name[: -len(".jsonl.gz")] + ".idx.json"
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_COPY_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ============================================================
+# ROTATION
+# ============================================================
+def _archive_active_segment(storage, sequence: int) -> Dict[str, Any]:
+    """
+    Compresses the active segment and summarizes it in the
+    same streaming pass over its blocks.
+    """
+    target_dir = archive_dir(storage)
+    target_dir.mkdir(exist_ok=True)
+    name = f"{storage.path.stem}-{sequence:06d}.jsonl.gz"
+
+    end = storage.end_cursor()
+    merkle = MerkleAccumulator()
+    index = _SegmentIndexBuilder()
+    first = last = None
+
+    for _, block in storage.scan(0, end):
+        merkle.add(block)
+        index.add(block)
+        if first is None:
+            first = block
+        last = block
+
+    with open(storage.path, "rb") as src, tempfile.NamedTemporaryFile(
+        dir=target_dir, delete=False
+    ) as tmp:
+        with gzip.GzipFile(filename="", mode="wb", fileobj=tmp, mtime=0) as gz:
+            remaining = end
+            while remaining:
+                chunk = src.read(min(_COPY_CHUNK_BYTES, remaining))
+                gz.write(chunk)
+                remaining -= len(chunk)
+        tmp.flush()
+        os.fsync(tmp.fileno())
+        tmp_name = tmp.name
+
+    os.replace(tmp_name, target_dir / name)
+    index_name = _index_name(name)
+    _write_json(target_dir / index_name, index.entries)
+
+    return {
+        "sequence": sequence,
+        "file": name,
+        "first_index": first["index"],
+        "last_index": last["index"],
+        "blocks": merkle.count,
+        "last_hash": last["audit_hash"],
+        "merkle_root": merkle.root(),
+        "sha256": _file_sha256(target_dir / name),
+        "index_file": index_name,
+        "index_sha256": _file_sha256(target_dir / index_name),
+    }
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        encoding="utf-8",
+        dir=path.parent,
+        delete=False,
+    ) as tmp:
+        json.dump(payload, tmp, separators=(",", ":"))
+        tmp.flush()
+        os.fsync(tmp.fileno())
+        tmp_name = tmp.name
+
+    os.replace(tmp_name, path)
+
+
+def rotate_segment(
+    storage,
+    make_seal: Callable[[Dict[str, Any], List[Dict[str, Any]]], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Seals the active segment (caller holds the ledger lock).
+
+    `make_seal(last_block, segments)` returns the chained seal
+    block; it replaces the active segment, so later appends,
+    scans and incremental verification only touch blocks
+    written after the seal.
+    """
+    if storage.kind != "jsonl":
+        raise ValueError("Segment rotation requires the jsonl storage engine")
+
+    segments = sealed_segments(storage)
+    summary = _archive_active_segment(storage, len(segments) + 1)
+
+    seal = make_seal(storage.last_block(), segments + [summary])
+    storage.import_blocks([seal])
+    return seal
+
+
+# ============================================================
+# FULL HISTORY
+# ============================================================
+def iter_history(storage) -> Iterator[Dict[str, Any]]:
+    """
+    Every block from genesis: the sealed archives in order,
+    each matched against its seal digest first, then the
+    active segment. For engine migrations; raises ValueError
+    when an archive is missing or altered.
+    """
+    root = archive_dir(storage)
+
+    for summary in sealed_segments(storage):
+        path = root / summary["file"]
+        if not path.exists() or _file_sha256(path) != summary["sha256"]:
+            raise ValueError(f"Archive missing or does not match its seal: {path}")
+        for _, block in _iter_archive(path):
+            yield block
+
+    yield from storage.iter_blocks()
+
+
+# ============================================================
+# ARCHIVE VERIFICATION
+# ============================================================
+def _iter_archive(
+    path: Path,
+    merkle: Optional[MerkleAccumulator] = None,
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Streams an archived segment, feeding `merkle` as it goes."""
+    with gzip.open(path, "rb") as f:
+        for k, line in enumerate(f):
+            block = json.loads(line)
+            if merkle is not None:
+                merkle.add(block)
+            yield k, block
+
+
+def verify_archives(
+    storage,
+    secret: str,
+    deep: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """
+    Validates sealed history against the seal heading the
+    active segment (whose own hash is checked by the chain
+    scan). Returns a failure dict or None.
+
+    By default each archive is matched by its compressed
+    digest only. deep=True decompresses every archive,
+    re-verifies its chain and recomputes its Merkle root.
+    """
+    segments = sealed_segments(storage)
+    if not segments:
+        return None
+
+    head = next(storage.scan())[1]
+    if head["previous_hash"] != segments[-1]["last_hash"]:
+        return {"status": "CHAIN_BROKEN", "block_index": head["index"]}
+
+    root = archive_dir(storage)
+    previous_hash = None
+
+    for summary in segments:
+        path = root / summary["file"]
+
+        if not path.exists():
+            return {"status": "ARCHIVE_MISSING", "segment": summary["file"]}
+
+        if _file_sha256(path) != summary["sha256"]:
+            return {"status": "ARCHIVE_TAMPERED", "segment": summary["file"]}
+
+        if not deep:
+            continue
+
+        merkle = MerkleAccumulator()
+        entries = _iter_archive(path, merkle)
+        anchor = next(entries)
+
+        if anchor[1]["previous_hash"] != (previous_hash or GENESIS_PREVIOUS_HASH):
+            return {"status": "CHAIN_BROKEN", "block_index": summary["first_index"]}
+
+        if (
+            previous_hash is not None
+            and block_hash(anchor[1], secret) != anchor[1]["audit_hash"]
+        ):
+            return {"status": "TAMPER_DETECTED", "block_index": summary["first_index"]}
+
+        scan = verify_chain(entries, secret, anchor, summary["first_index"])
+        if scan.failure is not None:
+            return scan.failure
+
+        if (
+            merkle.root() != summary["merkle_root"]
+            or merkle.count != summary["blocks"]
+            or scan.last_block["audit_hash"] != summary["last_hash"]
+        ):
+            return {"status": "MERKLE_MISMATCH", "segment": summary["file"]}
+
+        previous_hash = summary["last_hash"]
+
+    return None
+
+
+# ============================================================
+# ARCHIVED INCLUSION PROOFS
+# ============================================================
+def archived_inclusion_proof(
+    storage,
+    index: int,
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    (block, inclusion proof) for a sealed block against its
+    segment's recorded Merkle root. Cold path: the archive is
+    decompressed once to rebuild the segment tree.
+    """
+    for summary in sealed_segments(storage):
+        if not summary["first_index"] <= index <= summary["last_index"]:
+            continue
+
+        tree = MerkleTree()
+        block = None
+        for _, current in _iter_archive(archive_dir(storage) / summary["file"]):
+            tree.append(current)
+            if current["index"] == index:
+                block = current
+
+        if block is None or tree.root() != summary["merkle_root"]:
+            raise ValueError(f"Archive does not match its seal: {summary['file']}")
+
+        leaf_index = index - summary["first_index"]
+        return block, {
+            "index": index,
+            "leaf_index": leaf_index,
+            "tree_size": tree.size,
+            "path": tree.audit_path(leaf_index),
+            "root": summary["merkle_root"],
+            "segment": summary["file"],
+        }
+
+    return None
+
+
+# ============================================================
+# SEALED-SEGMENT INDEX
+# ============================================================
+class _SegmentIndexBuilder:
+    """
+    Positions (line numbers within the archive) per project_id
+    and node, plus every block's epoch timestamp in order.
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[str, Any] = {"projects": {}, "nodes": {}, "times": []}
+
+    def add(self, block: Dict[str, Any]) -> None:
+        position = len(self.entries["times"])
+        self.entries["projects"].setdefault(str(block.get("project_id")), []).append(position)
+        self.entries["nodes"].setdefault(str(block.get("node")), []).append(position)
+        self.entries["times"].append(_to_epoch(block["timestamp"]))
+
+
+def _segment_index(root: Path, summary: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The archive's index sidecar when it matches the digest in
+    the seal; otherwise (missing, edited, or a segment sealed
+    before sidecars existed) rebuilt from the archive itself.
+    """
+    name = summary.get("index_file")
+    if name is not None:
+        path = root / name
+        try:
+            if _file_sha256(path) == summary["index_sha256"]:
+                with open(path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    builder = _SegmentIndexBuilder()
+    for _, block in _iter_archive(root / summary["file"]):
+        builder.add(block)
+    return builder.entries
+
+
+def _match_positions(
+    entries: Dict[str, Any],
+    project_id: Optional[str],
+    node: Optional[str],
+    since: Optional[float],
+    until: Optional[float],
+) -> List[int]:
+    candidates: List[Set[int]] = []
+
+    if project_id is not None:
+        candidates.append(set(entries["projects"].get(project_id, ())))
+    if node is not None:
+        candidates.append(set(entries["nodes"].get(node, ())))
+    if since is not None or until is not None:
+        lo = -float("inf") if since is None else since
+        hi = float("inf") if until is None else until
+        candidates.append(
+            {k for k, moment in enumerate(entries["times"]) if lo <= moment <= hi}
+        )
+
+    if not candidates:
+        return list(range(len(entries["times"])))
+
+    candidates.sort(key=len)
+    selected = candidates[0]
+    for group in candidates[1:]:
+        selected = selected & group
+    return sorted(selected)
+
+
+def _read_positions(path: Path, positions: List[int]) -> List[Dict[str, Any]]:
+    """Decodes only the wanted lines of an archive."""
+    wanted = set(positions)
+    last = positions[-1]
+    blocks: List[Dict[str, Any]] = []
+
+    with gzip.open(path, "rb") as f:
+        for k, line in enumerate(f):
+            if k in wanted:
+                blocks.append(json.loads(line))
+            if k == last:
+                break
+
+    return blocks
+
+
+# ============================================================
+# VAULT INTEGRATION
+# ============================================================
+class LedgerSegments:
+    """
+    Segment rotation and sealed-history lookups shared by the
+    sector and global vaults.
+
+    `chain_fn(last, records)` and `hash_fn(payload)` are the
+    vault's own block chaining and audit hashing, so seal
+    blocks follow the vault's schema and secret.
+    """
+
+    def __init__(
+        self,
+        storage,
+        index: LedgerIndex,
+        lock,
+        chain_fn: Callable[[Dict[str, Any], List[Tuple[str, str, float]]], List[Dict[str, Any]]],
+        hash_fn: Callable[[Dict[str, Any]], str],
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    ) -> None:
+        self._storage = storage
+        self._index = index
+        self._lock = lock
+        self._chain_fn = chain_fn
+        self._hash_fn = hash_fn
+        self._segment_bytes = segment_bytes
+        self._sealed_indexes: Dict[str, Dict[str, Any]] = {}  # archives are immutable
+
+    # --------------------------------------------------------
+    # ROTATION
+    # --------------------------------------------------------
+    def seal(self) -> Dict[str, Any]:
+        with self._lock:
+            return self.rotate_locked()
+
+    def after_commit(
+        self,
+        cursors: List[Any],
+        blocks: List[Dict[str, Any]],
+    ) -> None:
+        """Writer hook: index maintenance and size-based rotation."""
+        self._index.on_commit(cursors, blocks)
+
+        if (
+            self._storage.kind == "jsonl"
+            and self._segment_bytes > 0
+            and self._storage.end_cursor() >= self._segment_bytes
+        ):
+            self.rotate_locked()
+
+    def rotate_locked(self) -> Dict[str, Any]:
+        seal = rotate_segment(self._storage, self._seal_block)
+        self._index.reset()
+        return seal
+
+    def _seal_block(
+        self,
+        last: Dict[str, Any],
+        segments: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        node = f"SEGMENT-{segments[-1]['sequence']:06d}"
+        seal = self._chain_fn(last, [(SEAL_PROJECT_ID, node, 0.0)])[0]
+
+        del seal["audit_hash"], seal["status"]
+        seal["segments"] = segments
+        seal["audit_hash"] = self._hash_fn(seal)
+        seal["status"] = "SEGMENT_SEAL"
+
+        return seal
+
+    # --------------------------------------------------------
+    # LOOKUP
+    # --------------------------------------------------------
+    def find(
+        self,
+        project_id: Optional[str] = None,
+        node: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Matching blocks across sealed segments and the active
+        one, in ledger order. Sealed segments are searched via
+        their index sidecars; archives without matches are never
+        decompressed.
+        """
+        active = self._index.find(project_id, node, since, until)
+        seen = {block["index"] for block in active}
+
+        lo = None if since is None else _to_epoch(since)
+        hi = None if until is None else _to_epoch(until)
+        root = archive_dir(self._storage)
+        sealed: List[Dict[str, Any]] = []
+
+        for summary in sealed_segments(self._storage):
+            entries = self._sealed_indexes.get(summary["file"])
+            if entries is None:
+                entries = self._sealed_indexes[summary["file"]] = _segment_index(
+                    root, summary
+                )
+
+            positions = _match_positions(entries, project_id, node, lo, hi)
+            if positions:
+                sealed.extend(
+                    block
+                    for block in _read_positions(root / summary["file"], positions)
+                    if block["index"] not in seen  # rotated between the two reads
+                )
+
+        return sealed + active
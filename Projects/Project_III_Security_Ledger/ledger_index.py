@@ -0,0 +1,269 @@
+# ============================================================
+# FBC DIGITAL SYSTEMS
+# Project III – Security Ledger
+# File: ledger_index.py
+#
+# DESCRIPTION:
+# In-memory secondary indexes (project_id, node, timestamp)
+# and a Merkle tree over the active segment. Built lazily
+# from the log, maintained on every local commit, and caught
+# up with appends made by other processes before each query.
+# Storage with its own indexes and persisted Merkle subtrees
+# (SQLite) is queried directly and never loaded here.
+#
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ============================================================
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .ledger_merkle import MerkleTree
+
+TimeBound = Union[datetime, str, None]
+
+
+# ============================================================
+# TIME NORMALIZATION
+# ============================================================
+def _to_epoch(value: Union[datetime, str]) -> float:
+    """
+    ISO-8601 string or datetime -> UTC epoch seconds.
+    Naive values (global ledger timestamps) are treated as UTC.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return value.timestamp()
+
+
+# ============================================================
+# LEDGER INDEX
+# ============================================================
+class LedgerIndex:
+    """
+    Secondary indexes mapping project_id / node / timestamp to
+    storage cursors, so lookups only deserialize matching blocks,
+    plus the Merkle tree backing inclusion proofs.
+
+    Storage exposing `find` and `merkle_tree` (SQLite) answers
+    lookups, heads and proofs itself; nothing is held in memory
+    for it.
+    """
+
+    def __init__(self, storage) -> None:
+        self._storage = storage
+        self._lock = threading.Lock()
+        self._head: Optional[str] = None
+        self._clear()
+
+    def _clear(self) -> None:
+        self._built = False
+        self._end: Any = 0
+        self._by_project: Dict[str, List[Any]] = defaultdict(list)
+        self._by_node: Dict[str, List[Any]] = defaultdict(list)
+        self._times: List[float] = []
+        self._time_cursors: List[Any] = []
+        self._cursors: List[Any] = []
+        self._first_index: Optional[int] = None
+        self._merkle = MerkleTree()
+
+    # --------------------------------------------------------
+    # MAINTENANCE
+    # --------------------------------------------------------
+    def on_commit(self, cursors: List[Any], blocks: List[Dict[str, Any]]) -> None:
+        """
+        Writer hook (runs under the ledger lock). Applied only
+        when the commit directly follows what is indexed;
+        otherwise the next query catches up from the log.
+        """
+        with self._lock:
+            if self._built and cursors and cursors[0] == self._end:
+                for cursor, block in zip(cursors, blocks):
+                    self._add(cursor, block)
+                self._end = self._storage.end_cursor()
+
+    def reset(self) -> None:
+        """Drops every entry (the segment was rotated)."""
+        with self._lock:
+            self._clear()
+
+    def catch_up(self) -> None:
+        with self._lock:
+            head = next(self._storage.scan(), (None, {}))[1].get("audit_hash")
+            if head != self._head:
+                # Segment rotated (possibly by another process)
+                self._clear()
+                self._head = head
+
+            end = self._storage.end_cursor()
+            if self._built and self._end == end:
+                return
+
+            for cursor, block in self._storage.scan(self._end, end):
+                self._add(cursor, block)
+
+            self._end = end
+            self._built = True
+
+    def _add(self, cursor: Any, block: Dict[str, Any]) -> None:
+        if self._first_index is None:
+            self._first_index = block["index"]
+        self._cursors.append(cursor)
+        self._merkle.append(block)
+
+        self._by_project[block.get("project_id")].append(cursor)
+        self._by_node[block.get("node")].append(cursor)
+
+        moment = _to_epoch(block["timestamp"])
+        if self._times and moment < self._times[-1]:
+            # Clock skew between writers: keep the timeline sorted
+            position = bisect.bisect_right(self._times, moment)
+            self._times.insert(position, moment)
+            self._time_cursors.insert(position, cursor)
+        else:
+            self._times.append(moment)
+            self._time_cursors.append(cursor)
+
+    # --------------------------------------------------------
+    # QUERY
+    # --------------------------------------------------------
+    def find(
+        self,
+        project_id: Optional[str] = None,
+        node: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Blocks matching every given filter, in ledger order.
+        `since` and `until` are inclusive.
+        """
+        native = getattr(self._storage, "find", None)
+        if native is not None:
+            # Storage with its own secondary indexes (SQLite)
+            return native(project_id, node, since, until)
+
+        self.catch_up()
+
+        with self._lock:
+            candidates = []
+
+            if project_id is not None:
+                candidates.append(self._by_project.get(project_id, []))
+            if node is not None:
+                candidates.append(self._by_node.get(node, []))
+            if since is not None or until is not None:
+                lo = 0 if since is None else bisect.bisect_left(
+                    self._times, _to_epoch(since)
+                )
+                hi = len(self._times) if until is None else bisect.bisect_right(
+                    self._times, _to_epoch(until)
+                )
+                candidates.append(self._time_cursors[lo:hi])
+
+            if not candidates:
+                cursors = [c for group in self._by_project.values() for c in group]
+            else:
+                candidates.sort(key=len)
+                selected = set(candidates[0])
+                for group in candidates[1:]:
+                    selected.intersection_update(group)
+                cursors = list(selected)
+
+        cursors.sort()
+        return self._storage.read_many(cursors)
+
+    def head(self) -> Dict[str, Any]:
+        """Size and Merkle root of the active segment's tree."""
+        if hasattr(self._storage, "merkle_tree"):
+            tree = self._storage.merkle_tree()
+            return {
+                "first_index": self._native_first_index(tree),
+                "tree_size": tree.size,
+                "root": tree.root(),
+            }
+
+        self.catch_up()
+
+        with self._lock:
+            return {
+                "first_index": self._first_index,
+                "tree_size": self._merkle.size,
+                "root": self._merkle.root(),
+            }
+
+    def prove(
+        self,
+        index: int,
+        tree_size: Optional[int] = None,
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        (block, inclusion proof) for ledger `index` against the
+        active segment's tree at `tree_size` (default: current
+        size), or None when the index lies outside it. The root
+        is not part of the proof; it comes from a signed head.
+        """
+        if hasattr(self._storage, "merkle_tree"):
+            return self._native_prove(index, tree_size)
+
+        self.catch_up()
+
+        with self._lock:
+            if self._first_index is None:
+                return None
+            size = self._merkle.size if tree_size is None else tree_size
+            leaf_index = index - self._first_index
+            if not 0 <= leaf_index < size <= self._merkle.size:
+                return None
+
+            cursor = self._cursors[leaf_index]
+            proof = {
+                "index": index,
+                "leaf_index": leaf_index,
+                "tree_size": size,
+                "path": self._merkle.audit_path(leaf_index, size),
+                "segment": None,
+            }
+
+        return self._storage.read_many([cursor])[0], proof
+
+    # --------------------------------------------------------
+    # NATIVE TREES
+    # --------------------------------------------------------
+    def _native_first_index(self, tree) -> Optional[int]:
+        if not tree.size:
+            return None
+        return self._storage.read_many([0])[0]["index"]
+
+    def _native_prove(
+        self,
+        index: int,
+        tree_size: Optional[int],
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        # Cursors are leaf positions, contiguous from genesis
+        tree = self._storage.merkle_tree()
+        first_index = self._native_first_index(tree)
+        if first_index is None:
+            return None
+
+        size = tree.size if tree_size is None else tree_size
+        leaf_index = index - first_index
+        if not 0 <= leaf_index < size <= tree.size:
+            return None
+
+        proof = {
+            "index": index,
+            "leaf_index": leaf_index,
+            "tree_size": size,
+            "path": tree.audit_path(leaf_index, size),
+            "segment": None,
+        }
+        return self._storage.read_many([leaf_index])[0], proof
@@ -0,0 +1,236 @@
+# ============================================================
+# FBC DIGITAL SYSTEMS
+# Project III – Security Ledger
+# File: ledger_merkle.py
+#
+# DESCRIPTION:
+# Merkle trees over ledger blocks (RFC 6962 layout:
+# domain-separated leaves and nodes, unbalanced right edge).
+# Each leaf commits to the block's canonical content (every
+# field but "status", audit hash included), so a verifier
+# recomputes it from the record without the ledger secret.
+# Roots are computed in one streaming pass with O(log n)
+# memory, so sealed segments of any size can be summarized;
+# MerkleTree keeps every complete subtree for O(log n)
+# inclusion proofs over the active segment.
+#
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ============================================================
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+EMPTY_ROOT = hashlib.sha256(b"").hexdigest()
+
+_UNCOMMITTED_FIELDS = frozenset({"status"})
+
+
+# ============================================================
+# HASHING
+# ============================================================
+def leaf_hash(block: Dict[str, Any]) -> bytes:
+    content = {k: v for k, v in block.items() if k not in _UNCOMMITTED_FIELDS}
+    raw = json.dumps(content, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(_LEAF_PREFIX + raw.encode("utf-8")).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+def _split(size: int) -> int:
+    """Largest power of two strictly below `size` (size > 1)."""
+    return 1 << ((size - 1).bit_length() - 1)
+
+
+# ============================================================
+# STREAMING ROOT
+# ============================================================
+class MerkleAccumulator:
+    """
+    Incremental Merkle root over a stream of blocks.
+
+    Keeps one perfect subtree per set bit of the leaf count
+    (at most log2(n) hashes), merging equal-sized neighbours
+    as leaves arrive.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._stack: List[Tuple[int, bytes]] = []
+
+    def add(self, block: Dict[str, Any]) -> None:
+        self._stack.append((1, leaf_hash(block)))
+        self.count += 1
+
+        while len(self._stack) >= 2 and self._stack[-1][0] == self._stack[-2][0]:
+            size, right = self._stack.pop()
+            _, left = self._stack.pop()
+            self._stack.append((size * 2, node_hash(left, right)))
+
+    def root(self) -> str:
+        if not self._stack:
+            return EMPTY_ROOT
+
+        root = self._stack[-1][1]
+        for _, left in reversed(self._stack[:-1]):
+            root = node_hash(left, root)
+        return root.hex()
+
+
+def merkle_root(blocks: Iterable[Dict[str, Any]]) -> str:
+    accumulator = MerkleAccumulator()
+    for block in blocks:
+        accumulator.add(block)
+    return accumulator.root()
+
+
+# ============================================================
+# INCLUSION PROOFS
+# ============================================================
+class MerkleTree:
+    """
+    Append-only Merkle tree storing the hash of every complete
+    (power-of-two, aligned) subtree in packed per-level arrays,
+    about 64 bytes per leaf.
+
+    Complete subtrees are looked up directly; only the
+    unbalanced right edge is re-hashed when building a root or
+    an audit path. Roots and paths can be taken for any earlier
+    tree size, so a proof can target a previously signed head.
+
+    Subclasses backed by persisted subtree hashes override
+    `size` and `_node` (see SQLiteLedgerStorage).
+    """
+
+    def __init__(self) -> None:
+        self._levels: List[bytearray] = [bytearray()]
+
+    @property
+    def size(self) -> int:
+        return len(self._levels[0]) // 32
+
+    def append(self, block: Dict[str, Any]) -> None:
+        node = leaf_hash(block)
+        height = 0
+
+        while True:
+            level = self._levels[height]
+            level += node
+            count = len(level) // 32
+            if count % 2:
+                break
+
+            node = node_hash(level[-64:-32], level[-32:])
+            height += 1
+            if height == len(self._levels):
+                self._levels.append(bytearray())
+
+    def root(self, tree_size: Optional[int] = None) -> str:
+        size = self._checked_size(tree_size)
+        if not size:
+            return EMPTY_ROOT
+        return self._subtree(0, size).hex()
+
+    def audit_path(self, leaf_index: int, tree_size: Optional[int] = None) -> List[str]:
+        """RFC 6962 PATH(m, D[n]) for the first `tree_size` leaves, leaf first."""
+        size = self._checked_size(tree_size)
+        if not 0 <= leaf_index < size:
+            raise ValueError("Leaf index out of range")
+
+        path: List[bytes] = []
+        start, end = 0, size
+
+        while end - start > 1:
+            k = _split(end - start)
+            if leaf_index < start + k:
+                path.append(self._subtree(start + k, end))
+                end = start + k
+            else:
+                path.append(self._subtree(start, start + k))
+                start += k
+
+        return [node.hex() for node in reversed(path)]
+
+    def _checked_size(self, tree_size: Optional[int]) -> int:
+        if tree_size is None:
+            return self.size
+        if not 0 <= tree_size <= self.size:
+            raise ValueError("Tree size out of range")
+        return tree_size
+
+    def _node(self, height: int, index: int) -> bytes:
+        """Hash of the complete subtree `index` at `height`."""
+        offset = index * 32
+        return bytes(self._levels[height][offset: offset + 32])
+
+    def _subtree(self, start: int, end: int) -> bytes:
+        size = end - start
+
+        if size & (size - 1) == 0:
+            height = size.bit_length() - 1
+            return self._node(height, start >> height)
+
+        k = _split(size)
+        return node_hash(self._subtree(start, start + k), self._subtree(start + k, end))
+
+
+def verify_audit_path(
+    block: Dict[str, Any],
+    leaf_index: int,
+    tree_size: int,
+    path: Sequence[str],
+    root: str,
+) -> bool:
+    """RFC 9162 inclusion verification; O(len(path)) hashes."""
+    if not 0 <= leaf_index < tree_size:
+        return False
+
+    fn, sn = leaf_index, tree_size - 1
+    node = leaf_hash(block)
+
+    for sibling in path:
+        if sn == 0:
+            return False
+
+        sibling_bytes = bytes.fromhex(sibling)
+        if fn & 1 or fn == sn:
+            node = node_hash(sibling_bytes, node)
+            while not fn & 1 and fn:
+                fn >>= 1
+                sn >>= 1
+        else:
+            node = node_hash(node, sibling_bytes)
+
+        fn >>= 1
+        sn >>= 1
+
+    return sn == 0 and node.hex() == root
+
+
+def verify_inclusion(
+    record: Dict[str, Any],
+    proof: Dict[str, Any],
+    root: str,
+) -> bool:
+    """
+    True when `record` is the block `proof` was issued for and
+    its content, re-hashed here, is a leaf of the tree with
+    `root`. Any edited field changes the leaf.
+    """
+    try:
+        return record["index"] == proof["index"] and verify_audit_path(
+            record,
+            proof["leaf_index"],
+            proof["tree_size"],
+            proof["path"],
+            root,
+        )
+    except (KeyError, TypeError, ValueError):
+        return False
@@ -0,0 +1,114 @@
+# ============================================================
+# FBC DIGITAL SYSTEMS
+# Project III – Security Ledger
+# File: ledger_migrate.py
+#
+# DESCRIPTION:
+# Offline migration of a ledger between storage engines
+# (json -> jsonl -> sqlite). The target is written in one
+# pass and checked block-for-block against the source.
+#
+# USAGE:
+#   python -m Projects.Project_III_Security_Ledger.ledger_migrate \
+#       --root Projects/Project_III_Security_Ledger \
+#       --stem fbc_sector_ledger --source json --target sqlite
+#
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Dict
+
+from .ledger_archive import iter_history
+from .ledger_storage import (
+    STORAGE_JSON,
+    STORAGE_JSONL,
+    STORAGE_SQLITE,
+    JsonArrayLedgerStorage,
+    JsonLinesLedgerStorage,
+    SQLiteLedgerStorage,
+)
+from .ledger_writer import LedgerFileLock
+
+_ENGINES = {
+    STORAGE_JSON: (JsonArrayLedgerStorage, "json"),
+    STORAGE_JSONL: (JsonLinesLedgerStorage, "jsonl"),
+    STORAGE_SQLITE: (SQLiteLedgerStorage, "db"),
+}
+
+
+# ============================================================
+# MIGRATION
+# ============================================================
+def migrate_ledger(
+    root: Path,
+    stem: str,
+    source: str,
+    target: str,
+    overwrite: bool = False,
+) -> Dict[str, Any]:
+    """
+    Copies ledger `stem` under `root` from one storage engine
+    to another while holding the ledger's writer lock.
+
+    The source is left untouched. Raises ValueError if the
+    source is missing, the target already holds blocks
+    (unless overwrite=True), or the copy does not match.
+    """
+    if source == target:
+        raise ValueError("Source and target storage must differ")
+
+    source_cls, source_ext = _ENGINES[source]
+    target_cls, target_ext = _ENGINES[target]
+    src = source_cls(root / f"{stem}.{source_ext}")
+    dst = target_cls(root / f"{stem}.{target_ext}")
+
+    with LedgerFileLock(root / f"{stem}.lock"):
+        if not src.exists():
+            raise ValueError(f"Source ledger not found: {src.path}")
+        if dst.exists() and not overwrite:
+            raise ValueError(f"Target ledger already exists: {dst.path}")
+
+        # Rotated jsonl ledgers: sealed archives first, in order
+        dst.import_blocks(iter_history(src))
+
+        blocks = 0
+        for original, copied in zip_longest(iter_history(src), dst.iter_blocks()):
+            if original != copied:
+                raise ValueError(f"Migrated block {blocks} does not match source")
+            blocks += 1
+
+    return {
+        "source": str(src.path),
+        "target": str(dst.path),
+        "blocks": blocks,
+        "last_hash": dst.last_block()["audit_hash"],
+    }
+
+
+# ============================================================
+# CLI
+# ============================================================
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate an FBC ledger")
+    parser.add_argument("--root", type=Path, required=True)
+    parser.add_argument("--stem", default="fbc_sector_ledger")
+    parser.add_argument("--source", choices=list(_ENGINES), default=STORAGE_JSON)
+    parser.add_argument("--target", choices=list(_ENGINES), default=STORAGE_SQLITE)
+    parser.add_argument("--overwrite", action="store_true")
+    args = parser.parse_args()
+
+    report = migrate_ledger(
+        args.root, args.stem, args.source, args.target, args.overwrite
+    )
+    print(f"Migrated {report['blocks']:,} blocks")
+    print(f"  {report['source']} -> {report['target']}")
+    print(f"  last hash: {report['last_hash']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,755 @@
+# ============================================================
+# FBC DIGITAL SYSTEMS
+# Project III – Security Ledger
+# File: ledger_storage.py
+#
+# DESCRIPTION:
+# Storage engines backing the immutable ledgers.
+# - Legacy single JSON document (full rewrite per append)
+# - Append-only JSON-lines segment with a cached tail
+#   (constant-time appends at any ledger size)
+# - SQLite (WAL) table with indexed project/node/time columns
+#   and persisted Merkle subtree hashes
+#
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ============================================================
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+from .ledger_archive import iter_history
+from .ledger_index import TimeBound, _to_epoch
+from .ledger_merkle import MerkleTree, leaf_hash, node_hash
+
+# ============================================================
+# STORAGE CONSTANTS
+# ============================================================
+STORAGE_JSON = "json"
+STORAGE_JSONL = "jsonl"
+STORAGE_SQLITE = "sqlite"
+
+DEFAULT_STORAGE = os.getenv("FBC_LEDGER_STORAGE", STORAGE_JSONL)
+
+_TAIL_CHUNK_BYTES = 4096
+_STREAM_CHUNK_BYTES = 1 << 16
+_ARRAY_SEPARATOR = re.compile(r"[\s,]*")
+_SQLITE_BATCH_ROWS = 10_000
+_SQLITE_MAX_PARAMS = 900
+
+
+# ============================================================
+# LEGACY JSON-ARRAY STORAGE
+# ============================================================
+class JsonArrayLedgerStorage:
+    """
+    Legacy storage: the whole chain as one JSON array.
+
+    Every append re-reads and atomically rewrites the file,
+    so cost grows linearly with ledger size.
+    """
+
+    kind = STORAGE_JSON
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def initialize(self, genesis: Dict[str, Any]) -> None:
+        self._atomic_save([genesis])
+
+    def import_blocks(self, blocks: Iterable[Dict[str, Any]]) -> None:
+        self._atomic_save(list(blocks))
+
+    def last_block(self) -> Dict[str, Any]:
+        return self.load_all()[-1]
+
+    def append(self, blocks: List[Dict[str, Any]]) -> List[int]:
+        """Appends blocks and returns their cursors."""
+        ledger = self.load_all()
+        start = len(ledger)
+        ledger.extend(blocks)
+        self._atomic_save(ledger)
+        return list(range(start, len(ledger)))
+
+    def end_cursor(self) -> int:
+        return sum(1 for _ in self.iter_blocks())
+
+    def read_many(self, cursors: Iterable[int]) -> List[Dict[str, Any]]:
+        ledger = self.load_all()
+        return [ledger[cursor] for cursor in cursors]
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def iter_blocks(self) -> Iterator[Dict[str, Any]]:
+        """
+        Streams blocks with an incremental decoder, holding one
+        read chunk and one block in memory at a time.
+        """
+        decoder = json.JSONDecoder()
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            buffer = f.read(_STREAM_CHUNK_BYTES)
+            position = _ARRAY_SEPARATOR.match(buffer).end()
+            if buffer[position: position + 1] != "[":
+                raise ValueError(f"Ledger is not a JSON array: {self.path}")
+            position += 1
+            eof = False
+
+            while True:
+                position = _ARRAY_SEPARATOR.match(buffer, position).end()
+
+                if buffer.startswith("]", position):
+                    return
+
+                try:
+                    block, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    # Block straddles the chunk boundary: drop the
+                    # consumed prefix and read on
+                    chunk = f.read(_STREAM_CHUNK_BYTES)
+                    eof = not chunk
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                    continue
+
+                yield block
+
+    def scan(
+        self,
+        cursor: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yields (cursor, block) for blocks in [cursor, end).
+        Cursors are list positions.
+        """
+        for position, block in enumerate(self.iter_blocks()):
+            if end is not None and position >= end:
+                break
+            if position >= cursor:
+                yield position, block
+
+    def partition(self, cursor: int, parts: int) -> List[Tuple[int, int]]:
+        """Splits [cursor, end of ledger) into contiguous ranges."""
+        total = self.end_cursor()
+        step = max(1, -(-(total - cursor) // max(parts, 1)))
+        return [
+            (start, min(start + step, total))
+            for start in range(cursor, total, step)
+        ]
+
+    def _atomic_save(self, ledger: List[Dict[str, Any]]) -> None:
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=self.path.parent,
+            delete=False,
+        ) as tmp:
+            json.dump(ledger, tmp, indent=2)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+            tmp_name = tmp.name
+
+        os.replace(tmp_name, self.path)
+
+
+# ============================================================
+# APPEND-ONLY JSON-LINES STORAGE
+# ============================================================
+class JsonLinesLedgerStorage:
+    """
+    Append-only storage: one block per line.
+
+    Guarantees:
+    - O(1) append (no re-read, no rewrite)
+    - O(1) tail lookup (seek from end, cached by file size)
+    - Torn trailing writes are discarded before the next append
+    """
+
+    kind = STORAGE_JSONL
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        # ((inode, size), last block) — valid while the segment file
+        # is neither replaced (rotation) nor grown by another writer
+        self._tail_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+    def exists(self) -> bool:
+        return self.path.exists() and self.path.stat().st_size > 0
+
+    def initialize(self, genesis: Dict[str, Any]) -> None:
+        self.import_blocks([genesis])
+
+    def import_blocks(self, blocks: Iterable[Dict[str, Any]]) -> None:
+        """
+        Writes a complete chain into a fresh segment (used for
+        genesis and one-time migration from the legacy format).
+        """
+        with tempfile.NamedTemporaryFile(
+            mode="wb",
+            dir=self.path.parent,
+            delete=False,
+        ) as tmp:
+            for block in blocks:
+                tmp.write(self._encode(block))
+            tmp.flush()
+            os.fsync(tmp.fileno())
+            tmp_name = tmp.name
+
+        os.replace(tmp_name, self.path)
+        self._tail_cache = None
+
+    # --------------------------------------------------------
+    # TAIL
+    # --------------------------------------------------------
+    def _stamp(self) -> Tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_ino, stat.st_size
+
+    def last_block(self) -> Dict[str, Any]:
+        stamp = self._stamp()
+
+        if self._tail_cache is not None and self._tail_cache[0] == stamp:
+            return self._tail_cache[1]
+
+        end, block = self._read_tail()
+        if end == stamp[1]:
+            self._tail_cache = (stamp, block)
+
+        return block
+
+    def _read_tail(self) -> Tuple[int, Dict[str, Any]]:
+        """
+        Returns (end offset of the last complete line, last block).
+        Reads backwards from the end of the file in fixed chunks.
+        """
+        with open(self.path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            buffer = b""
+
+            while position > 0:
+                step = min(_TAIL_CHUNK_BYTES, position)
+                position -= step
+                f.seek(position)
+                buffer = f.read(step) + buffer
+
+                # Drop an unterminated (torn) trailing fragment
+                complete = buffer[: buffer.rfind(b"\n") + 1]
+                lines = complete.splitlines()
+
+                if len(lines) >= 2 or (position == 0 and lines):
+                    end = position + len(complete)
+                    return end, json.loads(lines[-1])
+
+        raise ValueError(f"Ledger segment contains no blocks: {self.path}")
+
+    # --------------------------------------------------------
+    # APPEND
+    # --------------------------------------------------------
+    def append(self, blocks: List[Dict[str, Any]]) -> List[int]:
+        """Appends blocks and returns their cursors."""
+        if not blocks:
+            return []
+
+        lines = [self._encode(block) for block in blocks]
+
+        with open(self.path, "r+b") as f:
+            inode = os.fstat(f.fileno()).st_ino
+            size = f.seek(0, os.SEEK_END)
+
+            if self._tail_cache is None or self._tail_cache[0] != (inode, size):
+                end, _ = self._read_tail()
+                if end != size:
+                    # Repair a torn write left by a crashed appender
+                    f.truncate(end)
+                    size = f.seek(end)
+
+            f.write(b"".join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+            end = f.tell()
+
+        self._tail_cache = ((inode, end), blocks[-1])
+
+        cursors = []
+        for line in lines:
+            cursors.append(size)
+            size += len(line)
+        return cursors
+
+    def end_cursor(self) -> int:
+        """Offset just past the last complete line."""
+        stamp = self._stamp()
+        if self._tail_cache is not None and self._tail_cache[0] == stamp:
+            return stamp[1]
+        return self._read_tail()[0]
+
+    def read_many(self, cursors: Iterable[int]) -> List[Dict[str, Any]]:
+        """Reads only the blocks at `cursors` (one seek per block)."""
+        blocks = []
+        with open(self.path, "rb") as f:
+            for cursor in cursors:
+                f.seek(cursor)
+                blocks.append(json.loads(f.readline()))
+        return blocks
+
+    # --------------------------------------------------------
+    # READ
+    # --------------------------------------------------------
+    def load_all(self) -> List[Dict[str, Any]]:
+        return list(self.iter_blocks())
+
+    def iter_blocks(self) -> Iterator[Dict[str, Any]]:
+        for _, block in self.scan():
+            yield block
+
+    def scan(
+        self,
+        cursor: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yields (cursor, block) for lines starting in [cursor, end).
+        Cursors are byte offsets of the start of each line.
+        """
+        with open(self.path, "rb") as f:
+            f.seek(cursor)
+            for line in f:
+                if end is not None and cursor >= end:
+                    break
+                if not line.endswith(b"\n"):
+                    break  # torn trailing write — not part of the chain
+                yield cursor, json.loads(line)
+                cursor += len(line)
+
+    def partition(self, cursor: int, parts: int) -> List[Tuple[int, int]]:
+        """
+        Splits [cursor, end of segment) into contiguous byte ranges
+        whose boundaries fall on line starts.
+        """
+        size = self.path.stat().st_size
+        step = max(1, (size - cursor) // max(parts, 1))
+        boundaries = [cursor]
+
+        with open(self.path, "rb") as f:
+            for k in range(1, parts):
+                f.seek(max(cursor + k * step, boundaries[-1]))
+                f.readline()  # advance to the next line start
+                boundary = f.tell()
+                if boundary >= size:
+                    break
+                if boundary > boundaries[-1]:
+                    boundaries.append(boundary)
+
+        boundaries.append(size)
+        return list(zip(boundaries[:-1], boundaries[1:]))
+
+    @staticmethod
+    def _encode(block: Dict[str, Any]) -> bytes:
+        return (json.dumps(block, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+# ============================================================
+# SQLITE (WAL) STORAGE
+# ============================================================
+class SQLiteLedgerStorage:
+    """
+    Ledger as a SQLite table in WAL mode, one row per block.
+
+    - Transactional appends (a group commit is one transaction)
+    - B-tree indexes on project_id, node and timestamp, so
+      lookups never touch non-matching blocks
+    - Blocks are stored verbatim as compact JSON and streamed
+      back in ledger order for verification
+    - Every complete Merkle subtree hash is written in the
+      same transaction as its blocks, so heads and inclusion
+      proofs read O(log n) rows instead of rebuilding the
+      tree in each process
+
+    Cursors are ledger positions (the row's primary key), which
+    are also the Merkle leaf indexes.
+    """
+
+    kind = STORAGE_SQLITE
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS blocks (
+            position   INTEGER PRIMARY KEY,
+            project_id TEXT,
+            node       TEXT,
+            ts         REAL,
+            body       TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS blocks_project ON blocks (project_id, position)",
+        "CREATE INDEX IF NOT EXISTS blocks_node ON blocks (node, position)",
+        "CREATE INDEX IF NOT EXISTS blocks_ts ON blocks (ts)",
+        """
+        CREATE TABLE IF NOT EXISTS merkle (
+            height INTEGER,
+            idx    INTEGER,
+            hash   BLOB NOT NULL,
+            PRIMARY KEY (height, idx)
+        ) WITHOUT ROWID
+        """,
+    )
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._local = threading.local()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections are per thread and never cross processes
+        return {"path": self.path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["path"])
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+            self._local.conn = conn
+        return conn
+
+    def exists(self) -> bool:
+        if not self.path.exists():
+            return False
+        row = self._connection().execute("SELECT 1 FROM blocks LIMIT 1").fetchone()
+        return row is not None
+
+    def initialize(self, genesis: Dict[str, Any]) -> None:
+        self.import_blocks([genesis])
+
+    def import_blocks(self, blocks: Iterable[Dict[str, Any]]) -> None:
+        """
+        Replaces the table with a complete chain in one
+        transaction, streaming rows in fixed-size batches.
+        """
+        conn = self._connection()
+        blocks = iter(blocks)
+        start = 0
+
+        with self._transaction(conn):
+            conn.execute("DELETE FROM blocks")
+            conn.execute("DELETE FROM merkle")
+            while True:
+                batch = list(islice(blocks, _SQLITE_BATCH_ROWS))
+                if not batch:
+                    break
+                self._insert(conn, start, batch)
+                start += len(batch)
+
+    # --------------------------------------------------------
+    # TAIL & APPEND
+    # --------------------------------------------------------
+    def last_block(self) -> Dict[str, Any]:
+        row = self._connection().execute(
+            "SELECT body FROM blocks ORDER BY position DESC LIMIT 1"
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Ledger table contains no blocks: {self.path}")
+        return json.loads(row[0])
+
+    def append(self, blocks: List[Dict[str, Any]]) -> List[int]:
+        """Appends blocks in one transaction and returns their cursors."""
+        if not blocks:
+            return []
+
+        conn = self._connection()
+        with self._transaction(conn):
+            start = self._end(conn)
+            self._insert(conn, start, blocks)
+
+        return list(range(start, start + len(blocks)))
+
+    def end_cursor(self) -> int:
+        return self._end(self._connection())
+
+    # --------------------------------------------------------
+    # MERKLE TREE
+    # --------------------------------------------------------
+    def merkle_tree(self) -> MerkleTree:
+        """
+        Read-only view of the ledger's Merkle tree at its
+        current size, backed by the persisted subtree hashes.
+        Tables written before those hashes existed are
+        backfilled once.
+        """
+        conn = self._connection()
+        end = self._end(conn)
+
+        if self._leaf_count(conn) < end:
+            with self._transaction(conn):
+                start = self._leaf_count(conn)
+                rows = conn.execute(
+                    "SELECT body FROM blocks WHERE position >= ? ORDER BY position",
+                    (start,),
+                )
+                while True:
+                    batch = rows.fetchmany(_SQLITE_BATCH_ROWS)
+                    if not batch:
+                        break
+                    self._insert_nodes(
+                        conn, start, [leaf_hash(json.loads(body)) for body, in batch]
+                    )
+                    start += len(batch)
+                end = self._end(conn)
+
+        return _SQLiteMerkleTree(conn, end)
+
+    # --------------------------------------------------------
+    # READ
+    # --------------------------------------------------------
+    def read_many(self, cursors: Iterable[int]) -> List[Dict[str, Any]]:
+        cursors = list(cursors)
+        conn = self._connection()
+        bodies: Dict[int, str] = {}
+
+        for k in range(0, len(cursors), _SQLITE_MAX_PARAMS):
+            chunk = cursors[k: k + _SQLITE_MAX_PARAMS]
+            marks = ",".join("?" * len(chunk))
+            bodies.update(conn.execute(
+                f"SELECT position, body FROM blocks WHERE position IN ({marks})",
+                chunk,
+            ))
+
+        return [json.loads(bodies[cursor]) for cursor in cursors]
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        return list(self.iter_blocks())
+
+    def iter_blocks(self) -> Iterator[Dict[str, Any]]:
+        for _, block in self.scan():
+            yield block
+
+    def scan(
+        self,
+        cursor: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Streams (cursor, block) for positions in [cursor, end),
+        without materializing the result set.
+        """
+        if not isinstance(cursor, int):
+            raise ValueError(f"Invalid SQLite ledger cursor: {cursor!r}")
+
+        if end is None:
+            rows = self._connection().execute(
+                "SELECT position, body FROM blocks "
+                "WHERE position >= ? ORDER BY position",
+                (cursor,),
+            )
+        else:
+            rows = self._connection().execute(
+                "SELECT position, body FROM blocks "
+                "WHERE position >= ? AND position < ? ORDER BY position",
+                (cursor, end),
+            )
+
+        for position, body in rows:
+            yield position, json.loads(body)
+
+    def partition(self, cursor: int, parts: int) -> List[Tuple[int, int]]:
+        """Splits [cursor, end of ledger) into contiguous ranges."""
+        total = self.end_cursor()
+        step = max(1, -(-(total - cursor) // max(parts, 1)))
+        return [
+            (start, min(start + step, total))
+            for start in range(cursor, total, step)
+        ]
+
+    def find(
+        self,
+        project_id: Optional[str] = None,
+        node: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+    ) -> List[Dict[str, Any]]:
+        """Indexed lookup answered directly by SQLite."""
+        clauses, params = [], []
+
+        if project_id is not None:
+            clauses.append("project_id = ?")
+            params.append(project_id)
+        if node is not None:
+            clauses.append("node = ?")
+            params.append(node)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(_to_epoch(since))
+        if until is not None:
+            clauses.append("ts <= ?")
+            params.append(_to_epoch(until))
+
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        rows = self._connection().execute(
+            f"SELECT body FROM blocks {where}ORDER BY position", params
+        )
+        return [json.loads(body) for body, in rows]
+
+    # --------------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------------
+    @staticmethod
+    def _end(conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT MAX(position) FROM blocks").fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    @staticmethod
+    def _leaf_count(conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT MAX(idx) FROM merkle WHERE height = 0").fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    @classmethod
+    def _insert(
+        cls,
+        conn: sqlite3.Connection,
+        start: int,
+        blocks: List[Dict[str, Any]],
+    ) -> None:
+        conn.executemany(
+            "INSERT INTO blocks VALUES (?, ?, ?, ?, ?)",
+            [cls._row(start + k, b) for k, b in enumerate(blocks)],
+        )
+        cls._insert_nodes(conn, start, [leaf_hash(b) for b in blocks])
+
+    @staticmethod
+    def _insert_nodes(
+        conn: sqlite3.Connection,
+        start: int,
+        leaves: List[bytes],
+    ) -> None:
+        """
+        Stores leaves [start, start + len(leaves)) and every
+        subtree they complete, level by level. A left sibling
+        written by an earlier transaction is read back.
+        """
+        height, first, nodes = 0, start, leaves
+
+        while nodes:
+            conn.executemany(
+                "INSERT INTO merkle VALUES (?, ?, ?)",
+                [(height, first + k, node) for k, node in enumerate(nodes)],
+            )
+
+            lo = first & ~1
+            parents = []
+            for i in range(lo, first + len(nodes) - 1, 2):
+                if i < first:
+                    left = conn.execute(
+                        "SELECT hash FROM merkle WHERE height = ? AND idx = ?",
+                        (height, i),
+                    ).fetchone()[0]
+                else:
+                    left = nodes[i - first]
+                parents.append(node_hash(left, nodes[i + 1 - first]))
+
+            height, first, nodes = height + 1, lo // 2, parents
+
+    @staticmethod
+    @contextmanager
+    def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _row(position: int, block: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (
+            position,
+            block.get("project_id"),
+            block.get("node"),
+            _to_epoch(block["timestamp"]),
+            json.dumps(block, separators=(",", ":")),
+        )
+
+
+class _SQLiteMerkleTree(MerkleTree):
+    """MerkleTree view over the persisted subtree hashes."""
+
+    def __init__(self, conn: sqlite3.Connection, size: int) -> None:
+        self._conn = conn
+        self._size = size
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def append(self, block: Dict[str, Any]) -> None:
+        raise TypeError("SQLite Merkle trees grow with SQLiteLedgerStorage.append")
+
+    def _node(self, height: int, index: int) -> bytes:
+        return bytes(self._conn.execute(
+            "SELECT hash FROM merkle WHERE height = ? AND idx = ?",
+            (height, index),
+        ).fetchone()[0])
+
+
+# ============================================================
+# FACTORY
+# ============================================================
+def open_ledger_storage(
+    root: Path,
+    stem: str,
+    kind: Optional[str] = None,
+):
+    """
+    Resolves the storage engine for a ledger named `stem`
+    under `root`.
+
+    Append-only mode transparently imports an existing legacy
+    `<stem>.json` ledger on first use; SQLite mode imports the
+    jsonl ledger (sealed archives in order, then the active
+    segment) or the legacy file the same way.
+    """
+    kind = kind or DEFAULT_STORAGE
+    legacy = JsonArrayLedgerStorage(root / f"{stem}.json")
+
+    if kind == STORAGE_JSON:
+        return legacy
+
+    segment = JsonLinesLedgerStorage(root / f"{stem}.jsonl")
+
+    if kind == STORAGE_JSONL:
+        if not segment.exists() and legacy.exists():
+            segment.import_blocks(legacy.iter_blocks())
+        return segment
+
+    if kind == STORAGE_SQLITE:
+        storage = SQLiteLedgerStorage(root / f"{stem}.db")
+        if not storage.exists():
+            for source in (segment, legacy):
+                if source.exists():
+                    storage.import_blocks(iter_history(source))
+                    break
+        return storage
+
+    raise ValueError(f"Unsupported ledger storage: {kind}")
@@ -0,0 +1,377 @@
+# ============================================================
+# FBC DIGITAL SYSTEMS
+# Project III – Security Ledger
+# File: ledger_verify.py
+#
+# DESCRIPTION:
+# Shared chain verification for the sector and global
+# ledgers, with HMAC-signed checkpoints so routine audits
+# only re-verify blocks appended since the last pass, and
+# HMAC-signed Merkle tree heads for the active segment.
+#
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ============================================================
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+# ============================================================
+# VERIFICATION CONSTANTS
+# ============================================================
+CHECKPOINT_SCHEMA_VERSION = "LEDGER-CHECKPOINT-v1"
+TREE_HEAD_SCHEMA_VERSION = "LEDGER-TREE-HEAD-v1"
+
+GENESIS_PREVIOUS_HASH = "0" * 64
+
+_UNHASHED_FIELDS = frozenset({"audit_hash", "status"})
+
+
+# ============================================================
+# HASHING
+# ============================================================
+def canonical_hash(payload: Dict[str, Any], secret: str) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256((canonical + secret).encode("utf-8")).hexdigest()
+
+
+def block_hash(block: Dict[str, Any], secret: str) -> str:
+    """Recomputes a stored block's audit hash."""
+    return canonical_hash(
+        {k: v for k, v in block.items() if k not in _UNHASHED_FIELDS},
+        secret,
+    )
+
+
+# ============================================================
+# CHAIN SCAN
+# ============================================================
+@dataclass(frozen=True)
+class ChainScan:
+    failure: Optional[Dict[str, Any]]
+    blocks: int
+    last_cursor: Any
+    last_block: Dict[str, Any]
+
+
+def verify_chain(
+    entries: Iterator[Tuple[Any, Dict[str, Any]]],
+    secret: str,
+    anchor: Tuple[Any, Dict[str, Any]],
+    position: int,
+) -> ChainScan:
+    """
+    Verifies every (cursor, block) in `entries` against its
+    predecessor, starting from the trusted `anchor` at
+    ledger `position`.
+
+    The anchor itself is not re-hashed (the genesis block
+    never was). Failures report the ledger position of the
+    first bad block.
+    """
+    last_cursor, previous = anchor
+
+    for cursor, current in entries:
+        position += 1
+
+        if block_hash(current, secret) != current["audit_hash"]:
+            return ChainScan(
+                {"status": "TAMPER_DETECTED", "block_index": position},
+                position, last_cursor, previous,
+            )
+
+        if current["previous_hash"] != previous["audit_hash"]:
+            return ChainScan(
+                {"status": "CHAIN_BROKEN", "block_index": position},
+                position, last_cursor, previous,
+            )
+
+        last_cursor, previous = cursor, current
+
+    return ChainScan(None, position + 1, last_cursor, previous)
+
+
+# ============================================================
+# PARALLEL CHUNKED SCAN
+# ============================================================
+@dataclass(frozen=True)
+class ChunkScan:
+    blocks: int
+    first_previous_hash: Optional[str]
+    failure: Optional[Tuple[str, int]]
+    last_cursor: Any
+    last_block: Optional[Dict[str, Any]]
+
+
+def _verify_chunk(
+    storage,
+    start: Any,
+    end: Any,
+    secret: str,
+    trust_first: bool,
+) -> ChunkScan:
+    """
+    Process-pool worker: re-hashes every block in [start, end)
+    and checks linkage inside the chunk. Linkage into the
+    chunk's first block is checked by the caller.
+    """
+    count = 0
+    first_previous_hash = None
+    previous = None
+    last_cursor = None
+
+    for cursor, current in storage.scan(start, end):
+        if count == 0:
+            first_previous_hash = current.get("previous_hash")
+
+        if not (trust_first and count == 0):
+            if block_hash(current, secret) != current["audit_hash"]:
+                return ChunkScan(
+                    count, first_previous_hash,
+                    ("TAMPER_DETECTED", count), last_cursor, None,
+                )
+
+        if (
+            previous is not None
+            and current["previous_hash"] != previous["audit_hash"]
+        ):
+            return ChunkScan(
+                count, first_previous_hash,
+                ("CHAIN_BROKEN", count), last_cursor, None,
+            )
+
+        previous = {"index": current["index"], "audit_hash": current["audit_hash"]}
+        last_cursor = cursor
+        count += 1
+
+    return ChunkScan(count, first_previous_hash, None, last_cursor, previous)
+
+
+def verify_chain_parallel(
+    storage,
+    secret: str,
+    anchor_cursor: Any,
+    position: int,
+    workers: int,
+) -> ChainScan:
+    """
+    Parallel equivalent of verify_chain over the range starting
+    at the trusted anchor block. The storage is split into
+    contiguous chunks hashed in a process pool; chunk boundary
+    linkage is checked here, in ledger order, so the reported
+    block_index matches a sequential scan.
+    """
+    ranges = storage.partition(anchor_cursor, workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks: List[ChunkScan] = list(pool.map(
+            _verify_chunk,
+            [storage] * len(ranges),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+            [secret] * len(ranges),
+            [k == 0 for k in range(len(ranges))],
+        ))
+
+    previous = None
+    last_cursor = None
+
+    for chunk in chunks:
+        if chunk.blocks == 0 and chunk.failure is None:
+            continue
+
+        tampered_first = chunk.failure is not None and chunk.failure[1] == 0
+        if (
+            previous is not None
+            and not tampered_first
+            and chunk.first_previous_hash != previous["audit_hash"]
+        ):
+            return ChainScan(
+                {"status": "CHAIN_BROKEN", "block_index": position},
+                position, last_cursor, previous,
+            )
+
+        if chunk.failure is not None:
+            status, offset = chunk.failure
+            return ChainScan(
+                {"status": status, "block_index": position + offset},
+                position + offset, last_cursor, previous,
+            )
+
+        position += chunk.blocks
+        previous = chunk.last_block
+        last_cursor = chunk.last_cursor
+
+    return ChainScan(None, position, last_cursor, previous)
+
+
+# ============================================================
+# SIGNED CHECKPOINTS
+# ============================================================
+class LedgerCheckpoint:
+    """
+    HMAC-signed record of the last verified block.
+
+    A checkpoint whose signature does not match (edited,
+    truncated, or written under another secret) is ignored.
+    """
+
+    def __init__(self, ledger_path: Path, secret: str) -> None:
+        self.path = ledger_path.with_name(ledger_path.name + ".checkpoint")
+        self._key = secret.encode("utf-8")
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(checkpoint, dict):
+            return None
+
+        signature = checkpoint.pop("signature", "")
+        if not hmac.compare_digest(signature, self._sign(checkpoint)):
+            return None
+
+        return checkpoint
+
+    def save(self, position: int, cursor: Any, block: Dict[str, Any]) -> None:
+        checkpoint = {
+            "schema": CHECKPOINT_SCHEMA_VERSION,
+            "position": position,
+            "cursor": cursor,
+            "index": block["index"],
+            "audit_hash": block["audit_hash"],
+            "verified_at": datetime.now(timezone.utc).isoformat(
+                timespec="seconds"
+            ),
+        }
+        checkpoint["signature"] = self._sign(checkpoint)
+
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=self.path.parent,
+            delete=False,
+        ) as tmp:
+            json.dump(checkpoint, tmp)
+            tmp_name = tmp.name
+
+        os.replace(tmp_name, self.path)
+
+    def _sign(self, checkpoint: Dict[str, Any]) -> str:
+        return _signature(checkpoint, self._key)
+
+
+def _signature(payload: Dict[str, Any], key: bytes) -> str:
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hmac.new(key, raw.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+# ============================================================
+# SIGNED TREE HEADS
+# ============================================================
+def sign_tree_head(head: Dict[str, Any], secret: str) -> Dict[str, Any]:
+    """
+    HMAC-signs an active-segment head (first_index, tree_size,
+    root). Inclusion proofs for the live segment are checked
+    against a signed head rather than a root shipped with them.
+    """
+    signed = dict(
+        head,
+        schema=TREE_HEAD_SCHEMA_VERSION,
+        signed_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    )
+    signed["signature"] = _signature(signed, secret.encode("utf-8"))
+    return signed
+
+
+def verify_tree_head(head: Dict[str, Any], secret: str) -> bool:
+    """True when `head` was signed by sign_tree_head under `secret`."""
+    if not isinstance(head, dict) or head.get("schema") != TREE_HEAD_SCHEMA_VERSION:
+        return False
+
+    unsigned = {k: v for k, v in head.items() if k != "signature"}
+    return hmac.compare_digest(
+        str(head.get("signature", "")), _signature(unsigned, secret.encode("utf-8"))
+    )
+
+
+# ============================================================
+# LEDGER VERIFICATION
+# ============================================================
+def verify_ledger(
+    storage,
+    secret: str,
+    checkpoint: LedgerCheckpoint,
+    full: bool = False,
+    workers: int = 1,
+) -> Tuple[Optional[Dict[str, Any]], int]:
+    """
+    Verifies `storage` and returns (failure or None, blocks).
+
+    Incremental by default: resumes after the signed checkpoint
+    when the checkpointed block is still in place, otherwise
+    (or with full=True) scans from genesis. The checkpoint
+    advances only after a clean pass.
+
+    workers > 1 hashes the range in a process pool.
+    """
+    anchor = None
+    position = 0
+    saved = None if full else checkpoint.load()
+
+    if saved is not None:
+        try:
+            anchor = next(storage.scan(saved["cursor"]), None)
+        except ValueError:
+            anchor = None  # cursor no longer on a block boundary
+
+        if (
+            anchor is None
+            or not isinstance(anchor[1], dict)
+            or anchor[1].get("index") != saved["index"]
+            or anchor[1].get("audit_hash") != saved["audit_hash"]
+        ):
+            anchor = None
+        else:
+            position = saved["position"]
+
+    if anchor is None:
+        saved = None
+        anchor = next(storage.scan())
+        head = anchor[1]
+
+        # A rotated segment starts at its seal block, which is
+        # verified like any other; genesis never was hashed
+        if head["previous_hash"] != GENESIS_PREVIOUS_HASH:
+            position = head["index"]
+            if block_hash(head, secret) != head["audit_hash"]:
+                return {"status": "TAMPER_DETECTED", "block_index": position}, position
+
+    if workers > 1:
+        scan = verify_chain_parallel(
+            storage, secret, anchor[0], position, workers
+        )
+    else:
+        entries = storage.scan(anchor[0])
+        next(entries)
+        scan = verify_chain(entries, secret, anchor, position)
+
+    if scan.failure is not None:
+        return scan.failure, scan.blocks
+
+    if saved is None or saved["position"] != scan.blocks - 1:
+        checkpoint.save(scan.blocks - 1, scan.last_cursor, scan.last_block)
+
+    return None, scan.blocks
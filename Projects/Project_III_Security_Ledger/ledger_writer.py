@@ -0,0 +1,249 @@
+# ============================================================
+# FBC DIGITAL SYSTEMS
+# Project III – Security Ledger
+# File: ledger_writer.py
+#
+# DESCRIPTION:
+# Single-writer subsystem for the immutable ledgers.
+# - Cross-process file lock around every read-tail/append
+# - Dedicated writer thread with group commit
+# - Bounded queue with back-pressure metrics
+#
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ============================================================
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# ============================================================
+# WRITER CONSTANTS
+# ============================================================
+DEFAULT_QUEUE_CAPACITY = int(os.getenv("FBC_LEDGER_QUEUE_CAPACITY", 10_000))
+DEFAULT_MAX_GROUP_BLOCKS = int(os.getenv("FBC_LEDGER_MAX_GROUP_BLOCKS", 5_000))
+DEFAULT_SUBMIT_TIMEOUT = float(os.getenv("FBC_LEDGER_SUBMIT_TIMEOUT", 30.0))
+
+
+# ============================================================
+# EXCEPTIONS
+# ============================================================
+class LedgerBackpressureError(RuntimeError):
+    """Raised when the writer queue stays full past the submit timeout."""
+
+
+# ============================================================
+# CROSS-PROCESS FILE LOCK
+# ============================================================
+class LedgerFileLock:
+    """
+    Exclusive advisory lock on `<ledger>.lock`, shared by every
+    process (uvicorn workers, batch jobs) writing the ledger.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._fd: Optional[int] = None
+
+    def __enter__(self) -> "LedgerFileLock":
+        self._thread_lock.acquire()
+        try:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            self._fd = fd
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        fd, self._fd = self._fd, None
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+            self._thread_lock.release()
+
+
+# ============================================================
+# GROUP-COMMIT WRITER
+# ============================================================
+class LedgerWriter:
+    """
+    Serializes all appends of one vault through a writer thread.
+
+    Each submitted batch is queued; the writer drains whatever
+    is waiting (up to `max_group_blocks`), takes the file lock,
+    chains the whole group against the on-disk tail and commits
+    it with a single durable append. Callers block until their
+    own blocks are committed. `on_commit(cursors, blocks)` runs
+    under the lock after each append.
+    """
+
+    def __init__(
+        self,
+        storage,
+        lock: LedgerFileLock,
+        chain: Callable[[Dict[str, Any], List[Any]], List[Dict[str, Any]]],
+        on_commit: Optional[Callable[[List[Any], List[Dict[str, Any]]], None]] = None,
+        queue_capacity: int = DEFAULT_QUEUE_CAPACITY,
+        max_group_blocks: int = DEFAULT_MAX_GROUP_BLOCKS,
+        submit_timeout: float = DEFAULT_SUBMIT_TIMEOUT,
+    ) -> None:
+        self._storage = storage
+        self._lock = lock
+        self._chain = chain
+        self._on_commit = on_commit
+        self._max_group_blocks = max_group_blocks
+        self._submit_timeout = submit_timeout
+
+        self._queue: "queue.Queue[Tuple[List[Any], Future, float]]" = (
+            queue.Queue(maxsize=queue_capacity)
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "submitted_batches": 0,
+            "rejected_batches": 0,
+            "committed_groups": 0,
+            "committed_blocks": 0,
+            "max_group_blocks": 0,
+            "max_queue_depth": 0,
+            "total_wait_ms": 0.0,
+            "total_lock_wait_ms": 0.0,
+            "total_commit_ms": 0.0,
+        }
+
+    # --------------------------------------------------------
+    # PUBLIC
+    # --------------------------------------------------------
+    def submit(self, records: List[Any]) -> List[Dict[str, Any]]:
+        self._ensure_started()
+        future: Future = Future()
+
+        try:
+            self._queue.put(
+                (records, future, time.perf_counter()),
+                timeout=self._submit_timeout,
+            )
+        except queue.Full:
+            with self._stats_lock:
+                self._stats["rejected_batches"] += 1
+            raise LedgerBackpressureError(
+                "Ledger writer queue is full; retry later"
+            ) from None
+
+        with self._stats_lock:
+            self._stats["submitted_batches"] += 1
+            self._stats["max_queue_depth"] = max(
+                self._stats["max_queue_depth"], self._queue.qsize()
+            )
+
+        return future.result()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        groups = stats["committed_groups"] or 1
+        blocks = stats["committed_blocks"] or 1
+
+        return {
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "max_queue_depth": stats["max_queue_depth"],
+            "submitted_batches": stats["submitted_batches"],
+            "rejected_batches": stats["rejected_batches"],
+            "committed_groups": stats["committed_groups"],
+            "committed_blocks": stats["committed_blocks"],
+            "avg_group_blocks": round(stats["committed_blocks"] / groups, 2),
+            "max_group_blocks": stats["max_group_blocks"],
+            "avg_wait_ms": round(stats["total_wait_ms"] / blocks, 3),
+            "avg_lock_wait_ms": round(stats["total_lock_wait_ms"] / groups, 3),
+            "avg_commit_ms": round(stats["total_commit_ms"] / groups, 3),
+        }
+
+    # --------------------------------------------------------
+    # WRITER THREAD
+    # --------------------------------------------------------
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="fbc-ledger-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            group = [self._queue.get()]
+            size = len(group[0][0])
+
+            while size < self._max_group_blocks:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                group.append(item)
+                size += len(item[0])
+
+            self._commit(group)
+
+    def _commit(self, group: List[Tuple[List[Any], Future, float]]) -> None:
+        records = [record for batch, _, _ in group for record in batch]
+
+        try:
+            lock_started = time.perf_counter()
+            with self._lock:
+                commit_started = time.perf_counter()
+                blocks = self._chain(self._storage.last_block(), records)
+                cursors = self._storage.append(blocks)
+                if self._on_commit is not None:
+                    self._on_commit(cursors, blocks)
+            committed = time.perf_counter()
+        except BaseException as exc:
+            for _, future, _ in group:
+                future.set_exception(exc)
+            return
+
+        offset = 0
+        wait_ms = 0.0
+        for batch, future, enqueued in group:
+            future.set_result(blocks[offset: offset + len(batch)])
+            offset += len(batch)
+            wait_ms += (committed - enqueued) * 1000 * len(batch)
+
+        with self._stats_lock:
+            stats = self._stats
+            stats["committed_groups"] += 1
+            stats["committed_blocks"] += len(blocks)
+            stats["max_group_blocks"] = max(stats["max_group_blocks"], len(blocks))
+            stats["total_wait_ms"] += wait_ms
+            stats["total_lock_wait_ms"] += (commit_started - lock_started) * 1000
+            stats["total_commit_ms"] += (committed - commit_started) * 1000
@@ -12,13 +12,28 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
 import os
-import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from .ledger_archive import (
+    DEFAULT_SEGMENT_BYTES,
+    LedgerSegments,
+    archived_inclusion_proof,
+    verify_archives,
+)
+from .ledger_index import LedgerIndex, TimeBound
+from .ledger_merkle import verify_inclusion as merkle_verify_inclusion
+from .ledger_storage import open_ledger_storage
+from .ledger_verify import (
+    LedgerCheckpoint,
+    canonical_hash,
+    sign_tree_head,
+    verify_ledger,
+    verify_tree_head,
+)
+from .ledger_writer import LedgerFileLock, LedgerWriter
 
 # ============================================================
 # ENTERPRISE CONSTANTS
@@ -38,19 +53,61 @@ class FBCSecureVault:
 
     Guarantees:
     - Deterministic hashing
-    - Atomic persistence
+    - Atomic / append-only persistence
     - Chain integrity
     - Backward-compatible public API
+
+    Storage:
+    - "jsonl" (default): append-only segment, O(1) proof generation
+    - "json": legacy single-document ledger (full rewrite per proof)
+    - "sqlite": WAL-mode table with indexed project/node/time columns
+
+    Rotation (jsonl):
+    - Past FBC_LEDGER_SEGMENT_BYTES the active segment is sealed
+      into `<stem>.segments/` and hot-path operations (appends,
+      incremental verification) only touch newer blocks; find
+      reaches sealed blocks through per-archive index sidecars
+
+    Concurrency:
+    - All appends go through one writer thread per vault
+      (group commit) under a cross-process file lock, so
+      several API workers can share one ledger.
     """
 
-    def __init__(self, base_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        base_path: Path | None = None,
+        storage: Optional[str] = None,
+    ) -> None:
         root = base_path or Path(__file__).resolve().parent
 
-        self._ledger_path = root / "fbc_sector_ledger.json"
+        self._lock = LedgerFileLock(root / "fbc_sector_ledger.lock")
         self._salt = os.getenv("FBC_SECRET", DEFAULT_SALT)
 
-        if not self._ledger_path.exists():
-            self._initialize_genesis()
+        with self._lock:
+            self._storage = open_ledger_storage(
+                root, "fbc_sector_ledger", storage
+            )
+            if not self._storage.exists():
+                self._initialize_genesis()
+
+        self._ledger_path = self._storage.path
+        self._checkpoint = LedgerCheckpoint(self._ledger_path, self._salt)
+        self._index = LedgerIndex(self._storage)
+        self._segments = LedgerSegments(
+            self._storage,
+            self._index,
+            self._lock,
+            self._chain_blocks,
+            self._canonical_hash,
+            DEFAULT_SEGMENT_BYTES,
+        )
+        self._writer = LedgerWriter(
+            self._storage,
+            self._lock,
+            self._chain_blocks,
+            on_commit=self._segments.after_commit,
+        )
 
     # --------------------------------------------------------
     # GENESIS
@@ -71,7 +128,7 @@ class FBCSecureVault:
         genesis["audit_hash"] = self._canonical_hash(genesis)
         genesis["status"] = "GENESIS"
 
-        self._atomic_save([genesis])
+        self._storage.initialize(genesis)
 
     # --------------------------------------------------------
     # TIME & HASHING
@@ -80,32 +137,14 @@ class FBCSecureVault:
     def _now() -> str:
         return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
-    @staticmethod
-    def _sha256(raw: str) -> str:
-        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
-
     def _canonical_hash(self, payload: Dict[str, Any]) -> str:
-        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-        return self._sha256(canonical + self._salt)
+        return canonical_hash(payload, self._salt)
 
     # --------------------------------------------------------
     # LEDGER IO
     # --------------------------------------------------------
     def _load_ledger(self) -> List[Dict[str, Any]]:
-        with open(self._ledger_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-
-    def _atomic_save(self, ledger: List[Dict[str, Any]]) -> None:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=self._ledger_path.parent,
-            delete=False,
-        ) as tmp:
-            json.dump(ledger, tmp, indent=2)
-            tmp_name = tmp.name
-
-        os.replace(tmp_name, self._ledger_path)
+        return self._storage.load_all()
 
     # --------------------------------------------------------
     # PUBLIC CONTRACT (LTS — DO NOT BREAK)
@@ -120,55 +159,172 @@ class FBCSecureVault:
         Stable public API.
         Signature frozen under Enterprise LTS.
         """
-        if amount < 0:
-            raise ValueError("Negative amounts are not permitted")
+        return self.generate_proofs([(project_id, node_id, amount)])[0]
 
-        ledger = self._load_ledger()
-        last = ledger[-1]
+    def generate_proofs(
+        self,
+        records: Iterable[Tuple[str, str, float]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Batched proof generation.
 
-        record = {
-            "index": last["index"] + 1,
-            "timestamp": self._now(),
-            "schema": LEDGER_SCHEMA_VERSION,
-            "project_id": project_id,
-            "node": node_id,
-            "amount": float(amount),
-            "protocol": PROTOCOL,
-            "previous_hash": last["audit_hash"],
-            "vault_version": VAULT_VERSION,
-        }
+        Chains every (project_id, node_id, amount) record in
+        memory and persists the whole batch with one durable
+        write. The batch is rejected as a unit if any amount
+        is negative. Concurrent batches may share one commit.
+        """
+        records = list(records)
+
+        for _, _, amount in records:
+            if amount < 0:
+                raise ValueError("Negative amounts are not permitted")
+
+        if not records:
+            return []
+
+        return self._writer.submit(records)
+
+    def find(
+        self,
+        project_id: Optional[str] = None,
+        node: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Indexed lookup of proofs by project, node and inclusive
+        time range (datetime or ISO-8601), in ledger order,
+        sealed segments included. Only matching blocks are read
+        from storage.
+        """
+        return self._segments.find(project_id, node, since, until)
+
+    def writer_metrics(self) -> Dict[str, Any]:
+        """Queue depth, group-commit and back-pressure counters."""
+        return self._writer.metrics()
+
+    def _chain_blocks(
+        self,
+        last: Dict[str, Any],
+        records: List[Tuple[str, str, float]],
+    ) -> List[Dict[str, Any]]:
+        """Chains records onto `last` (called under the ledger lock)."""
+        timestamp = self._now()
+        blocks: List[Dict[str, Any]] = []
+
+        for project_id, node_id, amount in records:
+            record = {
+                "index": last["index"] + 1,
+                "timestamp": timestamp,
+                "schema": LEDGER_SCHEMA_VERSION,
+                "project_id": project_id,
+                "node": node_id,
+                "amount": float(amount),
+                "protocol": PROTOCOL,
+                "previous_hash": last["audit_hash"],
+                "vault_version": VAULT_VERSION,
+            }
 
-        record["audit_hash"] = self._canonical_hash(record)
-        record["status"] = "IMMUTABLE_RECORD"
+            record["audit_hash"] = self._canonical_hash(record)
+            record["status"] = "IMMUTABLE_RECORD"
 
-        ledger.append(record)
-        self._atomic_save(ledger)
+            blocks.append(record)
+            last = record
 
-        return record
+        return blocks
 
     # --------------------------------------------------------
-    # VERIFICATION
+    # INCLUSION PROOFS
     # --------------------------------------------------------
-    def verify_sector_ledger(self) -> Dict[str, Any]:
-        ledger = self._load_ledger()
+    def tree_head(self) -> Dict[str, Any]:
+        """
+        Signed Merkle head (first_index, tree_size, root) of the
+        active segment; the trusted root for live proofs.
+        """
+        return sign_tree_head(self._index.head(), self._salt)
 
-        for i in range(1, len(ledger)):
-            current = ledger[i]
-            previous = ledger[i - 1]
+    def verify_tree_head(self, head: Dict[str, Any]) -> bool:
+        """True when `head` was signed by this ledger's secret."""
+        return verify_tree_head(head, self._salt)
 
-            recalculated = self._canonical_hash(
-                {k: current[k] for k in current if k not in {"audit_hash", "status"}}
-            )
+    def inclusion_proof(
+        self,
+        index: int,
+        tree_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        O(log n) audit path from block `index` to the Merkle
+        root of its segment, with the block itself under
+        "record". Live proofs target the active tree at
+        `tree_size` (pass a signed head's size) and carry no
+        root; archived proofs carry the sealed root.
+        """
+        found = self._index.prove(index, tree_size) or archived_inclusion_proof(
+            self._storage, index
+        )
+        if found is None:
+            raise ValueError(f"Unknown ledger index: {index}")
+
+        record, proof = found
+        return dict(proof, record=record)
+
+    @staticmethod
+    def verify_inclusion(
+        record: Dict[str, Any],
+        proof: Dict[str, Any],
+        root: str,
+    ) -> bool:
+        """
+        Offline check of an inclusion proof; needs no secret.
+        `root` is a verified tree_head()'s root or a seal's.
+        """
+        return merkle_verify_inclusion(record, proof, root)
+
+    # --------------------------------------------------------
+    # SEGMENT ROTATION
+    # --------------------------------------------------------
+    def seal_segment(self) -> Dict[str, Any]:
+        """
+        Archives the active segment (gzip) and starts a new one
+        headed by a chained seal block carrying the Merkle root
+        and archive digest of every sealed segment.
+        """
+        return self._segments.seal()
+
+    # --------------------------------------------------------
+    # VERIFICATION
+    # --------------------------------------------------------
+    def verify_sector_ledger(
+        self,
+        full: bool = False,
+        workers: int = 1,
+        archives: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Incremental by default: only blocks appended since the
+        last signed checkpoint are re-hashed.
+        full=True re-verifies the whole active segment and
+        checks sealed archives against their recorded digests.
+        archives=True also decompresses and re-verifies them.
+        workers > 1 splits the pass across a process pool.
+        """
+        failure, blocks = verify_ledger(
+            self._storage,
+            self._salt,
+            self._checkpoint,
+            full=full,
+            workers=workers,
+        )
 
-            if recalculated != current["audit_hash"]:
-                return {"status": "TAMPER_DETECTED", "block_index": i}
+        if failure is None and (full or archives):
+            failure = verify_archives(self._storage, self._salt, deep=archives)
 
-            if current["previous_hash"] != previous["audit_hash"]:
-                return {"status": "CHAIN_BROKEN", "block_index": i}
+        if failure is not None:
+            return failure
 
         return {
             "status": "LEDGER_VERIFIED",
-            "blocks": len(ledger),
+            "blocks": blocks,
             "vault_version": VAULT_VERSION,
             "schema_version": LEDGER_SCHEMA_VERSION,
         }
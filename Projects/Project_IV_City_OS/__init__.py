@@ -49,14 +49,16 @@ __all__ = [
 # IMPORT SAFETY ASSERTION (RUNTIME SAFE)
 # ------------------------------------------------------------
 def _verify_public_surface():
-    allowed = set(__all__)
-    exposed = set(globals().keys())
+    from types import ModuleType
 
-    illegal = exposed - allowed - {
-        "__name__", "__doc__", "__package__", "__loader__",
-        "__spec__", "__file__", "__builtins__"
+    allowed = set(__all__)
+    exposed = {
+        name for name, value in globals().items()
+        if not name.startswith("_") and not isinstance(value, ModuleType)
     }
 
+    illegal = exposed - allowed
+
     if illegal:
         raise RuntimeError(
             f"City OS package integrity violation. "
@@ -13,13 +13,62 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
 import os
-import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+try:
+    from Projects.Project_III_Security_Ledger.ledger_archive import (
+        DEFAULT_SEGMENT_BYTES,
+        LedgerSegments,
+        archived_inclusion_proof,
+        verify_archives,
+    )
+    from Projects.Project_III_Security_Ledger.ledger_index import (
+        LedgerIndex,
+        TimeBound,
+    )
+    from Projects.Project_III_Security_Ledger.ledger_merkle import (
+        verify_inclusion as merkle_verify_inclusion,
+    )
+    from Projects.Project_III_Security_Ledger.ledger_storage import (
+        open_ledger_storage,
+    )
+    from Projects.Project_III_Security_Ledger.ledger_verify import (
+        LedgerCheckpoint,
+        canonical_hash,
+        sign_tree_head,
+        verify_ledger,
+        verify_tree_head,
+    )
+    from Projects.Project_III_Security_Ledger.ledger_writer import (
+        LedgerFileLock,
+        LedgerWriter,
+    )
+except ImportError:
+    from Project_III_Security_Ledger.ledger_archive import (
+        DEFAULT_SEGMENT_BYTES,
+        LedgerSegments,
+        archived_inclusion_proof,
+        verify_archives,
+    )
+    from Project_III_Security_Ledger.ledger_index import LedgerIndex, TimeBound
+    from Project_III_Security_Ledger.ledger_merkle import (
+        verify_inclusion as merkle_verify_inclusion,
+    )
+    from Project_III_Security_Ledger.ledger_storage import open_ledger_storage
+    from Project_III_Security_Ledger.ledger_verify import (
+        LedgerCheckpoint,
+        canonical_hash,
+        sign_tree_head,
+        verify_ledger,
+        verify_tree_head,
+    )
+    from Project_III_Security_Ledger.ledger_writer import (
+        LedgerFileLock,
+        LedgerWriter,
+    )
 
 # ============================================================
 # GLOBAL CONSTANTS
@@ -37,21 +86,50 @@ class FBCSecureVault:
     """
     Global immutable ledger providing:
     - Deterministic hashing
-    - Atomic persistence
+    - Atomic / append-only persistence
     - Chain integrity guarantees
     - Long-term backward compatibility
+
+    Storage engines, segment rotation and the single-writer
+    subsystem are shared with the Project III sector ledger.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        base_path: Optional[Path] = None,
+        storage: Optional[str] = None,
+    ) -> None:
         self.ledger_id = "FBC-GLOBAL-LEDGER-001"
         self._pepper = os.getenv("FBC_GLOBAL_SECRET", DEFAULT_PEPPER)
 
-        self.ledger_file = (
-            Path(__file__).resolve().parent / "fbc_global_ledger.json"
+        root = base_path or Path(__file__).resolve().parent
+
+        self._lock = LedgerFileLock(root / "fbc_global_ledger.lock")
+
+        with self._lock:
+            self._storage = open_ledger_storage(
+                root, "fbc_global_ledger", storage
+            )
+            if not self._storage.exists():
+                self._initialize_genesis()
+
+        self.ledger_file = self._storage.path
+        self._checkpoint = LedgerCheckpoint(self.ledger_file, self._pepper)
+        self._index = LedgerIndex(self._storage)
+        self._segments = LedgerSegments(
+            self._storage,
+            self._index,
+            self._lock,
+            self._chain_blocks,
+            self._canonical_hash,
+            DEFAULT_SEGMENT_BYTES,
+        )
+        self._writer = LedgerWriter(
+            self._storage,
+            self._lock,
+            self._chain_blocks,
+            on_commit=self._segments.after_commit,
         )
-
-        if not self.ledger_file.exists():
-            self._initialize_genesis()
 
     # --------------------------------------------------------
     # GENESIS BLOCK
@@ -72,7 +150,7 @@ class FBCSecureVault:
         genesis["audit_hash"] = self._canonical_hash(genesis)
         genesis["status"] = "GENESIS"
 
-        self._atomic_save([genesis])
+        self._storage.initialize(genesis)
 
     # --------------------------------------------------------
     # TIME & HASHING
@@ -81,36 +159,14 @@ class FBCSecureVault:
     def _now() -> str:
         return datetime.utcnow().isoformat(timespec="seconds")
 
-    @staticmethod
-    def _sha256(raw: str) -> str:
-        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
-
     def _canonical_hash(self, payload: Dict[str, Any]) -> str:
-        canonical = json.dumps(
-            payload,
-            sort_keys=True,
-            separators=(",", ":")
-        )
-        return self._sha256(canonical + self._pepper)
+        return canonical_hash(payload, self._pepper)
 
     # --------------------------------------------------------
     # LEDGER IO
     # --------------------------------------------------------
     def _load_ledger(self) -> List[Dict[str, Any]]:
-        with open(self.ledger_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-
-    def _atomic_save(self, ledger: List[Dict[str, Any]]) -> None:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=self.ledger_file.parent,
-            delete=False
-        ) as tmp:
-            json.dump(ledger, tmp, indent=2)
-            temp_name = tmp.name
-
-        os.replace(temp_name, self.ledger_file)
+        return self._storage.load_all()
 
     # --------------------------------------------------------
     # PUBLIC CONTRACT (STABLE)
@@ -125,64 +181,170 @@ class FBCSecureVault:
         Stable public API.
         Guaranteed backward compatible.
         """
+        return self.generate_proofs([(project_id, node_id, value)])[0]
 
-        if value < 0:
-            raise ValueError("Negative values are not permitted")
+    def generate_proofs(
+        self,
+        records: Iterable[Tuple[str, str, float]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Batched proof generation.
 
-        ledger = self._load_ledger()
-        last_block = ledger[-1]
+        Chains every (project_id, node_id, value) record in
+        memory and persists the batch with one durable write.
+        The batch is rejected as a unit on any negative value.
+        Concurrent batches may share one commit.
+        """
 
-        payload = {
-            "index": last_block["index"] + 1,
-            "timestamp": self._now(),
-            "schema": LEDGER_SCHEMA_VERSION,
-            "project_id": project_id,
-            "node": node_id,
-            "value": float(value),
-            "protocol": PROTOCOL,
-            "previous_hash": last_block["audit_hash"],
-            "ledger_version": GLOBAL_LEDGER_VERSION,
-        }
+        records = list(records)
+
+        for _, _, value in records:
+            if value < 0:
+                raise ValueError("Negative values are not permitted")
 
-        payload["audit_hash"] = self._canonical_hash(payload)
-        payload["status"] = "IMMUTABLE_RECORD"
+        if not records:
+            return []
 
-        ledger.append(payload)
-        self._atomic_save(ledger)
+        return self._writer.submit(records)
 
-        return payload
+    def find(
+        self,
+        project_id: Optional[str] = None,
+        node: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Indexed lookup by project, node and inclusive time range,
+        sealed segments included. Only matching blocks are read
+        from storage.
+        """
+        return self._segments.find(project_id, node, since, until)
+
+    def writer_metrics(self) -> Dict[str, Any]:
+        """Queue depth, group-commit and back-pressure counters."""
+        return self._writer.metrics()
+
+    def _chain_blocks(
+        self,
+        last_block: Dict[str, Any],
+        records: List[Tuple[str, str, float]]
+    ) -> List[Dict[str, Any]]:
+        timestamp = self._now()
+        blocks: List[Dict[str, Any]] = []
+
+        for project_id, node_id, value in records:
+            payload = {
+                "index": last_block["index"] + 1,
+                "timestamp": timestamp,
+                "schema": LEDGER_SCHEMA_VERSION,
+                "project_id": project_id,
+                "node": node_id,
+                "value": float(value),
+                "protocol": PROTOCOL,
+                "previous_hash": last_block["audit_hash"],
+                "ledger_version": GLOBAL_LEDGER_VERSION,
+            }
+
+            payload["audit_hash"] = self._canonical_hash(payload)
+            payload["status"] = "IMMUTABLE_RECORD"
+
+            blocks.append(payload)
+            last_block = payload
+
+        return blocks
+
+    # --------------------------------------------------------
+    # INCLUSION PROOFS
+    # --------------------------------------------------------
+    def tree_head(self) -> Dict[str, Any]:
+        """
+        Signed Merkle head (first_index, tree_size, root) of the
+        active segment; the trusted root for live proofs.
+        """
+        return sign_tree_head(self._index.head(), self._pepper)
+
+    def verify_tree_head(self, head: Dict[str, Any]) -> bool:
+        """True when `head` was signed by this ledger's secret."""
+        return verify_tree_head(head, self._pepper)
+
+    def inclusion_proof(
+        self,
+        index: int,
+        tree_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        O(log n) audit path from block `index` to the Merkle
+        root of its segment, with the block itself under
+        "record". Live proofs target the active tree at
+        `tree_size` (pass a signed head's size) and carry no
+        root; archived proofs carry the sealed root.
+        """
+        found = self._index.prove(index, tree_size) or archived_inclusion_proof(
+            self._storage, index
+        )
+        if found is None:
+            raise ValueError(f"Unknown ledger index: {index}")
+
+        record, proof = found
+        return dict(proof, record=record)
+
+    @staticmethod
+    def verify_inclusion(
+        record: Dict[str, Any],
+        proof: Dict[str, Any],
+        root: str,
+    ) -> bool:
+        """
+        Offline check of an inclusion proof; needs no secret.
+        `root` is a verified tree_head()'s root or a seal's.
+        """
+        return merkle_verify_inclusion(record, proof, root)
+
+    # --------------------------------------------------------
+    # SEGMENT ROTATION
+    # --------------------------------------------------------
+    def seal_segment(self) -> Dict[str, Any]:
+        """
+        Archives the active segment (gzip) and starts a new one
+        headed by a chained seal block carrying the Merkle root
+        and archive digest of every sealed segment.
+        """
+        return self._segments.seal()
 
     # --------------------------------------------------------
     # VERIFICATION
     # --------------------------------------------------------
-    def verify_global_ledger(self) -> Dict[str, Any]:
-        ledger = self._load_ledger()
-
-        for i in range(1, len(ledger)):
-            current = ledger[i]
-            previous = ledger[i - 1]
-
-            recalculated = self._canonical_hash({
-                k: current[k]
-                for k in current
-                if k not in {"audit_hash", "status"}
-            })
-
-            if recalculated != current["audit_hash"]:
-                return {
-                    "status": "TAMPER_DETECTED",
-                    "block_index": i
-                }
-
-            if current["previous_hash"] != previous["audit_hash"]:
-                return {
-                    "status": "CHAIN_BROKEN",
-                    "block_index": i
-                }
+    def verify_global_ledger(
+        self,
+        full: bool = False,
+        workers: int = 1,
+        archives: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Incremental by default (resumes after the last signed
+        checkpoint). full=True re-verifies the active segment
+        and matches sealed archives against their digests;
+        archives=True also decompresses and re-verifies them.
+        workers > 1 splits the pass across a process pool.
+        """
+        failure, blocks = verify_ledger(
+            self._storage,
+            self._pepper,
+            self._checkpoint,
+            full=full,
+            workers=workers,
+        )
+
+        if failure is None and (full or archives):
+            failure = verify_archives(self._storage, self._pepper, deep=archives)
+
+        if failure is not None:
+            return failure
 
         return {
             "status": "GLOBAL_LEDGER_VERIFIED",
-            "blocks": len(ledger),
+            "blocks": blocks,
             "ledger_version": GLOBAL_LEDGER_VERSION,
             "schema_version": LEDGER_SCHEMA_VERSION,
         }
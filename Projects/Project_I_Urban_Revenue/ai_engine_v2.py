@@ -11,8 +11,10 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from statistics import NormalDist
+from typing import Dict, Any, Optional, Sequence, Union
 
 import numpy as np
 
@@ -26,6 +28,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+MANIFEST_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "Projects"
+    / "Project_VI_Global_Dominance"
+    / "global_cities_manifest.json"
+)
+
+DEFAULT_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+
+
+# --------------------------------------------------
+# MANIFEST CACHE (ONE READ PER PROCESS)
+# --------------------------------------------------
+@lru_cache(maxsize=4)
+def _read_manifest(path: Path) -> Dict[str, Any]:
+    with path.open("r", encoding="utf-8") as file:
+        return json.load(file)
+
 
 # --------------------------------------------------
 # CORE ENGINE
@@ -71,20 +92,11 @@ class UrbanRevenueAI:
     # --------------------------------------------------
     def _load_manifest(self) -> Optional[Dict[str, Any]]:
         try:
-            base_dir = Path(__file__).resolve().parents[2]
-            manifest_path = (
-                base_dir
-                / "Projects"
-                / "Project_VI_Global_Dominance"
-                / "global_cities_manifest.json"
-            )
-
-            if not manifest_path.exists():
+            if not MANIFEST_PATH.exists():
                 logger.warning("Global manifest not found. Running in CI-safe mode.")
                 return None
 
-            with manifest_path.open("r", encoding="utf-8") as file:
-                data = json.load(file)
+            data = _read_manifest(MANIFEST_PATH)
 
         except Exception as exc:
             logger.error("Failed to load global manifest: %s", exc)
@@ -98,7 +110,18 @@ class UrbanRevenueAI:
         for node in nodes:
             if node.get("city", "").lower() == self.city_name.lower():
                 self._validate_city_node(node)
-                return node
+                return dict(node)
+
+        # v7 manifests list cities under the expansion phases
+        for phase in data.get("global_expansion_strategy", {}).values():
+            for target in phase.get("target_cities", []):
+                if target.get("city", "").lower() == self.city_name.lower():
+                    node = {
+                        "city": target["city"],
+                        "expected_revenue_m": target.get("expected_arr_usd_m"),
+                    }
+                    self._validate_city_node(node)
+                    return node
 
         logger.warning("City '%s' not found in global manifest.", self.city_name)
         return None
@@ -174,6 +197,96 @@ class UrbanRevenueAI:
             "status": "AI_OPTIMIZATION_COMPLETE"
         }
 
+    # --------------------------------------------------
+    # MONTE CARLO DISTRIBUTION (VECTORIZED)
+    # --------------------------------------------------
+    def simulate_distribution(
+        self,
+        n_samples: int = 100_000,
+        seed: Union[int, np.random.Generator, None] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    ) -> Dict[str, Any]:
+        """
+        Distribution of analyze_yield() outcomes from n_samples
+        market-noise draws, taken in one vectorized call.
+
+        Reproducible: the same integer seed (or an identically
+        seeded numpy.random.Generator) gives the same result.
+        Deterministic engines draw no noise.
+
+        Returns percentiles, the central confidence interval at
+        `confidence_level` and a normal-approximation interval
+        for the mean, for optimized total and net value (in $M).
+        """
+        if not self.manifest_data:
+            return self._fallback_payload(
+                "CITY_NOT_FOUND_IN_MANIFEST"
+            )
+
+        n_samples = int(n_samples)
+        if n_samples < 1:
+            raise ValueError("n_samples must be at least 1")
+        if not 0 < confidence_level < 1:
+            raise ValueError("confidence_level must be in (0, 1)")
+
+        base_revenue = float(self.manifest_data["expected_revenue_m"])
+
+        # optimized = base * (coefficient + noise) * mitigation, in place
+        if self.deterministic:
+            optimized = np.zeros(n_samples)
+        else:
+            rng = np.random.default_rng(seed)
+            optimized = rng.normal(0.0, self.MARKET_NOISE_STD, n_samples)
+        optimized += self.BASE_EFFICIENCY_COEFFICIENT
+        optimized *= self.RISK_MITIGATION_FACTOR * base_revenue
+
+        tail = (1.0 - confidence_level) / 2 * 100
+        levels = [*percentiles, tail, 100.0 - tail]
+        quantiles = np.percentile(optimized, levels)
+
+        mean = float(optimized.mean())
+        std = float(optimized.std(ddof=1)) if n_samples > 1 else 0.0
+        half_width = NormalDist().inv_cdf(0.5 + confidence_level / 2) * std / np.sqrt(n_samples)
+
+        # net = optimized - base is a shift: same spread, shifted quantiles
+        def summarize(shift: float) -> Dict[str, Any]:
+            return {
+                "mean": round(mean - shift, 4),
+                "std": round(std, 4),
+                "percentiles": {
+                    f"p{p:g}": round(float(q) - shift, 4)
+                    for p, q in zip(percentiles, quantiles)
+                },
+                "confidence_interval": [
+                    round(float(quantiles[-2]) - shift, 4),
+                    round(float(quantiles[-1]) - shift, 4),
+                ],
+                "mean_confidence_interval": [
+                    round(mean - half_width - shift, 4),
+                    round(mean + half_width - shift, 4),
+                ],
+            }
+
+        return {
+            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+            "engine_version": self.ENGINE_VERSION,
+            "engine_role": self.ENGINE_ROLE,
+            "city": self.city_name,
+            "mode": "DETERMINISTIC" if self.deterministic else "MONTE_CARLO",
+            "n_samples": n_samples,
+            "confidence_level": confidence_level,
+
+            "metrics": {
+                "base_revenue_m": base_revenue,
+                "fbc_optimized_total_m": summarize(0.0),
+                "net_value_created_m": summarize(base_revenue),
+            },
+
+            "data_mode": "REALISTIC_DETERMINISTIC",
+            "status": "AI_DISTRIBUTION_COMPLETE"
+        }
+
     # --------------------------------------------------
     # FALLBACK (CI SAFE)
     # --------------------------------------------------
@@ -43,9 +43,9 @@ class FBC_APIGateway:
         result = engine.project_incremental_gain(annual_revenue)
 
         audit = self.vault.generate_proof(
-            project="REVENUE_SIMULATION",
-            entity=city,
-            value=result["Total_City_Gain"],
+            "REVENUE_SIMULATION",
+            city,
+            result["Total_City_Gain"],
         )
 
         return {
@@ -68,9 +68,9 @@ class FBC_APIGateway:
         result = predict_energy_savings(annual_energy_bill)
 
         audit = self.vault.generate_proof(
-            project="ENERGY_FORECAST",
-            entity=city,
-            value=result["ai_predicted_savings"],
+            "ENERGY_FORECAST",
+            city,
+            result["ai_predicted_savings"],
         )
 
         return {
@@ -94,9 +94,9 @@ class FBC_APIGateway:
         result = engine.analyze_real_time_risk(traffic_density)
 
         audit = self.vault.generate_proof(
-            project="TRAFFIC_RISK",
-            entity=city,
-            value=result["risk_score"],
+            "TRAFFIC_RISK",
+            city,
+            result["risk_score"],
         )
 
         return {
@@ -5,8 +5,8 @@
 # ROLE: Central Execution Gateway for all FBC Systems
 # =========================================================
 
-from fastapi import FastAPI, HTTPException
-from typing import Dict, Any
+from fastapi import FastAPI, HTTPException, Query
+from typing import Dict, Any, Optional
 import sys
 import os
 
@@ -26,11 +26,12 @@ from Project_I_Urban_Revenue.revenue_optimizer import RevenueOptimizer
 from Project_II_Private_Districts.energy_forecast import predict_energy_savings
 from Project_III_Traffic_Intelligence.accident_pred import TrafficRiskEngine
 from Project_III_Security_Ledger.secure_vault import FBCSecureVault
+from Project_III_Security_Ledger.ledger_writer import LedgerBackpressureError
 
 # =========================================================
 # IMPORT DATA CORE
 # =========================================================
-from data_core import fetch_results_as_dict
+from data_core import FeedGapError, changes_since, fetch_aggregates, query_results_as_dict
 
 vault = FBCSecureVault()
 
@@ -97,20 +98,110 @@ def generate_ledger_proof(project: str, entity: str, value: float):
             detail="Ledger value must be non-negative"
         )
 
-    return vault.generate_proof(project, entity, value)
+    try:
+        return vault.generate_proof(project, entity, value)
+    except LedgerBackpressureError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+
+
+@app.get("/ledger/head", response_model=Dict[str, Any])
+def get_ledger_tree_head():
+    """Signed Merkle head of the active ledger segment."""
+    return vault.tree_head()
+
+
+@app.get("/ledger/inclusion/{index}", response_model=Dict[str, Any])
+def get_ledger_inclusion_proof(
+    index: int,
+    tree_size: Optional[int] = Query(None, ge=1),
+):
+    """
+    Compact Merkle inclusion proof for one ledger record;
+    check it offline with FBCSecureVault.verify_inclusion
+    against a /ledger/head root (live segment, pass its
+    tree_size) or the proof's sealed root (archived).
+    """
+    try:
+        return vault.inclusion_proof(index, tree_size)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+
+@app.get("/ledger/writer/metrics", response_model=Dict[str, Any])
+def get_ledger_writer_metrics():
+    return vault.writer_metrics()
 
 # =========================================================
 # DATA CORE — SIMULATION HISTORY
 # =========================================================
 @app.get("/data/simulations")
-def get_all_simulations() -> Dict[str, Any]:
-    simulations = fetch_results_as_dict()
+def get_all_simulations(
+    engine: Optional[str] = None,
+    since: Optional[str] = Query(None, description="ISO-8601, inclusive"),
+    until: Optional[str] = Query(None, description="ISO-8601, inclusive"),
+    limit: Optional[int] = Query(None, ge=0),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+) -> Dict[str, Any]:
+    """
+    Simulation history. Without parameters returns everything;
+    dashboards should page with limit + cursor (order=desc for
+    the newest records first).
+    """
+    try:
+        simulations = query_results_as_dict(
+            engine=engine,
+            since=since,
+            until=until,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            order=order,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
     return {
-        "count": len(simulations),
+        "count": simulations["count"],
         "simulations": simulations,
         "data_mode": "REAL",
     }
 
+
+@app.get("/data/changes")
+def get_simulation_changes(since: int = Query(0, ge=0)) -> Dict[str, Any]:
+    """
+    Records committed after sequence number `since`; poll with
+    the returned `position` to receive only deltas. 410 means
+    the gap is no longer retained, or `since` is ahead of this
+    worker's feed (restart, other worker): re-read
+    /data/simulations.
+    """
+    try:
+        events = changes_since(since)
+    except FeedGapError as exc:
+        raise HTTPException(status_code=410, detail=str(exc))
+
+    return {
+        "changes": [{"seq": event.seq, "record": event.record} for event in events],
+        "position": events[-1].seq if events else since,
+        "data_mode": "REAL",
+    }
+
+
+@app.get("/data/aggregates")
+def get_simulation_aggregates() -> Dict[str, Any]:
+    """
+    Per-engine and per-city rollups (count, sum, mean, min,
+    max, p50/p90/p99) maintained on insert; cost does not
+    grow with history size.
+    """
+    return {
+        "aggregates": fetch_aggregates(),
+        "data_mode": "REAL",
+    }
+
 # =========================================================
 # SYSTEM STATUS & HEALTH
 # =========================================================
@@ -0,0 +1,84 @@
+# =========================================================
+# PATH: benchmarks/bench_data_core_batch.py
+# DESCRIPTION: data_core Batch vs Single-Record Ingestion Benchmark
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ROLE: Throughput of store_simulation_results (chunked batches)
+#       against one store_simulation_result call per record,
+#       rollups included (folded before the clock stops)
+#
+# USAGE:
+#   python benchmarks/bench_data_core_batch.py
+#   python benchmarks/bench_data_core_batch.py --records 10000 100000 --batch-size 1000
+# =========================================================
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_core import (
+    fetch_aggregates,
+    set_max_records,
+    store_simulation_result,
+    store_simulation_results,
+)
+
+ENGINE = "GLOBAL_SIMULATION"
+CITIES = ["LONDON", "DUBAI", "NEW_YORK", "SINGAPORE", "TOKYO", "PARIS"]
+
+
+def make_batch(records: int) -> list:
+    return [
+        (ENGINE, {
+            "city": CITIES[i % len(CITIES)],
+            "revenue_gain": 1_000_000.0 + (i * 7919) % 10_007,
+            "energy_savings": 50_000.0 + i % 97,
+            "risk_score": (i % 100) / 100,
+        })
+        for i in range(records)
+    ]
+
+
+def single(batch: list, batch_size: int) -> None:
+    for engine, payload in batch:
+        store_simulation_result(engine, payload)
+
+
+def batched(batch: list, batch_size: int) -> None:
+    for start in range(0, len(batch), batch_size):
+        store_simulation_results(batch[start: start + batch_size])
+
+
+def measure(mode, batch: list, batch_size: int) -> float:
+    set_max_records(len(batch))
+    fetch_aggregates()
+
+    started = time.perf_counter()
+    mode(batch, batch_size)
+    fetch_aggregates()
+    return len(batch) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"batch size {args.batch_size}")
+    print(f"{'records':>10} {'single rec/s':>14} {'batch rec/s':>14} {'speedup':>8}")
+
+    for records in args.records:
+        batch = make_batch(records)
+        single_rate = measure(single, batch, args.batch_size)
+        batch_rate = measure(batched, batch, args.batch_size)
+        print(
+            f"{records:>10} {single_rate:>14,.0f} {batch_rate:>14,.0f} "
+            f"{batch_rate / single_rate:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
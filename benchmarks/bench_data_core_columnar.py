@@ -0,0 +1,99 @@
+# =========================================================
+# PATH: benchmarks/bench_data_core_columnar.py
+# DESCRIPTION: data_core Dict vs Columnar Storage Benchmark
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ROLE: Compares retained memory of dict records and NumPy
+#       columns for run_simulation-shaped results, and times
+#       per-city aggregates over each
+#
+# USAGE:
+#   python benchmarks/bench_data_core_columnar.py
+#   python benchmarks/bench_data_core_columnar.py --records 100000
+# =========================================================
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_core import core
+from data_core import (
+    aggregate_results,
+    fetch_all_results,
+    register_columnar_engine,
+    set_max_records,
+    store_simulation_result,
+)
+
+ENGINE = "GLOBAL_SIMULATION"
+FIELDS = ["revenue_gain", "energy_savings", "risk_score"]
+CITIES = ["LONDON", "DUBAI", "NEW_YORK", "SINGAPORE", "TOKYO", "PARIS"]
+
+
+def fill(records: int) -> None:
+    for i in range(records):
+        store_simulation_result(ENGINE, {
+            "city": CITIES[i % len(CITIES)],
+            "revenue_gain": 1_000_000.0 + i,
+            "energy_savings": 50_000.0 + i % 97,
+            "risk_score": (i % 100) / 100,
+        })
+
+
+def measure(records: int, columnar: bool) -> dict:
+    core._COLUMNAR.clear()
+    set_max_records(1)
+    gc.collect()
+
+    # Includes the preallocated ring slots / column arrays
+    tracemalloc.start()
+    set_max_records(records)
+    if columnar:
+        register_columnar_engine(ENGINE, FIELDS)
+    fill(records)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    if columnar:
+        aggregate_results(ENGINE, "revenue_gain")
+    else:
+        # The per-request path reporting code used so far
+        by_city = {}
+        for record in fetch_all_results():
+            payload = record["payload"]
+            by_city.setdefault(payload["city"], []).append(payload["revenue_gain"])
+        for values in by_city.values():
+            np.percentile(values, [50, 90, 99])
+    aggregate_ms = (time.perf_counter() - started) * 1000
+
+    set_max_records(1)
+    return {"retained_mb": retained / 1e6, "aggregate_ms": aggregate_ms}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'records':>10} {'layout':>9} {'retained MB':>12} {'B/record':>9} {'aggregate ms':>13}")
+    for records in args.records:
+        for columnar in (False, True):
+            result = measure(records, columnar)
+            print(
+                f"{records:>10} {'columnar' if columnar else 'dict':>9} "
+                f"{result['retained_mb']:>12.1f} "
+                f"{result['retained_mb'] * 1e6 / records:>9.0f} "
+                f"{result['aggregate_ms']:>13.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# =========================================================
+# PATH: benchmarks/bench_data_core_ingest.py
+# DESCRIPTION: data_core Multi-Threaded Ingestion Benchmark
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ROLE: Aggregate store_simulation_result throughput and lock
+#       wait as the number of writer threads grows, per
+#       persistence backend
+#
+# USAGE:
+#   python benchmarks/bench_data_core_ingest.py
+#   python benchmarks/bench_data_core_ingest.py --threads 1 8 32 --backend log
+# =========================================================
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_core import configure_backend, set_max_records, store_simulation_result
+
+
+def run(threads: int, records_per_thread: int) -> float:
+    """Records/s with `threads` writers started together."""
+    barrier = threading.Barrier(threads + 1)
+
+    def writer(worker: int) -> None:
+        city = f"CITY-{worker % 8}"
+        barrier.wait()
+        for i in range(records_per_thread):
+            store_simulation_result("BENCH", {
+                "city": city,
+                "revenue_gain": 1_000_000.0 + (i * 7919) % 10_007,
+                "risk_score": (i % 100) / 100,
+            })
+
+    pool = [threading.Thread(target=writer, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return threads * records_per_thread / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--records", type=int, default=64_000, help="records per run")
+    parser.add_argument("--backend", default="memory", choices=["memory", "log", "sqlite"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"backend={args.backend} records/run={args.records}")
+        print(f"{'threads':>8} {'records/s':>12}")
+
+        for threads in args.threads:
+            configure_backend(args.backend, Path(tmp) / f"t{threads}")
+            set_max_records(args.records)
+            rate = run(threads, args.records // threads)
+            print(f"{threads:>8} {rate:>12,.0f}")
+
+        configure_backend("memory")
+
+
+if __name__ == "__main__":
+    main()
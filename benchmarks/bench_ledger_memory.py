@@ -0,0 +1,124 @@
+# =========================================================
+# PATH: benchmarks/bench_ledger_memory.py
+# DESCRIPTION: Streaming Ledger Verification Memory Benchmark
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ROLE: Measures peak RSS of a full verify_sector_ledger pass
+#       per storage engine as the ledger grows; each pass runs
+#       in a fresh process so peaks do not carry over
+#
+# USAGE:
+#   python benchmarks/bench_ledger_memory.py
+#   python benchmarks/bench_ledger_memory.py --blocks 10000 100000
+# =========================================================
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from Projects.Project_III_Security_Ledger.ledger_migrate import migrate_ledger
+from Projects.Project_III_Security_Ledger.secure_vault import FBCSecureVault
+
+
+BATCH_SIZE = 10_000
+STEM = "fbc_sector_ledger"
+
+
+def build_ledgers(root: Path, blocks: int) -> None:
+    """Builds the same chain as .jsonl, legacy .json and .db."""
+    vault = FBCSecureVault(base_path=root, storage="jsonl")
+
+    for start in range(1, blocks, BATCH_SIZE):
+        size = min(BATCH_SIZE, blocks - start)
+        vault.generate_proofs(
+            ("BENCH", f"NODE-{(start + i) % 1000}", float(i)) for i in range(size)
+        )
+
+    # Legacy array written line by line (never resident as a list)
+    with open(root / f"{STEM}.jsonl", "r", encoding="utf-8") as src, \
+            open(root / f"{STEM}.json", "w", encoding="utf-8") as dst:
+        dst.write("[\n")
+        for k, line in enumerate(src):
+            dst.write((",\n" if k else "") + line.rstrip("\n"))
+        dst.write("\n]")
+
+    migrate_ledger(root, STEM, "jsonl", "sqlite")
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss survives fork+exec on Linux (it would report the
+    # parent's peak); VmHWM belongs to this process image only
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(root: Path, storage: str) -> None:
+    vault = FBCSecureVault(base_path=root, storage=storage)
+    baseline = peak_rss_mb()
+
+    started = time.perf_counter()
+    result = vault.verify_sector_ledger(full=True)
+    elapsed = time.perf_counter() - started
+
+    assert result["status"] == "LEDGER_VERIFIED", result
+    print(json.dumps({
+        "blocks": result["blocks"],
+        "baseline_mb": baseline,
+        "peak_mb": peak_rss_mb(),
+        "seconds": elapsed,
+    }))
+
+
+def measure(root: Path, storage: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", str(root), storage],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blocks", type=int, nargs="+",
+                        default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--storage", nargs="+",
+                        default=["jsonl", "json", "sqlite"])
+    parser.add_argument("--child", nargs=2, metavar=("ROOT", "STORAGE"))
+    args = parser.parse_args()
+
+    if args.child:
+        child(Path(args.child[0]), args.child[1])
+        return
+
+    print(f"{'storage':>8} {'blocks':>11} {'seconds':>9} "
+          f"{'base MB':>9} {'peak MB':>9} {'delta MB':>9}")
+
+    for blocks in args.blocks:
+        with tempfile.TemporaryDirectory() as tmp:
+            build_ledgers(Path(tmp), blocks)
+
+            for storage in args.storage:
+                r = measure(Path(tmp), storage)
+                print(
+                    f"{storage:>8} {r['blocks']:>11,} {r['seconds']:>9.2f} "
+                    f"{r['baseline_mb']:>9.1f} {r['peak_mb']:>9.1f} "
+                    f"{r['peak_mb'] - r['baseline_mb']:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
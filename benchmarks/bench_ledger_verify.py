@@ -0,0 +1,73 @@
+# =========================================================
+# PATH: benchmarks/bench_ledger_verify.py
+# DESCRIPTION: Parallel Ledger Verification Scaling Benchmark
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ROLE: Measures full verify_sector_ledger passes over a
+#       synthetic ledger at 1, 2, 4 and 8 workers
+#
+# USAGE:
+#   python benchmarks/bench_ledger_verify.py
+#   python benchmarks/bench_ledger_verify.py --blocks 100000
+# =========================================================
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from Projects.Project_III_Security_Ledger.secure_vault import FBCSecureVault
+
+
+BATCH_SIZE = 10_000
+
+
+def build_ledger(root: Path, blocks: int) -> FBCSecureVault:
+    vault = FBCSecureVault(base_path=root, storage="jsonl")
+
+    for start in range(1, blocks, BATCH_SIZE):
+        size = min(BATCH_SIZE, blocks - start)
+        vault.generate_proofs(
+            ("BENCH", f"NODE-{(start + i) % 1000}", float(i)) for i in range(size)
+        )
+
+    return vault
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blocks", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        vault = build_ledger(Path(tmp), args.blocks)
+        print(
+            f"Built {args.blocks:,} blocks in "
+            f"{time.perf_counter() - started:.1f}s "
+            f"(cpu count: {os.cpu_count()})\n"
+        )
+
+        print(f"{'workers':>8} {'seconds':>10} {'blocks/s':>14} {'speedup':>9}")
+
+        baseline = None
+        for workers in args.workers:
+            started = time.perf_counter()
+            result = vault.verify_sector_ledger(full=True, workers=workers)
+            elapsed = time.perf_counter() - started
+
+            assert result["status"] == "LEDGER_VERIFIED", result
+            baseline = baseline or elapsed
+
+            print(
+                f"{workers:>8} {elapsed:>10.2f} "
+                f"{args.blocks / elapsed:>14,.0f} {baseline / elapsed:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# =========================================================
+# PATH: benchmarks/bench_simulation_executors.py
+# DESCRIPTION: Global Simulation Executor Benchmark
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ROLE: Wall time of run_global_simulation per executor
+#       (vector, serial, thread, process) on a synthetic node
+#       config, with per-city timing percentiles. --weather-ms
+#       adds a fixed delay to every weather lookup to stand in
+#       for the network round trip.
+#
+# USAGE:
+#   python benchmarks/bench_simulation_executors.py
+#   python benchmarks/bench_simulation_executors.py --nodes 10000 --weather-ms 5 --workers 32
+# =========================================================
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import simulation_engine
+from run_simulation import EXECUTORS, run_global_simulation
+from simulation_engine import synthetic_city_nodes
+
+
+def delayed_weather(seconds: float):
+    lookup = simulation_engine.get_live_weather
+
+    def weather(city: str) -> dict:
+        time.sleep(seconds)
+        return lookup(city)
+
+    return weather
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--weather-ms", type=float, default=0.0)
+    parser.add_argument("--executors", nargs="+", default=list(EXECUTORS), choices=EXECUTORS)
+    args = parser.parse_args()
+
+    if args.weather_ms:
+        # Set before pools start so forked workers inherit it
+        simulation_engine.get_live_weather = delayed_weather(args.weather_ms / 1000)
+
+    nodes = synthetic_city_nodes(args.nodes)
+
+    print(f"nodes={args.nodes} years={args.years} weather={args.weather_ms}ms workers={args.workers}")
+    print(f"{'executor':>9} {'wall s':>8} {'cities/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+
+    for executor in args.executors:
+        started = time.perf_counter()
+        results = run_global_simulation(
+            nodes, persist=False, years=args.years,
+            executor=executor, workers=args.workers,
+        )
+        wall = time.perf_counter() - started
+
+        if executor == "vector":
+            p50 = p99 = "-"
+        else:
+            elapsed = np.array([row["elapsed_ms"] for row in results])
+            p50, p99 = (f"{v:.3f}" for v in np.percentile(elapsed, [50, 99]))
+
+        print(f"{executor:>9} {wall:>8.2f} {len(results) / wall:>10,.0f} {p50:>8} {p99:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,21 +20,51 @@ and backward-compatible under LTS guarantees.
 # PUBLIC API IMPORTS (STABLE — DO NOT BREAK)
 # --------------------------------------------------
 from data_core.core import (
+    aggregate_results,
+    changes_since,
+    configure_backend,
+    fetch_aggregates,
     fetch_all_results,
+    fetch_columnar,
+    feed_position,
+    query_results,
+    register_columnar_engine,
+    set_max_records,
     store_simulation_result,
+    store_simulation_results,
+    subscribe,
+    watch_changes,
 )
 
+from data_core.feed import ChangeEvent, FeedGapError
+
 from data_core.results import (
     fetch_results_as_dict,
+    query_results_as_dict,
 )
 
 # --------------------------------------------------
 # EXPLICIT PUBLIC EXPORTS
 # --------------------------------------------------
 __all__ = [
+    "ChangeEvent",
+    "FeedGapError",
+    "aggregate_results",
+    "changes_since",
+    "configure_backend",
+    "fetch_aggregates",
     "fetch_all_results",
+    "fetch_columnar",
+    "feed_position",
+    "query_results",
+    "register_columnar_engine",
+    "set_max_records",
     "store_simulation_result",
+    "store_simulation_results",
+    "subscribe",
+    "watch_changes",
     "fetch_results_as_dict",
+    "query_results_as_dict",
 ]
 
 # --------------------------------------------------
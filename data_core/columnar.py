@@ -0,0 +1,211 @@
+# ==========================================
+# PATH: data_core/columnar.py
+# DESCRIPTION: Columnar Storage for Fixed-Schema Engines
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ==========================================
+
+"""
+Array-backed store for engines whose payloads are a string key
+(e.g. city) plus fixed numeric fields, such as the
+run_simulation outputs.
+
+Per record it keeps one float64 per field, an int32 dictionary
+code for the key, a float64 epoch timestamp and the 16 raw
+bytes of the record uuid (about 52 bytes for three fields)
+instead of a dict record with uuid and ISO strings and a
+payload dict. Aggregates run vectorized over the columns.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from numbers import Real
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from data_core.frozen import FrozenDict
+from data_core.query import to_epoch
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0)
+
+
+class ColumnarStore:
+    """
+    Fixed-capacity FIFO over NumPy columns (same eviction
+    semantics as RingBuffer: a live row lives in slot
+    `seq % capacity`). Not thread-safe (callers hold their own
+    lock).
+    """
+
+    def __init__(self, fields: Sequence[str], key: str = "city", capacity: int = 100_000) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not fields:
+            raise ValueError("fields must name at least one numeric column")
+
+        self.fields = tuple(fields)
+        self.key = key
+        self.capacity = capacity
+        self.next_seq = 0
+
+        self._columns = {name: np.zeros(capacity, dtype=np.float64) for name in self.fields}
+        self._codes = np.zeros(capacity, dtype=np.int32)
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._ids = np.zeros((capacity, 16), dtype=np.uint8)
+
+        # Dictionary encoding for the key column
+        self._labels: List[str] = []
+        self._label_codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return min(self.next_seq, self.capacity)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (preallocated)."""
+        return (
+            sum(column.nbytes for column in self._columns.values())
+            + self._codes.nbytes
+            + self._times.nbytes
+            + self._ids.nbytes
+        )
+
+    # --------------------------------------------------
+    # WRITE
+    # --------------------------------------------------
+    def validate(self, payload: Dict[str, Any]) -> None:
+        if set(payload) != {self.key, *self.fields}:
+            raise ValueError(
+                f"payload must contain exactly {self.key!r} and {list(self.fields)}"
+            )
+        if not isinstance(payload[self.key], str):
+            raise ValueError(f"{self.key!r} must be a string")
+        for name in self.fields:
+            value = payload[name]
+            if isinstance(value, bool) or not isinstance(value, Real):
+                raise ValueError(f"{name!r} must be numeric")
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Stores a record with a validated payload; overwrites the oldest row once full."""
+        payload = record["payload"]
+        label = payload[self.key]
+        code = self._label_codes.get(label)
+        if code is None:
+            code = self._label_codes[label] = len(self._labels)
+            self._labels.append(label)
+
+        slot = self.next_seq % self.capacity
+        for name in self.fields:
+            self._columns[name][slot] = payload[name]
+        self._codes[slot] = code
+        self._times[slot] = to_epoch(record["timestamp_utc"])
+        self._ids[slot] = np.frombuffer(uuid.UUID(record["record_id"]).bytes, np.uint8)
+        self.next_seq += 1
+
+    def resized(self, capacity: int) -> "ColumnarStore":
+        """Copy with a new capacity, keeping the newest rows."""
+        store = ColumnarStore(self.fields, self.key, capacity)
+        order = self._order()[-capacity:]
+
+        for name in self.fields:
+            store._columns[name][: len(order)] = self._columns[name][order]
+        store._codes[: len(order)] = self._codes[order]
+        store._times[: len(order)] = self._times[order]
+        store._ids[: len(order)] = self._ids[order]
+        store._labels = list(self._labels)
+        store._label_codes = dict(self._label_codes)
+        store.next_seq = len(order)
+        return store
+
+    # --------------------------------------------------
+    # READ
+    # --------------------------------------------------
+    def _order(self) -> np.ndarray:
+        """Slot indices of live rows, oldest first."""
+        size = len(self)
+        start = self.next_seq - size
+        return np.arange(start, self.next_seq) % self.capacity
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Ordered copies of every column; the key is decoded."""
+        order = self._order()
+        labels = np.array(self._labels, dtype=object)
+
+        snapshot = {self.key: labels[self._codes[order]] if len(order) else labels[:0]}
+        for name in self.fields:
+            snapshot[name] = self._columns[name][order]
+        snapshot["timestamp_utc"] = self._times[order]
+        return snapshot
+
+    def records(self, engine: str) -> List[Dict[str, Any]]:
+        """
+        Rebuilds live rows as data_core records (oldest first),
+        e.g. for persistence snapshots. Numeric fields come back
+        as floats.
+        """
+        order = self._order()
+        return [
+            FrozenDict(
+                record_id=str(uuid.UUID(bytes=self._ids[slot].tobytes())),
+                engine=engine,
+                payload=FrozenDict(
+                    {self.key: self._labels[self._codes[slot]]},
+                    **{name: float(self._columns[name][slot]) for name in self.fields},
+                ),
+                timestamp_utc=datetime.fromtimestamp(
+                    self._times[slot], timezone.utc
+                ).isoformat(),
+            )
+            for slot in order
+        ]
+
+    def aggregate(
+        self,
+        field: str,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Per-key count, sum, mean, min, max and percentiles
+        (linear interpolation, as numpy.percentile) of `field`.
+        """
+        if field not in self._columns:
+            raise ValueError(f"Unknown column: {field}")
+
+        size = len(self)
+        if not size:
+            return {}
+
+        codes = self._codes[:size]
+        values = self._columns[field][:size]
+
+        # Group by key, values ascending within each group
+        order = np.lexsort((values, codes))
+        codes = codes[order]
+        values = values[order]
+
+        present = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        counts = np.diff(np.r_[present, size])
+        sums = np.add.reduceat(values, present)
+        last = present + counts - 1
+
+        stats: Dict[str, np.ndarray] = {
+            "count": counts,
+            "sum": sums,
+            "mean": sums / counts,
+            "min": values[present],
+            "max": values[last],
+        }
+
+        for p in percentiles:
+            position = present + (counts - 1) * (p / 100.0)
+            lo = np.floor(position).astype(np.int64)
+            hi = np.minimum(lo + 1, last)
+            stats[f"p{p:g}"] = values[lo] + (values[hi] - values[lo]) * (position - lo)
+
+        result: Dict[str, Dict[str, float]] = {}
+        for i, code in enumerate(codes[present]):
+            result[self._labels[code]] = {
+                name: (int(column[i]) if name == "count" else float(column[i]))
+                for name, column in stats.items()
+            }
+        return result
@@ -4,20 +4,240 @@
 # VERSION: v5.0.0-ENTERPRISE-LTS
 # ==========================================
 
-from typing import Dict, Any, List
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from threading import Lock
+import os
 import uuid
-import copy
+
+import numpy as np
+
+from data_core.columnar import DEFAULT_PERCENTILES, ColumnarStore
+from data_core.feed import ChangeEvent, ChangeFeed
+from data_core.frozen import FrozenDict, freeze
+from data_core.persistence import open_backend
+from data_core.query import ORDER_ASC, ResultIndex, TimeBound, paginate, to_epoch
+from data_core.ring_buffer import RingBuffer
+from data_core.rollups import Rollups
 
 # --------------------------------------------------
 # INTERNAL STATE (PRIVATE — DO NOT ACCESS DIRECTLY)
 # --------------------------------------------------
-_DATA_STORE: List[Dict[str, Any]] = []
+# Soft limit to prevent runaway memory usage (CI-safe)
+_MAX_RECORDS = int(os.getenv("FBC_DATA_CORE_MAX_RECORDS", 100_000))
+
+# Fixed-capacity FIFO: O(1) insert and eviction under the lock
+_DATA_STORE = RingBuffer(_MAX_RECORDS)
+_DATA_INDEX = ResultIndex(_MAX_RECORDS)
 _DATA_LOCK = Lock()
 
-# Soft limit to prevent runaway memory usage (CI-safe)
-_MAX_RECORDS = 100_000
+# Durable backend (FBC_DATA_CORE_BACKEND); "memory" persists nothing
+_BACKEND = open_backend()
+
+# Fixed-schema engines kept as NumPy columns instead of dict records
+_COLUMNAR: Dict[str, ColumnarStore] = {}
+
+# --------------------------------------------------
+# CONCURRENT INGESTION
+# --------------------------------------------------
+# Ordering guarantees:
+# - Every record gets a sequence number in the order its
+#   store call enqueued it; one thread's records keep that
+#   thread's call order.
+# - A record is visible to every read that starts after its
+#   store call returns (reads commit queued records first).
+# - With a durable backend the call returns only once the
+#   record is written: safe against a process crash, and
+#   against power loss with FBC_DATA_CORE_FSYNC=1 (see
+#   data_core.persistence).
+#
+# In-memory mode: writers enqueue prepared records on
+# _PENDING (deque appends are atomic) and whichever writer
+# gets _DATA_LOCK without waiting commits the whole queue, so
+# threads never queue up on the lock. Every holder re-checks
+# _PENDING after releasing (_locked), so a record enqueued
+# while the holder was past its drain is still committed and
+# published before that holder returns.
+_PENDING: Deque[Dict[str, Any]] = deque()
+_COMMIT_BATCH = 4_096
+
+# Cumulative per-engine / per-city statistics. Striped onto
+# their own lock: committed records are queued on
+# _ROLLUP_PENDING and folded in batches, off _DATA_LOCK.
+_ROLLUPS = Rollups()
+_ROLLUP_PENDING: Deque[Dict[str, Any]] = deque()
+_ROLLUP_LOCK = Lock()
+_ROLLUP_BATCH = int(os.getenv("FBC_DATA_CORE_ROLLUP_BATCH", 1_024))
+
+# Committed records in commit order; subscribers are called
+# after _DATA_LOCK is released
+_FEED = ChangeFeed()
+
+
+def _place(record: Dict[str, Any]) -> None:
+    """Adds a record to the ring and its index (caller holds the lock)."""
+    columnar = _COLUMNAR.get(record["engine"])
+    if columnar is not None:
+        columnar.append(record)
+        return
+
+    seq = _DATA_STORE.next_seq
+    evicted = _DATA_STORE.append(record)  # overwrites the oldest once full (FIFO)
+    if evicted is not None:
+        _DATA_INDEX.evict(evicted)
+    _DATA_INDEX.add(seq, record)
+
+
+def _ingest(records: List[Dict[str, Any]], publish: bool = True) -> None:
+    """
+    Places newly seen records, queues their rollups and
+    publishes them on the change feed (caller holds the lock).
+    """
+    for record in records:
+        _place(record)
+    _ROLLUP_PENDING.extend(records)
+    if publish:
+        _FEED.publish(records)
+
+
+def _commit(records: List[Dict[str, Any]]) -> None:
+    """Persists, then publishes `records` (caller holds the lock)."""
+    _ingest(_BACKEND.append(records))
+
+    if _BACKEND.snapshot_due():
+        # Only the list is built under the lock; the backend
+        # serializes it on its own thread
+        _BACKEND.snapshot(_live_records())
+
+
+def _drain() -> None:
+    """Commits queued records in arrival order (caller holds the lock)."""
+    while _PENDING:
+        batch = []
+        try:
+            while len(batch) < _COMMIT_BATCH:
+                batch.append(_PENDING.popleft())
+        except IndexError:
+            pass
+        _commit(batch)
+
+
+def _fold_rollups() -> None:
+    """Applies queued rollups in one batch (caller holds _ROLLUP_LOCK)."""
+    batch = []
+    try:
+        while True:
+            batch.append(_ROLLUP_PENDING.popleft())
+    except IndexError:
+        pass
+    if batch:
+        _ROLLUPS.add_many(batch)
+
+
+def _maybe_fold_rollups() -> None:
+    """Folds once a batch is queued, unless another thread is folding."""
+    if len(_ROLLUP_PENDING) >= _ROLLUP_BATCH and _ROLLUP_LOCK.acquire(blocking=False):
+        try:
+            _fold_rollups()
+        finally:
+            _ROLLUP_LOCK.release()
+
+
+def _recover() -> None:
+    """Rebuilds the store and rollups from the backend (caller holds the lock)."""
+    global _DATA_STORE, _DATA_INDEX, _ROLLUPS
+
+    _DATA_STORE = RingBuffer(_MAX_RECORDS)
+    _DATA_INDEX = ResultIndex(_MAX_RECORDS)
+    with _ROLLUP_LOCK:
+        _ROLLUPS = Rollups()
+        _ROLLUP_PENDING.clear()
+    for engine, columnar in _COLUMNAR.items():
+        _COLUMNAR[engine] = ColumnarStore(columnar.fields, columnar.key, _MAX_RECORDS)
+
+    # Recovered history is state, not news: not published
+    _ingest(_BACKEND.load(_MAX_RECORDS), publish=False)
+
+
+def _live_records() -> List[Dict[str, Any]]:
+    """Ring and columnar records in timestamp order (caller holds the lock)."""
+    records = _DATA_STORE.items()
+    if not _COLUMNAR:
+        return records
+
+    for engine, columnar in _COLUMNAR.items():
+        records.extend(columnar.records(engine))
+    return sorted(records, key=lambda record: to_epoch(record["timestamp_utc"]))
+
+
+def _sync() -> None:
+    """
+    Commits queued local records, then pulls records other
+    worker processes persisted (caller holds the lock).
+    """
+    _drain()
+    _ingest(_BACKEND.refresh())
+
+
+def _drain_stranded() -> None:
+    """
+    Commits records enqueued while the lock was held, unless
+    another thread holds it now (it re-checks on release).
+    """
+    while _PENDING and _DATA_LOCK.acquire(blocking=False):
+        try:
+            _drain()
+        finally:
+            _DATA_LOCK.release()
+
+
+@contextmanager
+def _locked():
+    """_DATA_LOCK, then _drain_stranded() once released."""
+    try:
+        with _DATA_LOCK:
+            yield
+    finally:
+        _drain_stranded()
+
+
+with _DATA_LOCK:
+    _recover()
+
+
+def _uuid4_hex(count: int) -> str:
+    """`count` random version-4 UUIDs as one hex string, from one random read."""
+    raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    return raw.tobytes().hex()
+
+
+def _make_record(
+    engine: str,
+    payload: Dict[str, Any],
+    record_id: str,
+    timestamp_utc: str,
+) -> Dict[str, Any]:
+    """Validates and freezes one result (no lock needed)."""
+    if not isinstance(engine, str) or not engine:
+        raise ValueError("engine must be a non-empty string")
+
+    if not isinstance(payload, dict):
+        raise ValueError("payload must be a dictionary")
+
+    columnar = _COLUMNAR.get(engine)
+    if columnar is not None:
+        columnar.validate(payload)
+
+    return FrozenDict(
+        record_id=record_id,
+        engine=engine,
+        payload=freeze(payload),
+        timestamp_utc=timestamp_utc,
+    )
 
 
 # --------------------------------------------------
@@ -40,32 +260,334 @@ def store_simulation_result(engine: str, payload: Dict[str, Any]) -> Dict[str, s
         Storage operation status
     """
 
-    if not isinstance(engine, str) or not engine:
-        raise ValueError("engine must be a non-empty string")
+    # Frozen once at insert time: snapshots share it without copying
+    record = _make_record(
+        engine,
+        payload,
+        str(uuid.uuid4()),
+        datetime.now(timezone.utc).isoformat(),
+    )
 
-    if not isinstance(payload, dict):
-        raise ValueError("payload must be a dictionary")
+    if _BACKEND.durable:
+        # Persisted before it becomes visible to readers
+        with _locked():
+            _drain()
+            _commit([record])
+    else:
+        _PENDING.append(record)
+        # Otherwise the current holder commits it on release
+        _drain_stranded()
 
-    record = {
-        "record_id": str(uuid.uuid4()),
-        "engine": engine,
-        "payload": copy.deepcopy(payload),
-        "timestamp_utc": datetime.now(timezone.utc).isoformat()
-    }
+    _FEED.dispatch()
+    _maybe_fold_rollups()
 
-    with _DATA_LOCK:
-        if len(_DATA_STORE) >= _MAX_RECORDS:
-            _DATA_STORE.pop(0)  # FIFO eviction (deterministic)
+    return {"status": "STORED"}
 
-        _DATA_STORE.append(record)
 
-    return {"status": "STORED"}
+def store_simulation_results(
+    batch: Iterable[Tuple[str, Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """
+    Stores many simulation results in one operation.
+
+    Parameters
+    ----------
+    batch : iterable of (engine, payload)
+        Same arguments as store_simulation_result, per result
+
+    Returns
+    -------
+    dict
+        Storage operation status and count
+
+    The whole batch is validated before anything is stored
+    (all-or-nothing). It shares one timestamp, draws its record
+    ids from a single random read, takes the store lock once
+    and is persisted with one backend append; records keep the
+    batch order and are contiguous in sequence order.
+    """
+
+    items = list(batch)
+    timestamp = datetime.now(timezone.utc).isoformat()
+    ids = _uuid4_hex(len(items))
+
+    records = []
+    for position, item in enumerate(items):
+        h = ids[32 * position: 32 * position + 32]
+        try:
+            engine, payload = item
+            records.append(_make_record(
+                engine,
+                payload,
+                f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}",
+                timestamp,
+            ))
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"batch item {position}: {exc}") from None
+
+    if records:
+        with _locked():
+            _drain()
+            _commit(records)
+
+        _FEED.dispatch()
+        _maybe_fold_rollups()
+
+    return {"status": "STORED", "count": len(records)}
 
 
 def fetch_all_results() -> List[Dict[str, Any]]:
     """
     Returns an immutable snapshot of all stored simulation results.
+
+    Records are read-only (FrozenDict, nested lists as tuples)
+    and shared with the store; only the list of references is
+    new, so the lock is held for one slice copy. Columnar
+    engines are read through fetch_columnar/aggregate_results.
+    """
+
+    with _locked():
+        _sync()
+        results = _DATA_STORE.items()
+
+    _FEED.dispatch()
+    return results
+
+
+def query_results(
+    engine: Optional[str] = None,
+    since: TimeBound = None,
+    until: TimeBound = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    order: str = ORDER_ASC,
+) -> Dict[str, Any]:
+    """
+    Indexed, paginated query over stored results.
+
+    Parameters
+    ----------
+    engine : str, optional
+        Only results from this engine
+    since, until : datetime or ISO-8601 str, optional
+        Inclusive timestamp range
+    limit, offset : int
+        Page size (None = no limit) and records to skip
+    cursor : str, optional
+        Opaque `next_cursor` from a previous page (same order)
+    order : {"asc", "desc"}
+        Insertion order; "desc" returns the newest first
+
+    Returns
+    -------
+    dict
+        results, total (matches before paging) and next_cursor
+        (None on the last page)
+    """
+
+    with _locked():
+        _sync()
+        seqs, lo, hi = _DATA_INDEX.select(_DATA_STORE, engine, since, until)
+        page, next_cursor = paginate(seqs, lo, hi, limit, offset, cursor, order)
+        results = [_DATA_STORE.get(seq) for seq in page]
+
+    _FEED.dispatch()
+    return {"results": results, "total": hi - lo, "next_cursor": next_cursor}
+
+
+def fetch_aggregates() -> Dict[str, Any]:
+    """
+    Incrementally maintained rollups, independent of history size.
+
+    Returns
+    -------
+    dict
+        engines: {engine: {count, fields}} and
+        cities: {engine: {city: {count, fields}}}, where fields
+        maps every finite numeric payload field to count, sum,
+        mean, min, max and p50/p90/p99 from a log-bucket
+        (DDSketch-style) sketch: linearly interpolated between
+        ranks like aggregate_results, each rank within
+        SKETCH_RELATIVE_ACCURACY (FBC_DATA_CORE_SKETCH_ACCURACY,
+        default 1%) relative error. Cumulative since startup
+        (evicted results included).
+    """
+
+    with _locked():
+        _sync()
+    _FEED.dispatch()
+
+    with _ROLLUP_LOCK:
+        _fold_rollups()
+        return _ROLLUPS.snapshot()
+
+
+def set_max_records(capacity: int) -> None:
+    """
+    Resizes the store, keeping the newest `capacity` records.
+    The default comes from FBC_DATA_CORE_MAX_RECORDS.
+    """
+
+    global _DATA_STORE, _DATA_INDEX, _MAX_RECORDS
+
+    resized = RingBuffer(capacity)
+    index = ResultIndex(capacity)
+
+    with _locked():
+        _drain()
+        for record in _DATA_STORE.items()[-capacity:]:
+            index.add(resized.next_seq, record)
+            resized.append(record)
+
+        for engine, columnar in _COLUMNAR.items():
+            _COLUMNAR[engine] = columnar.resized(capacity)
+
+        _DATA_STORE = resized
+        _DATA_INDEX = index
+        _MAX_RECORDS = capacity
+
+    _FEED.dispatch()
+
+
+def configure_backend(kind: str, path: Optional[os.PathLike] = None) -> None:
+    """
+    Switches the persistence backend ("memory", "log" or
+    "sqlite") and reloads the store from it. Defaults come from
+    FBC_DATA_CORE_BACKEND and FBC_DATA_CORE_PATH.
+    """
+
+    global _BACKEND
+
+    backend = open_backend(kind, path)
+
+    with _locked():
+        _drain()
+        previous, _BACKEND = _BACKEND, backend
+        previous.close()
+        _recover()
+
+    _FEED.dispatch()
+
+
+# --------------------------------------------------
+# COLUMNAR ENGINES
+# --------------------------------------------------
+def register_columnar_engine(
+    engine: str,
+    fields: Sequence[str],
+    key: str = "city",
+) -> None:
+    """
+    Stores `engine` results as NumPy columns: payloads must be
+    exactly `key` (a string, dictionary-encoded) plus numeric
+    `fields`. Records of `engine` already in the store move
+    into the columns.
+    """
+
+    global _DATA_STORE, _DATA_INDEX
+
+    columnar = ColumnarStore(fields, key, _MAX_RECORDS)
+
+    with _locked():
+        _drain()
+        records = _DATA_STORE.items()
+        for record in records:
+            if record["engine"] == engine:
+                columnar.validate(record["payload"])
+
+        _COLUMNAR[engine] = columnar
+        _DATA_STORE = RingBuffer(_MAX_RECORDS)
+        _DATA_INDEX = ResultIndex(_MAX_RECORDS)
+        for record in records:
+            _place(record)
+
+    _FEED.dispatch()
+
+
+def _columnar(engine: str) -> ColumnarStore:
+    columnar = _COLUMNAR.get(engine)
+    if columnar is None:
+        raise ValueError(f"engine is not columnar: {engine}")
+    return columnar
+
+
+def fetch_columnar(engine: str) -> Dict[str, Any]:
+    """
+    Column snapshot of a columnar engine, oldest first: the key
+    column (decoded), every numeric field and timestamp_utc
+    (epoch seconds), each as a NumPy array copy.
+    """
+
+    with _locked():
+        _sync()
+        columns = _columnar(engine).columns()
+
+    _FEED.dispatch()
+    return columns
+
+
+def aggregate_results(
+    engine: str,
+    field: str,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Vectorized per-key (e.g. per-city) count, sum, mean, min,
+    max and percentiles of `field` over a columnar engine.
+    """
+
+    with _locked():
+        _sync()
+        aggregates = _columnar(engine).aggregate(field, percentiles)
+
+    _FEED.dispatch()
+    return aggregates
+
+
+# --------------------------------------------------
+# CHANGE FEED
+# --------------------------------------------------
+def feed_position() -> int:
+    """Sequence number of the newest committed record (0 before any)."""
+
+    with _locked():
+        _sync()
+    _FEED.dispatch()
+    return _FEED.position
+
+
+def changes_since(seq: int) -> List[ChangeEvent]:
+    """
+    Catch-up read: committed records with sequence numbers
+    greater than `seq`, oldest first. Raises FeedGapError once
+    they are older than the retained feed, or when `seq` is past
+    feed_position() (a cursor from another process or an earlier
+    run): re-read the full snapshot, then continue from
+    feed_position().
+    """
+
+    with _locked():
+        _sync()
+    _FEED.dispatch()
+    return _FEED.since(seq)
+
+
+def subscribe(callback: Callable[[ChangeEvent], None]) -> Callable[[], None]:
+    """
+    Calls `callback(event)` for every record committed after
+    this call, in sequence order. Returns an unsubscribe
+    function. Callbacks should be quick (they run on the
+    committing thread); exceptions are logged and ignored.
+    """
+
+    return _FEED.subscribe(callback)
+
+
+def watch_changes(since: Optional[int] = None) -> AsyncIterator[ChangeEvent]:
+    """
+    Async iterator over committed records: those after `since`
+    (default: from now on), then live ones as they commit.
     """
 
-    with _DATA_LOCK:
-        return copy.deepcopy(_DATA_STORE)
+    return _FEED.watch(since)
@@ -0,0 +1,169 @@
+# ==========================================
+# PATH: data_core/feed.py
+# DESCRIPTION: In-Process Change Feed for data_core
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ==========================================
+
+"""
+Publishes every record data_core commits as a ChangeEvent with
+a monotonically increasing sequence number (1, 2, ...), so
+dashboards and APIs consume deltas instead of re-reading the
+whole store.
+
+- subscribe(callback): callbacks run in sequence order, one
+  event at a time, on the thread that committed the records
+  (never while the store lock is held)
+- since(seq): catch-up read of retained events after `seq`
+- watch(since): async iterator (catch-up, then live events)
+
+The feed retains the newest FBC_DATA_CORE_FEED_CAPACITY events;
+a consumer that falls further behind gets FeedGapError and
+should re-read the full snapshot. So does a consumer ahead of
+the head: sequence numbers restart with the process and each
+worker keeps its own feed, so such a cursor came from another
+feed and would otherwise silently skip records.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+from dataclasses import dataclass
+from threading import Lock, RLock
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from data_core.ring_buffer import RingBuffer
+
+DEFAULT_FEED_CAPACITY = int(os.getenv("FBC_DATA_CORE_FEED_CAPACITY", 10_000))
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    seq: int
+    record: Dict[str, Any]
+
+
+class FeedGapError(LookupError):
+    """
+    Raised when requested events are older than the retained
+    feed, or the sequence number is past its head.
+    """
+
+
+class ChangeFeed:
+    def __init__(self, capacity: int = DEFAULT_FEED_CAPACITY) -> None:
+        # Ring seq s holds the event with feed seq s + 1
+        self._events = RingBuffer(capacity)
+        self._lock = Lock()
+
+        self._dispatch_lock = RLock()  # callbacks may store results
+        self._delivered = 0
+        self._subscribers: Dict[int, Tuple[int, Callable[[ChangeEvent], None]]] = {}
+        self._ids = itertools.count()
+
+    # --------------------------------------------------
+    # PUBLISH
+    # --------------------------------------------------
+    def publish(self, records: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            append = self._events.append
+            for record in records:
+                append(record)
+
+    @property
+    def position(self) -> int:
+        """Sequence number of the newest event (0 before any)."""
+        with self._lock:
+            return self._events.next_seq
+
+    def since(self, seq: int) -> List[ChangeEvent]:
+        """Retained events with sequence numbers greater than `seq`."""
+        with self._lock:
+            if seq > self._events.next_seq:
+                raise FeedGapError(
+                    f"sequence {seq} is ahead of this feed (head is "
+                    f"{self._events.next_seq}); it restarted or belongs to another worker"
+                )
+            if seq < self._events.first_seq:
+                raise FeedGapError(
+                    f"events after {seq} are no longer retained "
+                    f"(oldest is {self._events.first_seq + 1})"
+                )
+            records = self._events.items(start_seq=seq)
+
+        return [ChangeEvent(seq + 1 + k, record) for k, record in enumerate(records)]
+
+    # --------------------------------------------------
+    # CALLBACKS
+    # --------------------------------------------------
+    def subscribe(self, callback: Callable[[ChangeEvent], None]) -> Callable[[], None]:
+        """
+        Delivers every event published after this call to
+        `callback`. Returns a function that unsubscribes.
+        """
+        key = next(self._ids)
+        with self._dispatch_lock:
+            self._subscribers[key] = (self.position, callback)
+
+        def unsubscribe() -> None:
+            with self._dispatch_lock:
+                self._subscribers.pop(key, None)
+
+        return unsubscribe
+
+    def dispatch(self) -> None:
+        """Delivers pending events to subscribers, in order."""
+        with self._dispatch_lock:
+            if not self._subscribers:
+                self._delivered = self.position
+                return
+
+            try:
+                events = self.since(self._delivered)
+            except FeedGapError:
+                logger.warning("change feed subscribers fell behind; events were dropped")
+                events = self.since(self._events.first_seq)
+
+            for event in events:
+                if event.seq <= self._delivered:
+                    continue  # delivered by a nested dispatch
+                self._delivered = event.seq
+                for start, callback in list(self._subscribers.values()):
+                    if event.seq <= start:
+                        continue
+                    try:
+                        callback(event)
+                    except Exception:
+                        logger.exception("change feed subscriber failed")
+
+    # --------------------------------------------------
+    # ASYNC ITERATION
+    # --------------------------------------------------
+    async def watch(self, since: Optional[int] = None) -> AsyncIterator[ChangeEvent]:
+        """
+        Yields events after `since` (default: from now on), then
+        live events as they are published, without duplicates.
+        """
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[ChangeEvent]" = asyncio.Queue()
+        last = self.position if since is None else since
+
+        # Subscribed before the catch-up read so nothing falls between
+        unsubscribe = self.subscribe(
+            lambda event: loop.call_soon_threadsafe(queue.put_nowait, event)
+        )
+
+        try:
+            for event in self.since(last):
+                last = event.seq
+                yield event
+
+            while True:
+                event = await queue.get()
+                if event.seq > last:
+                    last = event.seq
+                    yield event
+        finally:
+            unsubscribe()
@@ -0,0 +1,67 @@
+# ==========================================
+# PATH: data_core/frozen.py
+# DESCRIPTION: Immutable Record Types (Share-Without-Copy Snapshots)
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ==========================================
+
+from typing import Any, NoReturn
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict.
+
+    Stays a real `dict` (JSON / FastAPI serialization and
+    isinstance checks keep working) but rejects every mutation,
+    so one instance can be shared by any number of readers.
+    """
+
+    __slots__ = ()
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("data_core records are immutable")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenDict":
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+# Immutable leaf types returned without further checks
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def freeze(value: Any) -> Any:
+    """
+    Deep, immutable copy of a JSON-like value:
+    dict -> FrozenDict, list/tuple -> tuple, set -> frozenset.
+    Scalars are shared as-is.
+    """
+
+    if type(value) in _SCALARS:
+        return value
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({
+            key: item if type(item) in _SCALARS else freeze(item)
+            for key, item in value.items()
+        })
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    return value
@@ -0,0 +1,347 @@
+# ==========================================
+# PATH: data_core/persistence.py
+# DESCRIPTION: Durable Persistence Backends for data_core
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ==========================================
+
+"""
+Pluggable persistence behind the in-memory result store.
+
+Backends (FBC_DATA_CORE_BACKEND):
+- "memory" (default): no persistence, previous behavior
+- "log": append-only JSON-lines log + periodic snapshots
+  (serialized on a background thread); startup loads the
+  snapshot and replays only the log tail. Single writer
+  process.
+- "sqlite": WAL-mode table shared by every worker process;
+  reads pull rows written by other workers before answering.
+
+The in-memory ring buffer and its indexes remain the serving
+layer; a backend only has to persist and recover records.
+
+Durability ("durable" backends): a stored record survives a
+crash of the Python process. By default writes reach the OS
+page cache only (log: no fsync; sqlite: synchronous=NORMAL),
+so an OS crash or power loss can drop the newest acknowledged
+records. FBC_DATA_CORE_FSYNC=1 fsyncs every log append and
+runs SQLite with synchronous=FULL, extending the guarantee to
+power loss at the cost of one disk flush per commit.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from data_core.frozen import freeze
+
+# --------------------------------------------------
+# BACKEND CONFIGURATION
+# --------------------------------------------------
+BACKEND_MEMORY = "memory"
+BACKEND_LOG = "log"
+BACKEND_SQLITE = "sqlite"
+
+DEFAULT_BACKEND = os.getenv("FBC_DATA_CORE_BACKEND", BACKEND_MEMORY)
+DEFAULT_PATH = Path(os.getenv("FBC_DATA_CORE_PATH", Path(__file__).resolve().parent / "store"))
+DEFAULT_SNAPSHOT_EVERY = int(os.getenv("FBC_DATA_CORE_SNAPSHOT_EVERY", 10_000))
+DEFAULT_FSYNC = os.getenv("FBC_DATA_CORE_FSYNC", "0") == "1"
+
+SNAPSHOT_SCHEMA_VERSION = "DATA-CORE-SNAPSHOT-v1"
+
+
+def _encode(record: Dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":"))
+
+
+def _decode(raw: str) -> Dict[str, Any]:
+    return freeze(json.loads(raw))
+
+
+# --------------------------------------------------
+# IN-MEMORY (NO PERSISTENCE)
+# --------------------------------------------------
+class MemoryBackend:
+    kind = BACKEND_MEMORY
+    # True: store calls return once the record is written
+    # (process-crash safe; power-loss safe with fsync)
+    durable = False
+
+    def load(self, capacity: int) -> List[Dict[str, Any]]:
+        return []
+
+    def append(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Persists `records`; returns the records to add to memory."""
+        return records
+
+    def refresh(self) -> List[Dict[str, Any]]:
+        """Records persisted by other processes since the last call."""
+        return []
+
+    def snapshot_due(self) -> bool:
+        return False
+
+    def snapshot(self, records: List[Dict[str, Any]]) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+# --------------------------------------------------
+# APPEND-ONLY LOG + SNAPSHOTS
+# --------------------------------------------------
+class LogSnapshotBackend(MemoryBackend):
+    """
+    Each record is one line of `results.<generation>.log`.
+
+    A snapshot holds the store's live records and names the
+    log generation that continues after it. Taking one starts
+    a new, empty generation at once (under the store lock) and
+    writes the file on a background thread. Older logs are
+    deleted only once that file is in place, and recovery
+    replays every generation from the snapshot's onwards, so
+    a crash mid-write loses nothing.
+    """
+
+    kind = BACKEND_LOG
+    durable = True
+
+    def __init__(
+        self,
+        root: Path,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+        fsync: bool = DEFAULT_FSYNC,
+    ) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.snapshot_path = self.root / "results.snapshot.json"
+
+        self._snapshot_every = snapshot_every
+        self._fsync = fsync
+        self._since_snapshot = 0
+        self._generation = 0
+        self._log = None
+
+        self._write_lock = threading.Lock()
+        self._written_generation = 0
+        self._writers: List[threading.Thread] = []
+
+    def _log_path(self, generation: int) -> Path:
+        return self.root / f"results.{generation:06d}.log"
+
+    # --------------------------------------------------
+    # RECOVERY
+    # --------------------------------------------------
+    def load(self, capacity: int) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            self._generation = self._written_generation = snapshot["log_generation"]
+            records = [freeze(record) for record in snapshot["records"]]
+
+        path = self._log_path(self._generation)
+        while True:
+            valid_bytes = 0
+            if path.exists():
+                with open(path, "rb") as f:
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            break  # torn trailing write
+                        records.append(_decode(line.decode("utf-8")))
+                        valid_bytes += len(line)
+                        self._since_snapshot += 1
+
+            # A newer generation means its snapshot never landed
+            following = self._log_path(self._generation + 1)
+            if not following.exists():
+                break
+            self._generation += 1
+            path = following
+
+        self._open_log(truncate_to=valid_bytes)
+        return records[-capacity:]
+
+    def _open_log(self, truncate_to: Optional[int] = None) -> None:
+        if self._log is not None:
+            self._log.close()
+
+        path = self._log_path(self._generation)
+        self._log = open(path, "ab")
+        if truncate_to is not None and self._log.tell() > truncate_to:
+            self._log.truncate(truncate_to)
+
+    # --------------------------------------------------
+    # WRITE
+    # --------------------------------------------------
+    def append(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if self._log is None:
+            self._open_log()
+
+        lines = "".join(_encode(record) + "\n" for record in records)
+        self._log.write(lines.encode("utf-8"))
+        self._log.flush()
+        if self._fsync:
+            os.fsync(self._log.fileno())
+
+        self._since_snapshot += len(records)
+        return records
+
+    def snapshot_due(self) -> bool:
+        return self._since_snapshot >= self._snapshot_every
+
+    def snapshot(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Continues the log in a fresh generation and writes
+        `records` (the live store, immutable) as the snapshot
+        leading into it on a background thread, so the caller's
+        lock is not held while they are serialized.
+        """
+        generation = self._generation + 1
+        self._generation = generation
+        self._since_snapshot = 0
+        self._open_log()
+
+        writer = threading.Thread(
+            target=self._write_snapshot,
+            args=(generation, records),
+            name=f"data-core-snapshot-{generation}",
+            daemon=True,
+        )
+        self._writers = [t for t in self._writers if t.is_alive()]
+        self._writers.append(writer)
+        writer.start()
+
+    def _write_snapshot(self, generation: int, records: List[Dict[str, Any]]) -> None:
+        payload = {
+            "schema": SNAPSHOT_SCHEMA_VERSION,
+            "log_generation": generation,
+            "records": records,
+        }
+
+        with self._write_lock:
+            if generation <= self._written_generation:
+                return  # a newer snapshot already landed
+
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=self.root,
+                delete=False,
+            ) as tmp:
+                json.dump(payload, tmp, separators=(",", ":"))
+                tmp.flush()
+                os.fsync(tmp.fileno())
+                tmp_name = tmp.name
+
+            os.replace(tmp_name, self.snapshot_path)
+            self._written_generation = generation
+
+            for old in range(generation - 1, -1, -1):
+                path = self._log_path(old)
+                if not path.exists():
+                    break
+                path.unlink()
+
+    def close(self) -> None:
+        for writer in self._writers:
+            writer.join()
+        self._writers = []
+
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+# --------------------------------------------------
+# SQLITE (SHARED BY WORKER PROCESSES)
+# --------------------------------------------------
+class SQLiteBackend(MemoryBackend):
+    """
+    Every record is a row; the autoincrement id orders records
+    across processes. Each process tracks the last id it has
+    loaded and pulls newer rows on write and before reads.
+    """
+
+    kind = BACKEND_SQLITE
+    durable = True
+
+    def __init__(self, root: Path, fsync: bool = DEFAULT_FSYNC) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.path = self.root / "results.db"
+
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # NORMAL in WAL mode: commits survive a process crash, not power loss
+        self._conn.execute(f"PRAGMA synchronous={'FULL' if fsync else 'NORMAL'}")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                id            INTEGER PRIMARY KEY AUTOINCREMENT,
+                engine        TEXT NOT NULL,
+                timestamp_utc TEXT NOT NULL,
+                body          TEXT NOT NULL
+            )
+            """
+        )
+        self._last_id = 0
+
+    def load(self, capacity: int) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT id, body FROM results ORDER BY id DESC LIMIT ?", (capacity,)
+        ).fetchall()
+        rows.reverse()
+
+        if rows:
+            self._last_id = rows[-1][0]
+        return [_decode(body) for _, body in rows]
+
+    def append(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.executemany(
+                "INSERT INTO results (engine, timestamp_utc, body) VALUES (?, ?, ?)",
+                [
+                    (record["engine"], record["timestamp_utc"], _encode(record))
+                    for record in records
+                ],
+            )
+        return self.refresh()
+
+    def refresh(self) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT id, body FROM results WHERE id > ? ORDER BY id",
+            (self._last_id,),
+        ).fetchall()
+
+        if rows:
+            self._last_id = rows[-1][0]
+        return [_decode(body) for _, body in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+# --------------------------------------------------
+# FACTORY
+# --------------------------------------------------
+def open_backend(kind: Optional[str] = None, root: Optional[Path] = None):
+    kind = kind or DEFAULT_BACKEND
+    root = Path(root or DEFAULT_PATH)
+
+    if kind == BACKEND_MEMORY:
+        return MemoryBackend()
+    if kind == BACKEND_LOG:
+        return LogSnapshotBackend(root)
+    if kind == BACKEND_SQLITE:
+        return SQLiteBackend(root)
+
+    raise ValueError(f"Unsupported data_core backend: {kind}")
@@ -0,0 +1,184 @@
+# ==========================================
+# PATH: data_core/query.py
+# DESCRIPTION: Secondary Indexes & Cursor Pagination for data_core
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ==========================================
+
+import base64
+import bisect
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from data_core.ring_buffer import RingBuffer
+
+TimeBound = Union[datetime, str, None]
+
+ORDER_ASC = "asc"
+ORDER_DESC = "desc"
+
+_CURSOR_VERSION = "v1"
+
+
+# --------------------------------------------------
+# TIME & CURSOR ENCODING
+# --------------------------------------------------
+def to_epoch(value: Union[datetime, str]) -> float:
+    """ISO-8601 string or datetime -> UTC epoch seconds (naive = UTC)."""
+
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return value.timestamp()
+
+
+def encode_cursor(order: str, seq: int) -> str:
+    raw = f"{_CURSOR_VERSION}:{order}:{seq}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, order: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        version, cursor_order, seq = (
+            base64.urlsafe_b64decode(padded).decode("ascii").split(":")
+        )
+        if version != _CURSOR_VERSION or cursor_order != order:
+            raise ValueError
+        return int(seq)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("invalid or mismatched cursor") from None
+
+
+# --------------------------------------------------
+# SECONDARY INDEXES
+# --------------------------------------------------
+class _SeqList:
+    """Ascending sequence numbers with O(1) amortized pops from the front."""
+
+    __slots__ = ("seqs", "head")
+
+    def __init__(self) -> None:
+        self.seqs: List[int] = []
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.seqs) - self.head
+
+    def pop_front(self) -> None:
+        self.head += 1
+        if self.head >= 1024 and self.head * 2 >= len(self.seqs):
+            del self.seqs[: self.head]
+            self.head = 0
+
+
+class ResultIndex:
+    """
+    Per-engine and timestamp indexes over a RingBuffer's
+    sequence numbers. Maintained under the store lock.
+
+    Index timestamps are clamped to be non-decreasing in
+    insert order, so time ranges resolve by binary search.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._times = RingBuffer(capacity)
+        self._engines: Dict[str, _SeqList] = {}
+        self._last_stamp: Tuple[Optional[str], float] = (None, 0.0)
+
+    def add(self, seq: int, record: Dict[str, Any]) -> None:
+        stamp = record["timestamp_utc"]
+        if stamp == self._last_stamp[0]:
+            moment = self._last_stamp[1]  # batches share one timestamp
+        else:
+            moment = to_epoch(stamp)
+            self._last_stamp = (stamp, moment)
+
+        if len(self._times):
+            moment = max(moment, self._times.get(self._times.next_seq - 1))
+
+        self._times.append(moment)
+        self._engines.setdefault(record["engine"], _SeqList()).seqs.append(seq)
+
+    def evict(self, record: Dict[str, Any]) -> None:
+        """Drops the oldest entry (the record the ring just evicted)."""
+        seqs = self._engines[record["engine"]]
+        seqs.pop_front()
+        if not seqs:
+            del self._engines[record["engine"]]
+
+    def engines(self) -> List[str]:
+        return sorted(self._engines)
+
+    def select(
+        self,
+        ring: RingBuffer,
+        engine: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+    ) -> Tuple[Sequence[int], int, int]:
+        """
+        (ascending seq sequence, lo, hi): the matching sequence
+        numbers are seqs[lo:hi].
+        """
+        if engine is not None:
+            entry = self._engines.get(engine)
+            if entry is None:
+                return [], 0, 0
+            seqs: Sequence[int] = entry.seqs
+            lo, hi = entry.head, len(entry.seqs)
+        else:
+            seqs = range(ring.first_seq, ring.next_seq)
+            lo, hi = 0, len(seqs)
+
+        key = self._times.get
+        if since is not None:
+            lo = bisect.bisect_left(seqs, to_epoch(since), lo, hi, key=key)
+        if until is not None:
+            hi = bisect.bisect_right(seqs, to_epoch(until), lo, hi, key=key)
+
+        return seqs, lo, hi
+
+
+# --------------------------------------------------
+# PAGINATION
+# --------------------------------------------------
+def paginate(
+    seqs: Sequence[int],
+    lo: int,
+    hi: int,
+    limit: Optional[int],
+    offset: int,
+    cursor: Optional[str],
+    order: str,
+) -> Tuple[List[int], Optional[str]]:
+    """Selects one page of seqs[lo:hi]; returns (page, next cursor)."""
+
+    if order not in (ORDER_ASC, ORDER_DESC):
+        raise ValueError("order must be 'asc' or 'desc'")
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("limit and offset must be non-negative")
+
+    if cursor is not None:
+        boundary = decode_cursor(cursor, order)
+        if order == ORDER_ASC:
+            lo = max(lo, bisect.bisect_left(seqs, boundary, lo, hi))
+        else:
+            hi = min(hi, bisect.bisect_left(seqs, boundary, lo, hi))
+
+    if order == ORDER_ASC:
+        start = lo + offset
+        stop = hi if limit is None else min(hi, start + limit)
+        page = list(seqs[start:stop]) if start < stop else []
+        more = stop < hi
+        next_cursor = encode_cursor(order, page[-1] + 1) if page and more else None
+    else:
+        stop = hi - offset
+        start = lo if limit is None else max(lo, stop - limit)
+        page = list(seqs[start:stop])[::-1] if start < stop else []
+        more = start > lo
+        next_cursor = encode_cursor(order, page[-1]) if page and more else None
+
+    return page, next_cursor
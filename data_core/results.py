@@ -7,7 +7,7 @@
 from typing import Dict, Any
 from datetime import datetime, timezone
 
-from data_core.core import fetch_all_results
+from data_core.core import fetch_all_results, query_results
 
 # --------------------------------------------------
 # ENTERPRISE CONSTANTS
@@ -38,3 +38,26 @@ def fetch_results_as_dict() -> Dict[str, Any]:
         "results": results,
         "count": len(results),
     }
+
+
+def query_results_as_dict(**filters: Any) -> Dict[str, Any]:
+    """
+    Paginated counterpart of fetch_results_as_dict.
+
+    Accepts the query_results filters (engine, since, until,
+    limit, offset, cursor, order) and adds the same metadata.
+    """
+
+    page = query_results(**filters)
+
+    return {
+        "metadata": {
+            "module": MODULE_NAME,
+            "engine_version": ENGINE_VERSION,
+            "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": page["results"],
+        "count": len(page["results"]),
+        "total": page["total"],
+        "next_cursor": page["next_cursor"],
+    }
@@ -0,0 +1,87 @@
+# ==========================================
+# PATH: data_core/ring_buffer.py
+# DESCRIPTION: Fixed-Capacity Ring Buffer (O(1) Append & Eviction)
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ==========================================
+
+from typing import Any, Iterator, List, Optional
+
+
+class RingBuffer:
+    """
+    Fixed-capacity FIFO store backed by a preallocated slot list.
+
+    Guarantees:
+    - O(1) append; the oldest item is overwritten once full
+    - Every appended item gets a monotonically increasing
+      sequence number; a live item lives in slot `seq % capacity`
+    - Not thread-safe (callers hold their own lock)
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+
+        self._capacity = capacity
+        self._slots: List[Optional[Any]] = [None] * capacity
+        self._next_seq = 0
+
+    # --------------------------------------------------
+    # SIZE & BOUNDS
+    # --------------------------------------------------
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest live item."""
+        return max(0, self._next_seq - self._capacity)
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next append will receive."""
+        return self._next_seq
+
+    def __len__(self) -> int:
+        return self._next_seq - self.first_seq
+
+    # --------------------------------------------------
+    # WRITE
+    # --------------------------------------------------
+    def append(self, item: Any) -> Optional[Any]:
+        """Appends `item`; returns the evicted item, if any."""
+        slot = self._next_seq % self._capacity
+        evicted = self._slots[slot] if self._next_seq >= self._capacity else None
+
+        self._slots[slot] = item
+        self._next_seq += 1
+        return evicted
+
+    def clear(self) -> None:
+        self._slots = [None] * self._capacity
+        self._next_seq = 0
+
+    # --------------------------------------------------
+    # READ
+    # --------------------------------------------------
+    def get(self, seq: int) -> Any:
+        if not self.first_seq <= seq < self._next_seq:
+            raise IndexError(f"sequence {seq} is not in the buffer")
+        return self._slots[seq % self._capacity]
+
+    def items(self, start_seq: Optional[int] = None) -> List[Any]:
+        """Live items from `start_seq` (default: oldest) in FIFO order."""
+        start = max(self.first_seq, start_seq or 0)
+        if start >= self._next_seq:
+            return []
+
+        head = start % self._capacity
+        tail = self._next_seq % self._capacity or self._capacity
+
+        if head < tail:
+            return self._slots[head:tail]
+        return self._slots[head:] + self._slots[:tail]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items())
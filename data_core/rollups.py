@@ -0,0 +1,282 @@
+# ==========================================
+# PATH: data_core/rollups.py
+# DESCRIPTION: Incremental Rollups & Streaming Quantiles
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ==========================================
+
+"""
+Per-engine and per-city rollups maintained on insert.
+
+Every finite numeric top-level payload field gets count, sum,
+min, max and a quantile sketch; NaN and +/-inf are skipped like
+non-numeric values. The sketch buckets values on a logarithmic
+grid (DDSketch layout): every bucket is within
+SKETCH_RELATIVE_ACCURACY of its samples, memory is bounded by
+the value range rather than the count, and batches fold in one
+vectorized pass. Quantiles interpolate linearly between
+adjacent ranks, as numpy.percentile (and aggregate_results)
+does, with the exact min and max at the ends. Rollups are
+cumulative: they
+cover every result stored since startup, including results the
+ring buffer has since evicted.
+"""
+
+import math
+import os
+from collections import Counter
+from numbers import Real
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from data_core.columnar import DEFAULT_PERCENTILES
+
+CITY_FIELD = "city"
+
+SKETCH_RELATIVE_ACCURACY = float(os.getenv("FBC_DATA_CORE_SKETCH_ACCURACY", 0.01))
+
+# Magnitudes below this count as zero
+_MIN_MAGNITUDE = 1e-12
+
+# Fast path ahead of the (slower) numbers.Real ABC check
+_NUMBERS = frozenset({int, float})
+
+
+def _finite(value: Any) -> Optional[float]:
+    """float(value) for finite non-bool reals, else None."""
+    if type(value) not in _NUMBERS and (
+        not isinstance(value, Real) or isinstance(value, bool)
+    ):
+        return None
+    try:
+        number = float(value)
+    except OverflowError:  # int beyond float range
+        return None
+    return number if math.isfinite(number) else None
+
+
+# --------------------------------------------------
+# QUANTILE SKETCH
+# --------------------------------------------------
+class QuantileSketch:
+    """
+    Relative-error quantile sketch: |x| falls in bucket
+    ceil(log_gamma |x|), gamma = (1 + a) / (1 - a); positive and
+    negative values keep separate bucket counts. Non-finite
+    values are ignored.
+    """
+
+    def __init__(self, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Counter = Counter()
+        self._negative: Counter = Counter()
+        self._zero = 0
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, x: float) -> None:
+        if not math.isfinite(x):
+            return
+
+        self.count += 1
+        self.minimum = min(self.minimum, x)
+        self.maximum = max(self.maximum, x)
+        if x > _MIN_MAGNITUDE:
+            self._positive[math.ceil(math.log(x) / self._log_gamma)] += 1
+        elif x < -_MIN_MAGNITUDE:
+            self._negative[math.ceil(math.log(-x) / self._log_gamma)] += 1
+        else:
+            self._zero += 1
+
+    def add_many(self, values: np.ndarray) -> None:
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return
+
+        self.count += len(values)
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        for store, selected in (
+            (self._positive, values[values > _MIN_MAGNITUDE]),
+            (self._negative, -values[values < -_MIN_MAGNITUDE]),
+        ):
+            if len(selected):
+                keys, counts = np.unique(
+                    np.ceil(np.log(selected) / self._log_gamma), return_counts=True
+                )
+                for key, count in zip(keys.astype(np.int64).tolist(), counts.tolist()):
+                    store[key] += count
+        self._zero += int(np.count_nonzero(np.abs(values) <= _MIN_MAGNITUDE))
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _at_rank(self, rank: int) -> float:
+        """Estimate of the sample at `rank` (0-based, ascending)."""
+        if rank == 0:
+            return self.minimum
+        if rank == self.count - 1:
+            return self.maximum
+
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+
+        seen += self._zero
+        if seen > rank:
+            return 0.0
+
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+
+        return self.maximum
+
+    def quantile(self, percentile: float) -> Optional[float]:
+        """
+        Estimate at fractional rank p/100 * (count - 1), linearly
+        interpolated between its neighbours (numpy "linear").
+        """
+        if not self.count:
+            return None
+
+        position = percentile / 100.0 * (self.count - 1)
+        lower = int(position)
+        estimate = self._at_rank(lower)
+        fraction = position - lower
+        if fraction:
+            estimate += fraction * (self._at_rank(lower + 1) - estimate)
+
+        # Bucket midpoints never leave the observed range
+        return min(max(estimate, self.minimum), self.maximum)
+
+
+# --------------------------------------------------
+# RUNNING STATISTICS
+# --------------------------------------------------
+class RunningStats:
+    def __init__(self, percentiles: Sequence[float]) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self._percentiles = tuple(percentiles)
+        self._sketch = QuantileSketch()
+
+    def add_many(self, values: List[float]) -> None:
+        if len(values) == 1:
+            x = values[0]
+            self.count += 1
+            self.total += x
+            self.minimum = min(self.minimum, x)
+            self.maximum = max(self.maximum, x)
+            self._sketch.add(x)
+            return
+
+        array = np.asarray(values, dtype=np.float64)
+        self.count += len(array)
+        self.total += float(array.sum())
+        self.minimum = min(self.minimum, float(array.min()))
+        self.maximum = max(self.maximum, float(array.max()))
+        self._sketch.add_many(array)
+
+    def summary(self) -> Dict[str, float]:
+        summary = {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count,
+            "min": self.minimum,
+            "max": self.maximum,
+        }
+        for p in self._percentiles:
+            summary[f"p{p:g}"] = self._sketch.quantile(p)
+        return summary
+
+
+# --------------------------------------------------
+# ROLLUPS
+# --------------------------------------------------
+class Rollups:
+    """
+    Rollups keyed by engine and by (engine, city). Not
+    thread-safe (callers hold their own lock).
+    """
+
+    def __init__(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> None:
+        self._percentiles = tuple(percentiles)
+        self._engines: Dict[str, Dict[str, Any]] = {}
+        self._cities: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def _group(self, groups: Dict[str, Dict[str, Any]], key: str) -> Dict[str, Any]:
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {"count": 0, "fields": {}}
+        return group
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.add_many([record])
+
+    def add_many(self, records: Sequence[Dict[str, Any]]) -> None:
+        """Folds a batch: one pass to group values, then vectorized stats."""
+        pending: Dict[int, List[Any]] = {}  # id(group) -> [group, {field: values}]
+
+        for record in records:
+            payload = record["payload"]
+            engine = record["engine"]
+            numeric = [
+                (name, number)
+                for name, value in payload.items()
+                for number in (_finite(value),)
+                if number is not None
+            ]
+
+            groups = [self._group(self._engines, engine)]
+            city = payload.get(CITY_FIELD)
+            if isinstance(city, str):
+                groups.append(self._group(self._cities.setdefault(engine, {}), city))
+
+            for group in groups:
+                group["count"] += 1
+                entry = pending.get(id(group))
+                if entry is None:
+                    entry = pending[id(group)] = [group, {}]
+                values = entry[1]
+                for name, value in numeric:
+                    values.setdefault(name, []).append(value)
+
+        for group, values in pending.values():
+            fields = group["fields"]
+            for name, batch in values.items():
+                stats = fields.get(name)
+                if stats is None:
+                    stats = fields[name] = RunningStats(self._percentiles)
+                stats.add_many(batch)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-dict view; size depends on groups, not history."""
+
+        def render(group: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "count": group["count"],
+                "fields": {
+                    name: stats.summary() for name, stats in group["fields"].items()
+                },
+            }
+
+        return {
+            "engines": {
+                engine: render(group) for engine, group in self._engines.items()
+            },
+            "cities": {
+                engine: {city: render(group) for city, group in cities.items()}
+                for engine, cities in self._cities.items()
+            },
+        }
@@ -0,0 +1,100 @@
+# ==========================================
+# PATH: data_sources/async_http.py
+# DESCRIPTION: Minimal Asyncio HTTP/1.1 JSON Client
+# VERSION: v1.0.0-LTS
+# CLASSIFICATION: ENTERPRISE_CRITICAL
+# CONTRACT: ASYNC_TRANSPORT_CORE
+# ==========================================
+
+"""
+Non-blocking GET-and-decode-JSON on asyncio streams, for the
+async data_sources providers. Standard library only: one
+request per connection (Connection: close), identity or
+chunked bodies, http and https.
+
+Raises on any failure; providers map exceptions onto their
+deterministic fallbacks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import ssl
+from typing import Any
+from urllib.parse import urlsplit
+
+# --------------------------------------------------
+# MODULE METADATA
+# --------------------------------------------------
+__version__ = "1.0.0-LTS"
+__contract_role__ = "ASYNC_TRANSPORT_CORE"
+
+USER_AGENT = "FBC-DataSources/1.0"
+
+
+class HTTPStatusError(RuntimeError):
+    """Non-2xx response status."""
+
+
+# --------------------------------------------------
+# PUBLIC CONTRACT
+# --------------------------------------------------
+async def fetch_json(url: str, timeout: float) -> Any:
+    """GETs `url` and decodes the JSON body within `timeout` seconds."""
+    return await asyncio.wait_for(_fetch_json(url), timeout)
+
+
+async def _fetch_json(url: str) -> Any:
+    parts = urlsplit(url)
+    secure = parts.scheme == "https"
+    host = parts.hostname or ""
+    port = parts.port or (443 if secure else 80)
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+
+    reader, writer = await asyncio.open_connection(
+        host, port, ssl=ssl.create_default_context() if secure else None
+    )
+    try:
+        writer.write(
+            f"GET {target} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            f"User-Agent: {USER_AGENT}\r\n"
+            "Accept: application/json\r\n"
+            "Connection: close\r\n\r\n".encode("ascii")
+        )
+        await writer.drain()
+
+        head = await reader.readuntil(b"\r\n\r\n")
+        status_line, *header_lines = head.decode("iso-8859-1").split("\r\n")
+        status = int(status_line.split()[1])
+        headers = {
+            name.strip().lower(): value.strip()
+            for name, _, value in (line.partition(":") for line in header_lines if line)
+        }
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await _read_chunked(reader)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+    finally:
+        writer.close()
+
+    if not 200 <= status < 300:
+        raise HTTPStatusError(f"GET {url} returned {status}")
+
+    return json.loads(body)
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size = int((await reader.readline()).split(b";")[0], 16)
+        if size == 0:
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readline()  # CRLF after each chunk
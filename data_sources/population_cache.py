@@ -0,0 +1,121 @@
+# ==========================================
+# PATH: data_sources/population_cache.py
+# DESCRIPTION: On-Disk TTL Cache for Population Lookups
+# VERSION: v1.0.0-LTS
+# CLASSIFICATION: ENTERPRISE_CRITICAL
+# CONTRACT: POPULATION_CACHE_CORE
+# ==========================================
+
+"""
+Keeps World Bank population values on disk so repeated runs
+(and every process of a pool) skip the network until an entry
+is older than the TTL.
+
+File layout (JSON, replaced atomically on every write):
+    {"schema": 1, "entries": {"EG": {"population": int,
+                                      "fetched_at": epoch_s}}}
+
+The file is read on first use, never at import. Only real
+provider values are stored; fallbacks are not cached.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, Mapping, Optional
+
+# --------------------------------------------------
+# MODULE METADATA
+# --------------------------------------------------
+__version__ = "1.0.0-LTS"
+__contract_role__ = "POPULATION_CACHE_CORE"
+
+# --------------------------------------------------
+# CONFIGURATION
+# --------------------------------------------------
+CACHE_SCHEMA_VERSION = 1
+DEFAULT_CACHE_PATH = Path(
+    os.getenv(
+        "FBC_POPULATION_CACHE_PATH",
+        Path(__file__).resolve().parent / "cache" / "population.json",
+    )
+)
+DEFAULT_TTL_SECONDS = float(os.getenv("FBC_POPULATION_CACHE_TTL", 7 * 24 * 3600))
+
+
+# --------------------------------------------------
+# CACHE
+# --------------------------------------------------
+class PopulationCache:
+    """Thread-safe country code -> population cache with a TTL."""
+
+    def __init__(
+        self,
+        path: os.PathLike = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        self._entries: Optional[Dict[str, Dict[str, float]]] = None
+
+    def _loaded(self) -> Dict[str, Dict[str, float]]:
+        # Caller holds self._lock
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                entries = data["entries"] if data.get("schema") == CACHE_SCHEMA_VERSION else {}
+            except (OSError, ValueError, KeyError, AttributeError):
+                entries = {}  # missing or unreadable: start empty
+            self._entries = entries
+        return self._entries
+
+    def get(self, country_code: str) -> Optional[int]:
+        """Cached population, or None when absent or expired."""
+        return self.get_many([country_code]).get(country_code)
+
+    def get_many(self, country_codes: Iterable[str]) -> Dict[str, int]:
+        """Fresh entries among `country_codes`."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            entries = self._loaded()
+            return {
+                code: int(entry["population"])
+                for code in country_codes
+                for entry in (entries.get(code),)
+                if entry is not None and entry["fetched_at"] >= cutoff
+            }
+
+    def put_many(self, populations: Mapping[str, int]) -> None:
+        """Stores fetched values and rewrites the file once."""
+        if not populations:
+            return
+
+        now = time.time()
+        with self._lock:
+            entries = self._loaded()
+            for code, population in populations.items():
+                entries[code] = {"population": int(population), "fetched_at": now}
+            try:
+                self._write(entries)
+            except OSError:
+                pass  # unwritable path: the cache stays in memory only
+
+    def _write(self, entries: Dict[str, Dict[str, float]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=self.path.parent,
+            delete=False,
+        ) as tmp:
+            json.dump({"schema": CACHE_SCHEMA_VERSION, "entries": entries}, tmp)
+            tmp_name = tmp.name
+
+        os.replace(tmp_name, self.path)
@@ -14,6 +14,8 @@ from __future__ import annotations
 from typing import Dict
 import requests
 
+from data_sources.async_http import fetch_json
+
 # --------------------------------------------------
 # MODULE METADATA
 # --------------------------------------------------
@@ -77,26 +79,29 @@ def fetch_population(country_code: str) -> Dict[str, int]:
         response = requests.get(url, timeout=DEFAULT_TIMEOUT_SECONDS)
         response.raise_for_status()
 
-        payload = response.json()
+        return _parse_population_payload(response.json())
+
+    except Exception:
+        # Hard deterministic fallback
+        return _fallback_population("NETWORK_OR_API_FAILURE")
 
-        if not payload or len(payload) < 2 or not payload[1]:
-            return _fallback_population("EMPTY_PAYLOAD")
 
-        latest_entry = payload[1][0]
-        value = latest_entry.get("value")
+async def fetch_population_async(country_code: str) -> Dict[str, int]:
+    """
+    Non-blocking fetch_population: same contract, same
+    fallbacks, awaitable alongside other lookups.
+    """
+
+    if not country_code or not isinstance(country_code, str):
+        return _fallback_population("INVALID_COUNTRY_CODE")
 
-        if value is None:
-            return _fallback_population("MISSING_VALUE")
+    url = WORLD_BANK_BASE_URL.format(country_code.upper())
 
-        return {
-            "population": int(value),
-            "provider": "WORLD_BANK",
-            "confidence": "HIGH",
-            "data_mode": REALTIME_MODE
-        }
+    try:
+        payload = await fetch_json(url, DEFAULT_TIMEOUT_SECONDS)
+        return _parse_population_payload(payload)
 
     except Exception:
-        # Hard deterministic fallback
         return _fallback_population("NETWORK_OR_API_FAILURE")
 
 # --------------------------------------------------
@@ -113,6 +118,23 @@ def get_country_population(country_code: str) -> int:
 # --------------------------------------------------
 # INTERNAL HELPERS
 # --------------------------------------------------
+def _parse_population_payload(payload) -> Dict[str, int]:
+    if not payload or len(payload) < 2 or not payload[1]:
+        return _fallback_population("EMPTY_PAYLOAD")
+
+    latest_entry = payload[1][0]
+    value = latest_entry.get("value")
+
+    if value is None:
+        return _fallback_population("MISSING_VALUE")
+
+    return {
+        "population": int(value),
+        "provider": "WORLD_BANK",
+        "confidence": "HIGH",
+        "data_mode": REALTIME_MODE
+    }
+
 def _fallback_population(reason: str) -> Dict[str, int]:
     fallback = DEFAULT_POPULATION_RESPONSE.copy()
     fallback["fallback_reason"] = reason
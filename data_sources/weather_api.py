@@ -14,6 +14,8 @@ from __future__ import annotations
 from typing import Dict
 import requests
 
+from data_sources.async_http import fetch_json
+
 # --------------------------------------------------
 # MODULE METADATA
 # --------------------------------------------------
@@ -25,6 +27,7 @@ __contract_role__ = "WEATHER_DATA_PROVIDER_CORE"
 # CONFIGURATION
 # --------------------------------------------------
 WEATHER_PROVIDER = "OPEN_METEO"
+OPEN_METEO_BASE_URL = "https://api.open-meteo.com/v1/forecast"
 DEFAULT_TIMEOUT_SECONDS = 4
 
 # Explicit operating mode for audit & CI
@@ -80,29 +83,53 @@ def get_live_weather(city_name: str) -> Dict[str, float]:
     if city_name not in CITY_COORDS:
         return _fallback_weather("UNKNOWN_CITY")
 
-    lat, lon = CITY_COORDS[city_name]
-
-    url = (
-        "https://api.open-meteo.com/v1/forecast"
-        f"?latitude={lat}&longitude={lon}&current_weather=true"
-    )
-
     try:
-        response = requests.get(url, timeout=DEFAULT_TIMEOUT_SECONDS)
+        response = requests.get(_weather_url(city_name), timeout=DEFAULT_TIMEOUT_SECONDS)
         response.raise_for_status()
 
-        payload = response.json()
-        current = payload.get("current_weather")
+        return _parse_weather_payload(response.json())
+
+    except Exception:
+        # Hard deterministic fallback (audit + CI safe)
+        return _fallback_weather("NETWORK_FAILURE")
+
 
-        if not current or "weathercode" not in current:
-            return _fallback_weather("INVALID_PAYLOAD")
+async def get_live_weather_async(city_name: str) -> Dict[str, float]:
+    """
+    Non-blocking get_live_weather: same contract, same
+    fallbacks, awaitable alongside other lookups.
+    """
 
-        return _map_weather_code(current["weathercode"])
+    if city_name not in CITY_COORDS:
+        return _fallback_weather("UNKNOWN_CITY")
+
+    try:
+        payload = await fetch_json(_weather_url(city_name), DEFAULT_TIMEOUT_SECONDS)
+        return _parse_weather_payload(payload)
 
     except Exception:
-        # Hard deterministic fallback (audit + CI safe)
         return _fallback_weather("NETWORK_FAILURE")
 
+
+# --------------------------------------------------
+# REQUEST & PAYLOAD HELPERS
+# --------------------------------------------------
+def _weather_url(city_name: str) -> str:
+    lat, lon = CITY_COORDS[city_name]
+    return (
+        OPEN_METEO_BASE_URL
+        + f"?latitude={lat}&longitude={lon}&current_weather=true"
+    )
+
+
+def _parse_weather_payload(payload: Dict) -> Dict[str, float]:
+    current = payload.get("current_weather")
+
+    if not current or "weathercode" not in current:
+        return _fallback_weather("INVALID_PAYLOAD")
+
+    return _map_weather_code(current["weathercode"])
+
 # --------------------------------------------------
 # WEATHER CODE NORMALIZATION
 # --------------------------------------------------
@@ -1,101 +1,324 @@
 # =========================================================
 # PATH: /run_simulation.py
 # DESCRIPTION: Global Simulation Execution Engine
-# VERSION: v2.1.0 (ENTERPRISE STABLE)
+# VERSION: v3.0.0 (ENTERPRISE STABLE)
 # CLASSIFICATION: PRODUCTION / AUDIT / CI-SAFE
 # ROLE: Deterministic Orchestrator for City-Level AI Engines
 # DATA MODE: REALISTIC-DETERMINISTIC
 # =========================================================
 
-from typing import List, Dict
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
+from functools import partial
+from itertools import repeat
+from typing import List, Dict, Optional, Sequence
 
-from simulation_config import CITY_NODES, SIMULATION_YEARS
-from Projects.Project_I_Urban_Revenue.revenue_optimizer import RevenueOptimizer
-from Projects.Project_II_Private_Districts.energy_forecast import predict_energy_savings
-from Projects.Project_III_Traffic_Intelligence.accident_pred import TrafficRiskEngine
-from data_core import store_simulation_result
+import numpy as np
+
+from simulation_config import (
+    CITY_NODES,
+    SIMULATION_YEARS,
+    CityNode,
+    prefetch_populations,
+    prefetch_populations_async,
+)
+from simulation_engine import (
+    CityBatch,
+    manifest_city_nodes,
+    simulate_horizon,
+    synthetic_city_nodes,
+    weather_factors,
+)
+from data_core import store_simulation_results
+from data_sources.weather_api import get_live_weather_async
+
+
+# ---------------------------------------------------------
+# CONFIGURATION
+# ---------------------------------------------------------
+SIMULATION_ENGINE = "GLOBAL_SIMULATION"
+SIMULATION_SYNTHETIC_NODES: int = int(os.getenv("SIMULATION_SYNTHETIC_NODES", 0))
+STORE_BATCH_SIZE: int = 10_000
+
+EXECUTORS = ("vector", "serial", "thread", "process")
+SIMULATION_EXECUTOR: str = os.getenv("SIMULATION_EXECUTOR", "vector")
+SIMULATION_WORKERS: Optional[int] = int(os.getenv("SIMULATION_WORKERS", 0)) or None
+
+# Max external lookups in flight for run_global_simulation_async
+SIMULATION_CONCURRENCY: int = int(os.getenv("SIMULATION_CONCURRENCY", 16))
+
+
+# =========================================================
+# NODE SELECTION
+# =========================================================
+def default_city_nodes(synthetic_nodes: int = SIMULATION_SYNTHETIC_NODES) -> List[CityNode]:
+    """
+    Configured CITY_NODES, then every manifest city not already
+    configured, then `synthetic_nodes` synthetic nodes.
+    """
+    nodes = list(CITY_NODES)
+    nodes.extend(manifest_city_nodes(CITY_NODES))
+    if synthetic_nodes:
+        nodes.extend(synthetic_city_nodes(synthetic_nodes))
+    return nodes
+
+
+# =========================================================
+# RESULT ROWS
+# =========================================================
+def _result_rows(
+    batch: CityBatch,
+    years: int,
+    executed_at: str,
+    weather: Optional[np.ndarray] = None,
+) -> List[Dict[str, object]]:
+    """Simulates `batch` over `years` years; one result row per node."""
+    horizon = simulate_horizon(batch, years=years, weather=weather)
+
+    start_year = int(horizon.years[0])
+    end_year = int(horizon.years[-1])
+
+    columns = zip(
+        batch.names,
+        batch.population.tolist(),
+        horizon.revenue_gain[:, 0].tolist(),
+        horizon.energy_savings[:, 0].tolist(),
+        horizon.risk_score[:, 0].tolist(),
+        horizon.revenue_gain[:, -1].tolist(),
+        horizon.energy_savings[:, -1].tolist(),
+        horizon.risk_score[:, -1].tolist(),
+        horizon.revenue_gain.sum(axis=1).tolist(),
+        horizon.energy_savings.sum(axis=1).tolist(),
+    )
+
+    return [
+        {
+            "city": name,
+            "simulation_years": years,
+            "start_year": start_year,
+            "end_year": end_year,
+            "population": population,
+            "revenue_gain": revenue_gain,
+            "energy_savings": energy_savings,
+            "risk_score": risk_score,
+            "final_revenue_gain": final_revenue_gain,
+            "final_energy_savings": final_energy_savings,
+            "final_risk_score": final_risk_score,
+            "cumulative_revenue_gain": cumulative_revenue_gain,
+            "cumulative_energy_savings": cumulative_energy_savings,
+            "executed_at": executed_at,
+            "data_mode": "REALISTIC-DETERMINISTIC"
+        }
+        for (
+            name, population,
+            revenue_gain, energy_savings, risk_score,
+            final_revenue_gain, final_energy_savings, final_risk_score,
+            cumulative_revenue_gain, cumulative_energy_savings,
+        ) in columns
+    ]
+
+
+def simulate_city(
+    node: CityNode,
+    years: int,
+    executed_at: str,
+    weather: Optional[float] = None,
+    population: Optional[int] = None,
+) -> Dict[str, object]:
+    """
+    One city in isolation, timed. Weather and population are
+    looked up here unless passed in already resolved.
+    Top-level so process pools can pickle it.
+    """
+    started = time.perf_counter()
+    batch = CityBatch.from_nodes([node])
+    if population is not None:
+        batch = replace(batch, population=np.array([population], dtype=np.int64))
+    [result] = _result_rows(
+        batch,
+        years,
+        executed_at,
+        weather=None if weather is None else np.array([weather]),
+    )
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return result
+
+
+def _run_per_city(
+    nodes: Sequence[CityNode],
+    years: int,
+    executed_at: str,
+    executor: str,
+    workers: Optional[int],
+) -> List[Dict[str, object]]:
+    """Fans cities out per `executor`; results keep node order."""
+    task = partial(simulate_city, years=years, executed_at=executed_at)
+
+    if executor == "serial":
+        return [task(node) for node in nodes]
+
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(task, nodes))
+
+    # Workers need not share this process's state (spawn and
+    # forkserver start fresh), so lookups resolve here and ship
+    # with each node; workers only compute
+    weather = weather_factors([node.name for node in nodes]).tolist()
+    populations = [node.population for node in nodes]
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Chunks amortize pickling; map() still yields in order
+        chunksize = max(1, len(nodes) // (workers * 4))
+        return list(pool.map(
+            simulate_city,
+            nodes,
+            repeat(years),
+            repeat(executed_at),
+            weather,
+            populations,
+            chunksize=chunksize,
+        ))
 
 
 # =========================================================
 # GLOBAL SIMULATION ORCHESTRATOR
 # =========================================================
-def run_global_simulation() -> List[Dict[str, object]]:
+def run_global_simulation(
+    nodes: Optional[Sequence[CityNode]] = None,
+    persist: bool = True,
+    years: int = SIMULATION_YEARS,
+    executor: str = SIMULATION_EXECUTOR,
+    workers: Optional[int] = SIMULATION_WORKERS,
+) -> List[Dict[str, object]]:
     """
     Executes a deterministic global simulation across all
-    configured city nodes.
+    city nodes (default_city_nodes() when omitted), stepped
+    over `years` simulated years.
+
+    revenue_gain, energy_savings and risk_score describe the
+    start year; final_* the last year and cumulative_* the
+    whole horizon.
+
+    executor:
+    - "vector":  all nodes in one NumPy batch (default)
+    - "serial":  one city at a time
+    - "thread":  cities across a thread pool (overlaps the
+                 blocking weather lookups)
+    - "process": cities across a process pool (weather and
+                 population resolved up front, in this process)
+    Per-city modes add "elapsed_ms" to each row; `workers`
+    sizes the pool (None = executor default).
 
     Guarantees:
     - No randomness
     - No shared mutable state
-    - City-level isolation
-    - Audit-safe outputs
+    - City-level isolation (each row depends only on its node)
+    - Audit-safe outputs, one per node, in node order,
+      identical across executors apart from elapsed_ms
     """
 
-    results: List[Dict[str, object]] = []
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+
+    if nodes is None:
+        nodes = default_city_nodes()
+
     execution_timestamp: str = datetime.utcnow().isoformat() + "Z"
 
-    for city in CITY_NODES:
-        # -------------------------------------------------
-        # Revenue Optimization Engine
-        # -------------------------------------------------
-        revenue_engine = RevenueOptimizer(city.name)
-        revenue_result = revenue_engine.project_incremental_gain(
-            base_revenue=city.base_revenue
-        )
-
-        # -------------------------------------------------
-        # Energy Optimization Engine
-        # -------------------------------------------------
-        energy_result = predict_energy_savings(
-            city.base_energy_bill
-        )
-
-        # -------------------------------------------------
-        # Traffic Risk Intelligence Engine
-        # -------------------------------------------------
-        traffic_engine = TrafficRiskEngine(city.name)
-        traffic_result = traffic_engine.analyze_real_time_risk(
-            city.base_traffic_density
-        )
-
-        # -------------------------------------------------
-        # Normalize Outputs (Strict Casting)
-        # -------------------------------------------------
-        revenue_gain: float = float(
-            revenue_result.get("Total_City_Gain", 0.0)
-        )
-        energy_savings: float = float(
-            energy_result.get("ai_predicted_savings", 0.0)
-        )
-        risk_score: float = float(
-            traffic_result.get("risk_score", 0.0)
-        )
-
-        # -------------------------------------------------
-        # Persist Results (Deterministic Side-Effect)
-        # -------------------------------------------------
-        store_simulation_result(
-            city=city.name,
-            revenue_gain=revenue_gain,
-            energy_savings=energy_savings,
-            risk_score=risk_score,
-            executed_at=execution_timestamp
-        )
-
-        # -------------------------------------------------
-        # Append Structured Result
-        # -------------------------------------------------
-        results.append({
-            "city": city.name,
-            "simulation_years": SIMULATION_YEARS,
-            "population": city.population,
-            "revenue_gain": revenue_gain,
-            "energy_savings": energy_savings,
-            "risk_score": risk_score,
-            "executed_at": execution_timestamp,
-            "data_mode": "REALISTIC-DETERMINISTIC"
-        })
+    # One bulk lookup instead of one per node.population read
+    prefetch_populations(node.country_code for node in nodes)
+
+    # -------------------------------------------------
+    # Engines (Revenue, Energy, Traffic)
+    # -------------------------------------------------
+    if executor == "vector":
+        results = _result_rows(CityBatch.from_nodes(nodes), years, execution_timestamp)
+    else:
+        results = _run_per_city(nodes, years, execution_timestamp, executor, workers)
+
+    # -------------------------------------------------
+    # Persist Results (Bulk, Deterministic Side-Effect)
+    # -------------------------------------------------
+    if persist:
+        _persist(results)
+
+    return results
+
+
+def _persist(results: List[Dict[str, object]]) -> None:
+    for start in range(0, len(results), STORE_BATCH_SIZE):
+        store_simulation_results([
+            (SIMULATION_ENGINE, result)
+            for result in results[start: start + STORE_BATCH_SIZE]
+        ])
+
+
+# =========================================================
+# ASYNC ORCHESTRATOR (CONCURRENT EXTERNAL LOOKUPS)
+# =========================================================
+async def gather_external_data(
+    nodes: Sequence[CityNode],
+    concurrency: int = SIMULATION_CONCURRENCY,
+) -> np.ndarray:
+    """
+    Weather factor per node, with every external lookup in
+    flight together: one weather call per distinct city and
+    a population prefetch (into the population cache) per
+    distinct country, at most `concurrency` at a time.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def weather(name: str) -> float:
+        async with semaphore:
+            return float((await get_live_weather_async(name))["weather_factor"])
+
+    names = list(dict.fromkeys(node.name for node in nodes))
+
+    factors, _ = await asyncio.gather(
+        asyncio.gather(*(weather(name) for name in names)),
+        prefetch_populations_async((node.country_code for node in nodes), semaphore),
+    )
+
+    by_name = dict(zip(names, factors))
+    return np.array([by_name[node.name] for node in nodes], dtype=np.float64)
+
+
+async def run_global_simulation_async(
+    nodes: Optional[Sequence[CityNode]] = None,
+    persist: bool = True,
+    years: int = SIMULATION_YEARS,
+    concurrency: int = SIMULATION_CONCURRENCY,
+) -> List[Dict[str, object]]:
+    """
+    run_global_simulation with every external lookup (weather,
+    population) gathered concurrently first, so wall time is
+    bounded by the slowest call rather than their sum. The
+    engines then run as one vectorized batch.
+    """
+
+    if nodes is None:
+        nodes = default_city_nodes()
+
+    execution_timestamp: str = datetime.utcnow().isoformat() + "Z"
+
+    weather = await gather_external_data(nodes, concurrency)
+
+    # Populations were prefetched: node.population reads hit the cache
+    results = _result_rows(
+        CityBatch.from_nodes(nodes), years, execution_timestamp, weather=weather
+    )
+
+    if persist:
+        await asyncio.to_thread(_persist, results)
 
     return results
 
@@ -7,11 +7,14 @@
 # DATA MODE: REALISTIC-DETERMINISTIC
 # =========================================================
 
-from dataclasses import dataclass
-from typing import List
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import InitVar, dataclass
+from typing import Dict, Iterable, List, Optional, Set
 import os
 
-from data_sources.population_data import get_country_population
+from data_sources.population_cache import PopulationCache
+from data_sources.population_data import fetch_population, fetch_population_async
 
 
 # =========================================================
@@ -27,44 +30,152 @@ class CityNode:
     - Fully immutable (frozen dataclass)
     - Serializable & audit-safe
     - Deterministic input contract
+    - population resolves lazily on first read (cache, then
+      World Bank, then population_fallback); constructing a
+      node never touches the network
+    - population=N (the pre-cache constructor keyword) is still
+      accepted and pins the population to N, with no lookup
     """
     name: str
     country_code: str
     base_revenue: float
     base_energy_bill: float
     base_traffic_density: int
-    population: int
+    population_fallback: int = 0
+    population_override: Optional[int] = None
+    population: InitVar[Optional[int]] = None
+
+    def __post_init__(self, population: Optional[int]) -> None:
+        if population is not None:
+            object.__setattr__(self, "population_override", int(population))
+
+
+def _node_population(node: CityNode) -> int:
+    if node.population_override is not None:
+        return node.population_override
+    return load_population(node.country_code, node.population_fallback)
+
+
+# Installed after the dataclass is built: `population` is also
+# the InitVar keyword, whose default must stay None
+CityNode.population = property(_node_population)
 
 
 # =========================================================
-# REAL POPULATION LOADER (FAIL-SAFE)
+# POPULATION RESOLUTION (LAZY, CACHED, NO IMPORT-TIME I/O)
 # =========================================================
+# Country code for nodes with no real country (never looked up)
+UNKNOWN_COUNTRY_CODE = "ZZ"
+
+POPULATION_PREFETCH_CONCURRENCY: int = int(os.getenv("SIMULATION_CONCURRENCY", 16))
+
+POPULATION_CACHE = PopulationCache()
+
+# Codes whose lookup fell back in this process (not retried)
+_UNAVAILABLE: Set[str] = set()
+
+
+def _resolvable(country_code: str) -> bool:
+    return (
+        bool(country_code)
+        and country_code != UNKNOWN_COUNTRY_CODE
+        and country_code not in _UNAVAILABLE
+    )
+
+
 def load_population(country_code: str, fallback: int) -> int:
     """
-    Attempts to fetch real population data.
-    Falls back gracefully to predefined values
-    to guarantee simulation continuity.
+    Population for a country: on-disk cache first, then the
+    World Bank API (result cached), else `fallback`.
 
     Rules:
     - No hard dependency on external availability
     - Always returns a valid integer
+    - At most one failed lookup per country per process
     """
-    try:
-        data = get_country_population(country_code)
-        if isinstance(data, dict) and data.get("population"):
-            return int(data["population"])
-    except Exception:
-        pass
+    if not _resolvable(country_code):
+        return int(fallback)
 
+    cached = POPULATION_CACHE.get(country_code)
+    if cached is not None:
+        return cached
+
+    data = fetch_population(country_code)
+    if data.get("population"):
+        population = int(data["population"])
+        POPULATION_CACHE.put_many({country_code: population})
+        return population
+
+    _UNAVAILABLE.add(country_code)
     return int(fallback)
 
 
+async def prefetch_populations_async(
+    country_codes: Iterable[str],
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict[str, int]:
+    """
+    Resolves many countries at once: cache hits first, then
+    every miss fetched concurrently (at most `semaphore`
+    slots in flight) and written to the cache in one write.
+    Returns the populations that resolved.
+    """
+    codes = [code for code in dict.fromkeys(country_codes) if _resolvable(code)]
+    resolved = POPULATION_CACHE.get_many(codes)
+    missing = [code for code in codes if code not in resolved]
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(POPULATION_PREFETCH_CONCURRENCY)
+
+    async def fetch(code: str) -> Dict[str, int]:
+        async with semaphore:
+            return await fetch_population_async(code)
+
+    responses = await asyncio.gather(*(fetch(code) for code in missing))
+
+    fetched = {
+        code: int(response["population"])
+        for code, response in zip(missing, responses)
+        if response.get("population")
+    }
+    _UNAVAILABLE.update(code for code in missing if code not in fetched)
+    POPULATION_CACHE.put_many(fetched)
+
+    resolved.update(fetched)
+    return resolved
+
+
+def prefetch_populations(country_codes: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """
+    Blocking bulk prefetch (default: every CITY_NODES country),
+    so later CityNode.population reads are cache hits.
+    """
+    if country_codes is None:
+        country_codes = [node.country_code for node in CITY_NODES]
+
+    coroutine = prefetch_populations_async(list(country_codes))
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    # Called from inside an event loop: run on a helper thread
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
 # =========================================================
 # GLOBAL SIMULATION PARAMETERS
 # =========================================================
 SIMULATION_YEARS: int = int(os.getenv("SIMULATION_YEARS", 5))
 SIMULATION_START_YEAR: int = int(os.getenv("SIMULATION_START_YEAR", 2026))
 
+# Annual rates applied per simulated year (compounding)
+REVENUE_GROWTH_RATE: float = float(os.getenv("SIMULATION_REVENUE_GROWTH", 0.04))
+ENERGY_BILL_DRIFT: float = float(os.getenv("SIMULATION_ENERGY_DRIFT", 0.03))
+TRAFFIC_GROWTH_RATE: float = float(os.getenv("SIMULATION_TRAFFIC_GROWTH", 0.02))
+
 
 # =========================================================
 # INITIAL CITY NODES (REAL DATA SAFE)
@@ -76,7 +187,7 @@ CITY_NODES: List[CityNode] = [
         base_revenue=5_000_000.0,
         base_energy_bill=150_000.0,
         base_traffic_density=180,
-        population=load_population("EG", 20_000_000),
+        population_fallback=20_000_000,
     ),
     CityNode(
         name="Austin-TX",
@@ -84,7 +195,7 @@ CITY_NODES: List[CityNode] = [
         base_revenue=10_000_000.0,
         base_energy_bill=200_000.0,
         base_traffic_density=120,
-        population=load_population("US", 330_000_000),
+        population_fallback=330_000_000,
     ),
     CityNode(
         name="Dubai",
@@ -92,6 +203,6 @@ CITY_NODES: List[CityNode] = [
         base_revenue=20_000_000.0,
         base_energy_bill=300_000.0,
         base_traffic_density=90,
-        population=load_population("AE", 10_000_000),
+        population_fallback=10_000_000,
     ),
 ]
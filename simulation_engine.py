@@ -0,0 +1,330 @@
+# =========================================================
+# PATH: /simulation_engine.py
+# DESCRIPTION: Vectorized Batch Simulation Engine
+# VERSION: v1.0.0 (ENTERPRISE STABLE)
+# CLASSIFICATION: PRODUCTION / AUDIT / CI-SAFE
+# ROLE: NumPy Evaluation of the Revenue, Energy & Traffic
+#       Formulas Across Thousands of City Nodes at Once
+# DATA MODE: REALISTIC-DETERMINISTIC
+# =========================================================
+
+"""
+Batch counterpart of the per-city engines.
+
+Each engine formula is evaluated once over whole columns:
+
+- revenue_gain:   RevenueOptimizer Total_City_Gain
+                  (baseline + round(baseline * 0.20, 2))
+- energy_savings: predict_energy_savings (bill * 0.18, 0 when
+                  the bill is not positive)
+- risk_score:     TrafficRiskEngine (density / 300 + weather
+                  factor, rounded to 4 places, clamped to [0, 1])
+
+Weather is looked up once per distinct city name; names
+without coordinates get the deterministic fallback factor
+without touching the network.
+
+simulate_horizon() steps every node through SIMULATION_YEARS
+years (revenue compounding, energy bill drift, traffic growth)
+in preallocated (cities x years) arrays, one vector update per
+year.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from simulation_config import (
+    ENERGY_BILL_DRIFT,
+    REVENUE_GROWTH_RATE,
+    SIMULATION_START_YEAR,
+    SIMULATION_YEARS,
+    TRAFFIC_GROWTH_RATE,
+    UNKNOWN_COUNTRY_CODE,
+    CityNode,
+)
+from data_sources.weather_api import get_live_weather
+from Projects.Project_III_Traffic_Intelligence.accident_pred import TrafficRiskEngine
+
+
+# =========================================================
+# ENGINE COEFFICIENTS (MIRROR THE SCALAR ENGINES)
+# =========================================================
+REVENUE_EFFICIENCY_GAIN: float = 0.20  # revenue_sim default midpoint
+ENERGY_EFFICIENCY_FACTOR: float = 0.18  # energy_forecast core kernel
+MAX_DENSITY_REFERENCE: float = TrafficRiskEngine.MAX_DENSITY_REFERENCE
+
+
+# =========================================================
+# MANIFEST NODES
+# =========================================================
+MANIFEST_PATH = (
+    Path(__file__).resolve().parent
+    / "Projects" / "Project_VI_Global_Dominance" / "global_cities_manifest.json"
+)
+
+# The manifest lists cities by name only
+MANIFEST_COUNTRY_CODES: Dict[str, str] = {
+    "Austin": "US",
+    "Toronto": "CA",
+    "Dubai": "AE",
+    "Riyadh": "SA",
+    "Singapore": "SG",
+    "Berlin": "DE",
+    "Tokyo": "JP",
+}
+
+# Node defaults derived from the manifest's expected ARR
+MANIFEST_ENERGY_BILL_RATIO: float = 0.02
+MANIFEST_TRAFFIC_DENSITY: int = 120
+
+
+# =========================================================
+# BATCH CONTAINER
+# =========================================================
+@dataclass(frozen=True)
+class CityBatch:
+    """
+    Column-oriented view of a sequence of CityNodes.
+
+    Guarantees:
+    - One row per node, in input order
+    - float64 columns (int64 for population)
+    - Revenue validated up front, as the scalar engine does
+    """
+    names: List[str]
+    country_codes: List[str]
+    base_revenue: np.ndarray
+    base_energy_bill: np.ndarray
+    base_traffic_density: np.ndarray
+    population: np.ndarray
+
+    @classmethod
+    def from_nodes(cls, nodes: Sequence[CityNode]) -> "CityBatch":
+        base_revenue = np.fromiter(
+            (node.base_revenue for node in nodes), dtype=np.float64, count=len(nodes)
+        )
+        if not np.all(np.isfinite(base_revenue)) or np.any(base_revenue <= 0):
+            raise ValueError("base_revenue must be greater than zero for every node")
+
+        return cls(
+            names=[node.name for node in nodes],
+            country_codes=[node.country_code for node in nodes],
+            base_revenue=base_revenue,
+            base_energy_bill=np.fromiter(
+                (node.base_energy_bill for node in nodes), dtype=np.float64, count=len(nodes)
+            ),
+            base_traffic_density=np.fromiter(
+                (node.base_traffic_density for node in nodes), dtype=np.float64, count=len(nodes)
+            ),
+            population=np.fromiter(
+                (node.population for node in nodes), dtype=np.int64, count=len(nodes)
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+# =========================================================
+# NODE SOURCES
+# =========================================================
+def manifest_city_nodes(
+    configured: Sequence[CityNode] = (),
+    path: Path = MANIFEST_PATH,
+) -> List[CityNode]:
+    """
+    Every target city in the global manifest, skipping cities
+    already present in `configured` ("Austin" matches
+    "Austin-TX"). Population resolves lazily by country.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    known = {node.name.split("-")[0] for node in configured}
+    nodes: List[CityNode] = []
+
+    for phase in manifest["global_expansion_strategy"].values():
+        for target in phase.get("target_cities", []):
+            name = target["city"]
+            if name in known:
+                continue
+            known.add(name)
+
+            base_revenue = float(target["expected_arr_usd_m"]) * 1_000_000
+            nodes.append(CityNode(
+                name=name,
+                country_code=MANIFEST_COUNTRY_CODES.get(name, UNKNOWN_COUNTRY_CODE),
+                base_revenue=base_revenue,
+                base_energy_bill=base_revenue * MANIFEST_ENERGY_BILL_RATIO,
+                base_traffic_density=MANIFEST_TRAFFIC_DENSITY,
+            ))
+
+    return nodes
+
+
+def synthetic_city_nodes(count: int, seed: int = 0) -> List[CityNode]:
+    """
+    `count` reproducible synthetic nodes (SYN-00000, ...) with
+    revenue, energy and density in the range of the configured
+    cities. Same seed, same nodes.
+    """
+    rng = np.random.default_rng(seed)
+    revenue = np.round(rng.uniform(1_000_000, 50_000_000, count), 2)
+    energy = np.round(revenue * rng.uniform(0.01, 0.03, count), 2)
+    density = rng.integers(30, 300, count)
+
+    return [
+        CityNode(
+            name=f"SYN-{i:05d}",
+            country_code=UNKNOWN_COUNTRY_CODE,
+            base_revenue=r,
+            base_energy_bill=e,
+            base_traffic_density=d,
+        )
+        for i, (r, e, d) in enumerate(zip(revenue.tolist(), energy.tolist(), density.tolist()))
+    ]
+
+
+# =========================================================
+# WEATHER
+# =========================================================
+def weather_factors(
+    names: Sequence[str],
+    lookup: Optional[Callable[[str], Dict]] = None,
+) -> np.ndarray:
+    """Weather factor per name, one lookup per distinct name."""
+    if lookup is None:
+        lookup = get_live_weather
+
+    cache: Dict[str, float] = {}
+    factors = np.empty(len(names), dtype=np.float64)
+
+    for i, name in enumerate(names):
+        factor = cache.get(name)
+        if factor is None:
+            factor = cache[name] = float(lookup(name)["weather_factor"])
+        factors[i] = factor
+
+    return factors
+
+
+# =========================================================
+# VECTORIZED ENGINE
+# =========================================================
+def _evaluate(
+    revenue: np.ndarray,
+    bill: np.ndarray,
+    density: np.ndarray,
+    weather: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Engine formulas over arrays of any (broadcastable) shape."""
+    baseline = np.round(revenue, 2)
+    revenue_gain = np.round(baseline + np.round(baseline * REVENUE_EFFICIENCY_GAIN, 2), 2)
+
+    energy_savings = np.where(bill > 0, bill * ENERGY_EFFICIENCY_FACTOR, 0.0)
+
+    density = np.maximum(density, 0.0)
+    risk_score = np.clip(np.round(density / MAX_DENSITY_REFERENCE + weather, 4), 0.0, 1.0)
+
+    return {
+        "revenue_gain": revenue_gain,
+        "energy_savings": energy_savings,
+        "risk_score": risk_score,
+    }
+
+
+def simulate_batch(
+    batch: CityBatch,
+    weather: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluates all three engines over every node of `batch`.
+    `weather` defaults to live lookups via weather_factors().
+
+    Returns {"revenue_gain", "energy_savings", "risk_score"},
+    each a float64 array aligned with batch.names.
+    """
+    if weather is None:
+        weather = weather_factors(batch.names)
+
+    return _evaluate(
+        batch.base_revenue, batch.base_energy_bill, batch.base_traffic_density, weather
+    )
+
+
+# =========================================================
+# MULTI-YEAR HORIZON
+# =========================================================
+Rate = Union[float, np.ndarray]
+
+
+@dataclass(frozen=True)
+class Horizon:
+    """
+    Year-by-year state and engine outputs.
+
+    Every array is shaped (cities, years): row i is
+    batch.names[i], column t is calendar year years[t].
+    Column 0 is the unstepped base year.
+    """
+    years: np.ndarray
+    revenue: np.ndarray
+    energy_bill: np.ndarray
+    traffic_density: np.ndarray
+    revenue_gain: np.ndarray
+    energy_savings: np.ndarray
+    risk_score: np.ndarray
+
+
+def _step(out: np.ndarray, base: np.ndarray, rate: Rate) -> None:
+    """out[:, t] = out[:, t - 1] * (1 + rate), in place."""
+    factor = 1.0 + np.asarray(rate, dtype=np.float64)
+    out[:, 0] = base
+    for t in range(1, out.shape[1]):
+        np.multiply(out[:, t - 1], factor, out=out[:, t])
+
+
+def simulate_horizon(
+    batch: CityBatch,
+    years: int = SIMULATION_YEARS,
+    start_year: int = SIMULATION_START_YEAR,
+    weather: Optional[np.ndarray] = None,
+    revenue_growth: Rate = REVENUE_GROWTH_RATE,
+    energy_drift: Rate = ENERGY_BILL_DRIFT,
+    traffic_growth: Rate = TRAFFIC_GROWTH_RATE,
+) -> Horizon:
+    """
+    Steps every node through `years` years starting at
+    `start_year`. Rates are scalars or per-city arrays;
+    weather is held at its current factor across the horizon.
+    """
+    if years < 1:
+        raise ValueError("years must be at least 1")
+
+    if weather is None:
+        weather = weather_factors(batch.names)
+
+    shape = (len(batch), years)
+    revenue = np.empty(shape, dtype=np.float64)
+    energy_bill = np.empty(shape, dtype=np.float64)
+    traffic_density = np.empty(shape, dtype=np.float64)
+
+    _step(revenue, batch.base_revenue, revenue_growth)
+    _step(energy_bill, batch.base_energy_bill, energy_drift)
+    _step(traffic_density, batch.base_traffic_density, traffic_growth)
+
+    outputs = _evaluate(
+        revenue, energy_bill, traffic_density, np.asarray(weather)[:, np.newaxis]
+    )
+
+    return Horizon(
+        years=np.arange(start_year, start_year + years),
+        revenue=revenue,
+        energy_bill=energy_bill,
+        traffic_density=traffic_density,
+        **outputs,
+    )
@@ -0,0 +1,520 @@
+# =========================================================
+# PATH: tests/test_data_core.py
+# DESCRIPTION: Data Core Storage & Retrieval Tests
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ROLE: Eviction, Snapshot & Query Semantics
+# =========================================================
+
+import asyncio
+import copy
+import json
+import pickle
+import threading
+import uuid
+from collections import deque
+
+import numpy as np
+import pytest
+
+from data_core import core
+from data_core import (
+    FeedGapError,
+    aggregate_results,
+    changes_since,
+    configure_backend,
+    fetch_aggregates,
+    fetch_all_results,
+    fetch_columnar,
+    feed_position,
+    query_results,
+    register_columnar_engine,
+    set_max_records,
+    store_simulation_result,
+    store_simulation_results,
+    subscribe,
+    watch_changes,
+)
+from data_core.feed import ChangeFeed
+from data_core.frozen import FrozenDict, freeze
+from data_core.persistence import LogSnapshotBackend, MemoryBackend, SQLiteBackend
+from data_core.query import ResultIndex
+from data_core.ring_buffer import RingBuffer
+from data_core.rollups import QuantileSketch, Rollups
+
+
+# =========================================================
+# FIXTURES (FRESH STORE PER TEST)
+# =========================================================
+@pytest.fixture(autouse=True)
+def fresh_store(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(core, "_MAX_RECORDS", core._MAX_RECORDS)
+    monkeypatch.setattr(core, "_DATA_STORE", RingBuffer(core._MAX_RECORDS))
+    monkeypatch.setattr(core, "_DATA_INDEX", ResultIndex(core._MAX_RECORDS))
+    monkeypatch.setattr(core, "_BACKEND", MemoryBackend())
+    monkeypatch.setattr(core, "_COLUMNAR", {})
+    monkeypatch.setattr(core, "_ROLLUPS", Rollups())
+    monkeypatch.setattr(core, "_PENDING", deque())
+    monkeypatch.setattr(core, "_ROLLUP_PENDING", deque())
+    monkeypatch.setattr(core, "_FEED", ChangeFeed(capacity=8))
+    yield
+    core._BACKEND.close()
+
+
+# =========================================================
+# RING BUFFER
+# =========================================================
+@pytest.mark.parametrize("capacity", [1, 3, 8])
+def test_ring_buffer_keeps_newest_in_order(capacity: int) -> None:
+    ring = RingBuffer(capacity)
+    expected = []
+
+    for i in range(20):
+        evicted = ring.append(i)
+        expected.append(i)
+        assert evicted == (expected.pop(0) if len(expected) > capacity else None)
+        assert ring.items() == expected
+        assert ring.get(ring.first_seq) == expected[0]
+
+    assert ring.items(18) == [x for x in expected if x >= 18]
+    with pytest.raises(IndexError):
+        ring.get(ring.first_seq - 1)
+
+
+# =========================================================
+# PUBLIC STORE CONTRACT
+# =========================================================
+def test_store_evicts_oldest_first() -> None:
+    set_max_records(3)
+    for i in range(5):
+        assert store_simulation_result("ENGINE", {"i": i}) == {"status": "STORED"}
+
+    assert [r["payload"]["i"] for r in fetch_all_results()] == [2, 3, 4]
+
+    set_max_records(2)
+    assert [r["payload"]["i"] for r in fetch_all_results()] == [3, 4]
+
+
+def test_store_rejects_invalid_input() -> None:
+    with pytest.raises(ValueError):
+        store_simulation_result("", {})
+    with pytest.raises(ValueError):
+        store_simulation_result("ENGINE", [])
+
+
+# =========================================================
+# FROZEN SNAPSHOTS
+# =========================================================
+def test_records_are_frozen_at_insert() -> None:
+    payload = {"city": "Cairo", "series": [1, 2], "meta": {"tags": ["a"]}}
+    store_simulation_result("ENGINE", payload)
+    payload["series"].append(3)
+    payload["meta"]["tags"].append("b")
+
+    record = fetch_all_results()[0]
+    assert record["payload"] == {"city": "Cairo", "series": (1, 2), "meta": {"tags": ("a",)}}
+
+    with pytest.raises(TypeError):
+        record["engine"] = "OTHER"
+    with pytest.raises(TypeError):
+        record["payload"].update(city="Dubai")
+
+
+def test_snapshots_share_records_without_copying() -> None:
+    for i in range(3):
+        store_simulation_result("ENGINE", {"i": i})
+
+    first, second = fetch_all_results(), fetch_all_results()
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+
+    first.clear()
+    assert len(fetch_all_results()) == 3
+
+
+def test_frozen_dict_serializes_like_dict() -> None:
+    frozen = freeze({"a": [1, {"b": 2}]})
+
+    assert isinstance(frozen, dict)
+    assert json.loads(json.dumps(frozen)) == {"a": [1, {"b": 2}]}
+    assert copy.deepcopy(frozen) is frozen
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert isinstance(pickle.loads(pickle.dumps(frozen)), FrozenDict)
+
+
+# =========================================================
+# INDEXED QUERIES & PAGINATION
+# =========================================================
+def _seed(count: int) -> None:
+    for i in range(count):
+        store_simulation_result("REVENUE" if i % 2 else "ENERGY", {"i": i})
+
+
+def _ids(page: dict) -> list:
+    return [r["payload"]["i"] for r in page["results"]]
+
+
+def test_query_filters_by_engine_and_pages_with_cursor() -> None:
+    _seed(10)
+
+    first = query_results(engine="REVENUE", limit=2)
+    assert _ids(first) == [1, 3] and first["total"] == 5
+
+    second = query_results(engine="REVENUE", limit=2, cursor=first["next_cursor"])
+    third = query_results(engine="REVENUE", limit=2, cursor=second["next_cursor"])
+    assert _ids(second) == [5, 7]
+    assert _ids(third) == [9] and third["next_cursor"] is None
+
+    assert _ids(query_results(limit=3, offset=4)) == [4, 5, 6]
+    assert query_results(engine="UNKNOWN")["total"] == 0
+
+
+def test_query_newest_first_for_dashboards() -> None:
+    _seed(7)
+
+    last = query_results(order="desc", limit=3)
+    assert _ids(last) == [6, 5, 4]
+    assert _ids(query_results(order="desc", limit=3, cursor=last["next_cursor"])) == [3, 2, 1]
+
+    with pytest.raises(ValueError):
+        query_results(order="asc", cursor=last["next_cursor"])
+
+
+def test_index_resolves_time_ranges_by_bisection() -> None:
+    ring, index = RingBuffer(8), ResultIndex(8)
+    for minute in (0, 1, 1, 3, 2, 5):  # 2 arrives late (clock skew)
+        record = {"engine": "E", "timestamp_utc": f"2026-01-01T00:0{minute}:00+00:00"}
+        index.add(ring.next_seq, record)
+        ring.append(record)
+
+    seqs, lo, hi = index.select(ring, since="2026-01-01T00:01:00+00:00",
+                                until="2026-01-01T00:03:00")
+    assert list(seqs[lo:hi]) == [1, 2, 3, 4]
+
+    seqs, lo, hi = index.select(ring, engine="E", since="2026-01-01T00:04:00Z")
+    assert list(seqs[lo:hi]) == [5]
+
+
+def test_query_index_follows_eviction() -> None:
+    set_max_records(4)
+    _seed(9)
+
+    assert _ids(query_results(engine="ENERGY")) == [6, 8]
+    assert _ids(query_results()) == [5, 6, 7, 8]
+
+
+# =========================================================
+# PERSISTENCE & RECOVERY
+# =========================================================
+@pytest.mark.parametrize("kind", ["log", "sqlite"])
+def test_backend_recovers_store_after_restart(kind: str, tmp_path) -> None:
+    configure_backend(kind, tmp_path)
+    for i in range(3):
+        store_simulation_result("ENGINE", {"i": i, "series": [i]})
+    before = fetch_all_results()
+
+    # Fresh backend over the same files, as a restarted process
+    configure_backend(kind, tmp_path)
+    after = fetch_all_results()
+
+    assert after == before
+    assert isinstance(after[0], FrozenDict)
+    assert after[0]["payload"]["series"] == (0,)
+    assert query_results(engine="ENGINE")["total"] == 3
+
+
+def test_log_backend_replays_only_tail_after_snapshot(tmp_path) -> None:
+    backend = LogSnapshotBackend(tmp_path, snapshot_every=3)
+    core._BACKEND = backend
+    for i in range(5):
+        store_simulation_result("ENGINE", {"i": i})
+    backend.close()
+
+    # Snapshot holds the first three; the live log only the tail
+    assert (tmp_path / "results.snapshot.json").exists()
+    tail = sorted(tmp_path.glob("results.*.log"))
+    assert len(tail) == 1
+    assert len(tail[0].read_text().splitlines()) == 2
+
+    with open(tail[0], "a") as f:
+        f.write('{"torn": ')  # crash mid-write
+
+    recovered = LogSnapshotBackend(tmp_path).load(capacity=100)
+    assert [r["payload"]["i"] for r in recovered] == [0, 1, 2, 3, 4]
+
+
+def test_log_backend_recovers_snapshot_still_being_written(tmp_path) -> None:
+    backend = LogSnapshotBackend(tmp_path, snapshot_every=2)
+    backend._write_lock.acquire()  # hold the background writer
+    try:
+        core._BACKEND = backend
+        for i in range(5):
+            store_simulation_result("ENGINE", {"i": i})
+
+        # Crash before any snapshot landed: every generation replays
+        assert not (tmp_path / "results.snapshot.json").exists()
+        recovered = LogSnapshotBackend(tmp_path).load(capacity=100)
+        assert [r["payload"]["i"] for r in recovered] == [0, 1, 2, 3, 4]
+    finally:
+        backend._write_lock.release()
+    backend.close()
+
+    assert (tmp_path / "results.snapshot.json").exists()
+    recovered = LogSnapshotBackend(tmp_path).load(capacity=100)
+    assert [r["payload"]["i"] for r in recovered] == [0, 1, 2, 3, 4]
+
+
+def test_sqlite_backend_sees_other_workers(tmp_path) -> None:
+    configure_backend("sqlite", tmp_path)
+    store_simulation_result("LOCAL", {"v": 1})
+
+    other = SQLiteBackend(tmp_path)
+    other.append([dict(fetch_all_results()[0], record_id="remote", engine="REMOTE")])
+    other.close()
+
+    assert [r["engine"] for r in fetch_all_results()] == ["LOCAL", "REMOTE"]
+    assert query_results(engine="REMOTE")["total"] == 1
+
+
+# =========================================================
+# COLUMNAR ENGINES
+# =========================================================
+SIM_FIELDS = ["revenue_gain", "energy_savings", "risk_score"]
+
+
+def _sim(city: str, gain: float) -> dict:
+    return {"city": city, "revenue_gain": gain, "energy_savings": 1.5, "risk_score": 0.25}
+
+
+def test_columnar_aggregates_match_numpy_per_city() -> None:
+    register_columnar_engine("SIM", SIM_FIELDS)
+    gains = {"LONDON": [3.0, 1.0, 7.5, 2.0], "DUBAI": [10.0, -4.0, 6.0]}
+    for city, values in gains.items():
+        for value in values:
+            store_simulation_result("SIM", _sim(city, value))
+    store_simulation_result("OTHER", {"note": "kept as a dict record"})
+
+    stats = aggregate_results("SIM", "revenue_gain", percentiles=(25, 50, 90))
+    for city, values in gains.items():
+        assert stats[city]["count"] == len(values)
+        assert stats[city]["sum"] == pytest.approx(sum(values))
+        assert stats[city]["min"] == min(values)
+        assert stats[city]["max"] == max(values)
+        for p in (25, 50, 90):
+            assert stats[city][f"p{p}"] == pytest.approx(np.percentile(values, p))
+
+    assert [r["engine"] for r in fetch_all_results()] == ["OTHER"]
+    assert list(fetch_columnar("SIM")["city"][:4]) == ["LONDON"] * 4
+
+
+def test_columnar_engine_evicts_oldest_and_validates_schema() -> None:
+    set_max_records(3)
+    store_simulation_result("SIM", _sim("A", 0.0))
+    register_columnar_engine("SIM", SIM_FIELDS)  # existing record moves over
+    for value in (1.0, 2.0, 3.0):
+        store_simulation_result("SIM", _sim("A", value))
+
+    assert list(fetch_columnar("SIM")["revenue_gain"]) == [1.0, 2.0, 3.0]
+    assert fetch_all_results() == []
+
+    with pytest.raises(ValueError):
+        store_simulation_result("SIM", {"city": "A", "revenue_gain": 1.0})
+    with pytest.raises(ValueError):
+        store_simulation_result("SIM", _sim("A", "high"))
+
+
+def test_columnar_records_survive_snapshot_recovery(tmp_path) -> None:
+    register_columnar_engine("SIM", SIM_FIELDS)
+    core._BACKEND = LogSnapshotBackend(tmp_path, snapshot_every=2)
+    for value in (1.0, 2.0, 3.0):
+        store_simulation_result("SIM", _sim("ROME", value))
+
+    configure_backend("log", tmp_path)
+    assert list(fetch_columnar("SIM")["revenue_gain"]) == [1.0, 2.0, 3.0]
+
+
+# =========================================================
+# ROLLUPS
+# =========================================================
+def test_quantile_sketch_is_within_relative_accuracy() -> None:
+    rng = np.random.default_rng(7)
+    values = np.concatenate([rng.lognormal(size=20_000), -rng.lognormal(size=5_000), [0.0] * 100])
+
+    streamed, batched = QuantileSketch(0.01), QuantileSketch(0.01)
+    for value in values:
+        streamed.add(float(value))
+    batched.add_many(values)
+
+    for p in (1, 10, 25, 50, 90, 99):
+        exact = np.percentile(values, p)
+        assert streamed.quantile(p) == pytest.approx(exact, rel=0.0101, abs=1e-12)
+        assert batched.quantile(p) == streamed.quantile(p)
+    assert streamed.quantile(0) == values.min() and streamed.quantile(100) == values.max()
+
+
+def test_quantile_sketch_skips_non_finite_values() -> None:
+    streamed, batched = QuantileSketch(), QuantileSketch()
+    values = [1.0, float("inf"), float("nan"), 3.0, float("-inf")]
+    for value in values:
+        streamed.add(value)
+    batched.add_many(np.array(values))
+
+    for sketch in (streamed, batched):
+        assert sketch.count == 2
+        assert sketch.quantile(50) == 2.0
+
+
+def test_aggregates_roll_up_per_engine_and_city() -> None:
+    set_max_records(2)
+    register_columnar_engine("SIM", SIM_FIELDS)
+    for city, gain in [("OSLO", 1.0), ("OSLO", 3.0), ("LIMA", 10.0)]:
+        store_simulation_result("SIM", _sim(city, gain))
+    store_simulation_result("RAW", {"city": "OSLO", "flag": True, "label": "x"})
+
+    aggregates = fetch_aggregates()
+    engine = aggregates["engines"]["SIM"]
+    assert engine["count"] == 3  # evicted results stay rolled up
+    assert engine["fields"]["revenue_gain"]["sum"] == 14.0
+    assert engine["fields"]["revenue_gain"]["max"] == 10.0
+
+    oslo = aggregates["cities"]["SIM"]["OSLO"]["fields"]["revenue_gain"]
+    assert (oslo["count"], oslo["mean"], oslo["p50"]) == (2, 2.0, 2.0)
+    assert aggregates["engines"]["RAW"] == {"count": 1, "fields": {}}
+
+
+def test_aggregates_ignore_non_finite_fields() -> None:
+    store_simulation_result("RAW", {"city": "OSLO", "gain": float("inf"), "loss": 2.0})
+    store_simulation_result("RAW", {"city": "OSLO", "gain": float("nan"), "loss": 4.0})
+    store_simulation_result("RAW", {"city": "OSLO", "gain": 10 ** 400, "loss": 6.0})
+
+    fields = fetch_aggregates()["engines"]["RAW"]["fields"]
+    assert "gain" not in fields
+    assert fields["loss"]["count"] == 3
+    assert fields["loss"]["p50"] == pytest.approx(4.0, rel=0.01)
+
+
+# =========================================================
+# CONCURRENT INGESTION
+# =========================================================
+def test_write_queued_behind_a_reader_is_published_on_release(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    inside, release = threading.Event(), threading.Event()
+    sync = core._sync
+
+    def slow_sync() -> None:
+        sync()  # the reader is past its drain, still holding the lock
+        inside.set()
+        release.wait(5)
+
+    monkeypatch.setattr(core, "_sync", slow_sync)
+    received = []
+    subscribe(received.append)
+
+    reader = threading.Thread(target=fetch_all_results)
+    reader.start()
+    assert inside.wait(5)
+
+    assert store_simulation_result("ENGINE", {"i": 1}) == {"status": "STORED"}
+    assert len(core._PENDING) == 1
+
+    release.set()
+    reader.join(5)
+
+    # Committed and delivered by the reader on release, no further reads
+    assert not core._PENDING
+    assert [e.record["payload"]["i"] for e in received] == [1]
+
+
+def test_concurrent_writers_keep_per_thread_order() -> None:
+    threads, per_thread = 8, 500
+    set_max_records(threads * per_thread)
+
+    def writer(worker: int) -> None:
+        for i in range(per_thread):
+            store_simulation_result("CONCURRENT", {"city": f"W{worker}", "i": i})
+
+    pool = [threading.Thread(target=writer, args=(w,)) for w in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+    results = fetch_all_results()
+    assert len(results) == threads * per_thread
+    for w in range(threads):
+        sequence = [r["payload"]["i"] for r in results if r["payload"]["city"] == f"W{w}"]
+        assert sequence == list(range(per_thread))
+
+    assert fetch_aggregates()["engines"]["CONCURRENT"]["count"] == threads * per_thread
+
+
+# =========================================================
+# BULK INGESTION
+# =========================================================
+def test_batch_store_is_all_or_nothing_and_ordered() -> None:
+    with pytest.raises(ValueError, match="batch item 1"):
+        store_simulation_results([("ENGINE", {"i": 0}), ("ENGINE", "not a dict")])
+    assert fetch_all_results() == []
+
+    status = store_simulation_results(("ENGINE", {"i": i}) for i in range(5))
+    store_simulation_result("ENGINE", {"i": 5})
+
+    results = fetch_all_results()
+    assert status == {"status": "STORED", "count": 5}
+    assert [r["payload"]["i"] for r in results] == list(range(6))
+    assert len({r["timestamp_utc"] for r in results[:5]}) == 1
+    assert len({r["record_id"] for r in results}) == 6
+    assert all(uuid.UUID(r["record_id"]).version == 4 for r in results)
+    assert fetch_aggregates()["engines"]["ENGINE"]["fields"]["i"]["sum"] == 15.0
+
+
+# =========================================================
+# CHANGE FEED
+# =========================================================
+def test_change_feed_delivers_deltas_in_order() -> None:
+    store_simulation_result("ENGINE", {"i": 0})
+    start = feed_position()
+
+    received = []
+    unsubscribe = subscribe(received.append)
+    store_simulation_results(("ENGINE", {"i": i}) for i in (1, 2))
+    store_simulation_result("ENGINE", {"i": 3})
+    unsubscribe()
+    store_simulation_result("ENGINE", {"i": 4})
+
+    assert [e.seq for e in received] == [start + 1, start + 2, start + 3]
+    assert [e.record["payload"]["i"] for e in received] == [1, 2, 3]
+    assert [e.record["payload"]["i"] for e in changes_since(start)] == [1, 2, 3, 4]
+    assert changes_since(feed_position()) == []
+
+
+def test_change_feed_reports_gaps_beyond_retention() -> None:
+    store_simulation_results(("ENGINE", {"i": i}) for i in range(10))  # capacity 8
+
+    assert [e.seq for e in changes_since(2)] == list(range(3, 11))
+    with pytest.raises(FeedGapError):
+        changes_since(1)
+
+
+def test_change_feed_rejects_cursors_ahead_of_head() -> None:
+    # e.g. a position handed out by another worker or before a restart
+    head = feed_position()
+    assert changes_since(head) == []
+    with pytest.raises(FeedGapError):
+        changes_since(head + 1)
+
+
+def test_watch_changes_catches_up_then_streams_live() -> None:
+    store_simulation_result("ENGINE", {"i": 0})
+
+    async def consume() -> list:
+        stream = watch_changes(since=0)
+        first = await stream.__anext__()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, store_simulation_result, "ENGINE", {"i": 1})
+        second = await asyncio.wait_for(stream.__anext__(), timeout=5)
+        await stream.aclose()
+        return [first, second]
+
+    events = asyncio.run(consume())
+    assert [(e.seq, e.record["payload"]["i"]) for e in events] == [(1, 0), (2, 1)]
@@ -5,13 +5,17 @@
 # ROLE: System Integrity, Regression & Interface Validation
 # =========================================================
 
+from pathlib import Path
 from typing import Dict, Any
+
+import numpy as np
 import pytest
 
 # ---------------------------------------------------------
 # CORE ENGINE IMPORTS (CONTRACT LEVEL — DO NOT MOCK)
 # ---------------------------------------------------------
 from Projects.Project_I_Urban_Revenue.revenue_optimizer import RevenueOptimizer
+from Projects.Project_I_Urban_Revenue.ai_engine_v2 import UrbanRevenueAI
 from Projects.Project_II_Private_Districts.energy_forecast import predict_energy_savings
 from Projects.Project_III_Traffic_Intelligence.accident_pred import TrafficRiskEngine
 from Projects.Project_III_Security_Ledger.secure_vault import FBCSecureVault
@@ -69,11 +73,40 @@ def test_traffic_engine_contract(test_city: str) -> None:
     assert "weather" in result
 
 
+# =========================================================
+# URBAN REVENUE AI MONTE CARLO CONTRACT TEST
+# =========================================================
+def test_revenue_ai_distribution_contract() -> None:
+    engine = UrbanRevenueAI("Dubai")
+
+    first = engine.simulate_distribution(50_000, seed=7)
+    again = engine.simulate_distribution(50_000, seed=np.random.default_rng(7))
+    assert first["metrics"] == again["metrics"]
+
+    optimized = first["metrics"]["fbc_optimized_total_m"]
+    values = list(optimized["percentiles"].values())
+    assert values == sorted(values)
+
+    low, high = optimized["confidence_interval"]
+    assert low < optimized["percentiles"]["p50"] < high
+
+    # Mean of the noise-free index: 8.5 * 1.15 * 0.98
+    assert optimized["mean"] == pytest.approx(9.5795, abs=0.01)
+    assert first["metrics"]["net_value_created_m"]["mean"] == pytest.approx(
+        optimized["mean"] - 8.5
+    )
+
+    deterministic = UrbanRevenueAI("Dubai", deterministic=True).simulate_distribution(10)
+    assert deterministic["metrics"]["fbc_optimized_total_m"]["std"] == 0.0
+
+    assert UrbanRevenueAI("TestCity").simulate_distribution(10)["status"] == "FALLBACK"
+
+
 # =========================================================
 # SECURITY LEDGER CONTRACT TEST (STRICT API COMPLIANCE)
 # =========================================================
-def test_secure_vault_contract() -> None:
-    vault = FBCSecureVault()
+def test_secure_vault_contract(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path)
 
     # IMPORTANT: positional args only (contract-safe)
     proof: Dict[str, Any] = vault.generate_proof("TEST", "ENTITY", 12345)
@@ -91,7 +124,7 @@ def test_secure_vault_contract() -> None:
 # =========================================================
 # SYSTEM-WIDE SMOKE TEST (NON-DESTRUCTIVE)
 # =========================================================
-def test_system_smoke(test_city: str) -> None:
+def test_system_smoke(test_city: str, tmp_path: Path) -> None:
     """
     Validates that all core engines initialize and execute
     without raising runtime exceptions.
@@ -99,7 +132,7 @@ def test_system_smoke(test_city: str) -> None:
 
     RevenueOptimizer(test_city)
     TrafficRiskEngine(test_city)
-    FBCSecureVault()
+    FBCSecureVault(base_path=tmp_path)
 
     energy = predict_energy_savings(10_000)
     assert energy is not None
@@ -0,0 +1,623 @@
+# =========================================================
+# PATH: tests/test_secure_ledger.py
+# DESCRIPTION: Security Ledger Storage & Integrity Tests
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ROLE: Chain Semantics, Persistence & Tamper Detection
+# =========================================================
+
+import gzip
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from Projects.Project_III_Security_Ledger import ledger_storage, secure_vault
+from Projects.Project_III_Security_Ledger.ledger_merkle import merkle_root
+from Projects.Project_III_Security_Ledger.ledger_migrate import migrate_ledger
+from Projects.Project_III_Security_Ledger.secure_vault import FBCSecureVault
+from Projects.Project_IV_City_OS.secure_vault import (
+    FBCSecureVault as GlobalSecureVault,
+)
+
+
+# =========================================================
+# FIXTURES (ISOLATED LEDGER DIRECTORY)
+# =========================================================
+@pytest.fixture(params=["jsonl", "json", "sqlite"])
+def vault(request, tmp_path: Path) -> FBCSecureVault:
+    return FBCSecureVault(base_path=tmp_path, storage=request.param)
+
+
+# =========================================================
+# CHAIN SEMANTICS (STORAGE-INDEPENDENT)
+# =========================================================
+def test_proofs_chain_and_verify(vault: FBCSecureVault) -> None:
+    first = vault.generate_proof("P1", "Cairo", 10)
+    second = vault.generate_proof("P1", "Dubai", 20.5)
+
+    assert first["index"] == 1
+    assert second["index"] == 2
+    assert second["previous_hash"] == first["audit_hash"]
+
+    result = vault.verify_sector_ledger()
+    assert result["status"] == "LEDGER_VERIFIED"
+    assert result["blocks"] == 3
+
+
+def test_negative_amount_rejected(vault: FBCSecureVault) -> None:
+    with pytest.raises(ValueError):
+        vault.generate_proof("P1", "Cairo", -1)
+
+
+# =========================================================
+# BATCHED PROOFS (SINGLE DURABLE WRITE)
+# =========================================================
+def test_generate_proofs_chains_batch(vault: FBCSecureVault) -> None:
+    single = vault.generate_proof("P1", "Cairo", 1)
+    batch = vault.generate_proofs(
+        [("P2", "Cairo", 2), ("P2", "Dubai", 3), ("P2", "Austin-TX", 4)]
+    )
+
+    assert [b["index"] for b in batch] == [2, 3, 4]
+    assert batch[0]["previous_hash"] == single["audit_hash"]
+    assert vault.verify_sector_ledger()["blocks"] == 5
+
+
+def test_generate_proofs_rejects_batch_atomically(vault: FBCSecureVault) -> None:
+    with pytest.raises(ValueError):
+        vault.generate_proofs([("P1", "Cairo", 1), ("P1", "Cairo", -1)])
+
+    assert vault.verify_sector_ledger()["blocks"] == 1
+
+
+def test_global_vault_generate_proofs(tmp_path: Path) -> None:
+    vault = GlobalSecureVault(base_path=tmp_path)
+    batch = vault.generate_proofs([("PROJECT_IV", "Cairo", 1.5)] * 3)
+
+    assert [b["index"] for b in batch] == [1, 2, 3]
+    assert vault.generate_proof("PROJECT_IV", "Dubai", 2)["index"] == 4
+
+    result = vault.verify_global_ledger()
+    assert result["status"] == "GLOBAL_LEDGER_VERIFIED"
+    assert result["blocks"] == 5
+
+
+# =========================================================
+# APPEND-ONLY SEGMENT
+# =========================================================
+def test_append_only_segment_layout(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    vault.generate_proof("P1", "Cairo", 1)
+
+    lines = (tmp_path / "fbc_sector_ledger.jsonl").read_text().splitlines()
+    assert [json.loads(line)["index"] for line in lines] == [0, 1]
+
+
+def test_torn_tail_is_repaired(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    good = vault.generate_proof("P1", "Cairo", 1)
+
+    segment = tmp_path / "fbc_sector_ledger.jsonl"
+    with open(segment, "ab") as f:
+        f.write(b'{"index": 2, "trunc')
+
+    reopened = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    record = reopened.generate_proof("P1", "Cairo", 2)
+
+    assert record["previous_hash"] == good["audit_hash"]
+    assert reopened.verify_sector_ledger()["blocks"] == 3
+
+
+def test_legacy_ledger_is_imported(tmp_path: Path) -> None:
+    legacy = FBCSecureVault(base_path=tmp_path, storage="json")
+    proof = legacy.generate_proof("P1", "Cairo", 5)
+
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    record = vault.generate_proof("P1", "Cairo", 6)
+
+    assert record["previous_hash"] == proof["audit_hash"]
+    assert vault.verify_sector_ledger()["status"] == "LEDGER_VERIFIED"
+
+
+# =========================================================
+# STREAMING LEGACY READER
+# =========================================================
+def test_legacy_array_is_streamed_across_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="json")
+    vault.generate_proofs([("P1", f"N{i}", i) for i in range(25)])
+
+    monkeypatch.setattr(ledger_storage, "_STREAM_CHUNK_BYTES", 7)
+    storage = vault._storage
+
+    with open(storage.path, encoding="utf-8") as f:
+        assert list(storage.iter_blocks()) == json.load(f)
+    assert [c for c, _ in storage.scan(20, 23)] == [20, 21, 22]
+    assert vault.verify_sector_ledger(full=True)["blocks"] == 26
+
+
+def test_truncated_legacy_array_is_rejected(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="json")
+    vault.generate_proof("P1", "Cairo", 1)
+
+    legacy = tmp_path / "fbc_sector_ledger.json"
+    legacy.write_text(legacy.read_text()[:-40])
+
+    with pytest.raises(ValueError):
+        list(vault._storage.iter_blocks())
+
+
+# =========================================================
+# SQLITE STORAGE & MIGRATION
+# =========================================================
+def test_sqlite_imports_existing_segment(tmp_path: Path) -> None:
+    segment = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    proof = segment.generate_proof("P1", "Cairo", 5)
+
+    vault = FBCSecureVault(base_path=tmp_path, storage="sqlite")
+    record = vault.generate_proof("P1", "Cairo", 6)
+
+    assert record["previous_hash"] == proof["audit_hash"]
+    assert vault.verify_sector_ledger(full=True)["blocks"] == 3
+
+
+def test_migrate_ledger_copies_and_checks(tmp_path: Path) -> None:
+    legacy = FBCSecureVault(base_path=tmp_path, storage="json")
+    legacy.generate_proofs([("P1", f"N{i}", i) for i in range(10)])
+
+    report = migrate_ledger(tmp_path, "fbc_sector_ledger", "json", "sqlite")
+    assert report["blocks"] == 11
+    assert report["last_hash"] == legacy._load_ledger()[-1]["audit_hash"]
+
+    vault = FBCSecureVault(base_path=tmp_path, storage="sqlite")
+    assert vault._load_ledger() == legacy._load_ledger()
+    assert vault.verify_sector_ledger()["status"] == "LEDGER_VERIFIED"
+
+    with pytest.raises(ValueError):
+        migrate_ledger(tmp_path, "fbc_sector_ledger", "json", "sqlite")
+
+
+def test_tamper_detected(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    vault.generate_proof("P1", "Cairo", 1)
+    vault.generate_proof("P1", "Cairo", 2)
+
+    segment = tmp_path / "fbc_sector_ledger.jsonl"
+    blocks = [json.loads(line) for line in segment.read_text().splitlines()]
+    blocks[1]["amount"] = 1_000_000.0
+    segment.write_text("".join(json.dumps(b) + "\n" for b in blocks))
+
+    result = FBCSecureVault(base_path=tmp_path, storage="jsonl").verify_sector_ledger()
+    assert result == {"status": "TAMPER_DETECTED", "block_index": 1}
+
+
+# =========================================================
+# CHECKPOINTED VERIFICATION
+# =========================================================
+def _rewrite_block(segment: Path, position: int, **changes) -> None:
+    blocks = [json.loads(line) for line in segment.read_text().splitlines()]
+    blocks[position].update(changes)
+    segment.write_text(
+        "".join(json.dumps(b, separators=(",", ":")) + "\n" for b in blocks)
+    )
+
+
+def test_incremental_verification_resumes_from_checkpoint(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    vault.generate_proofs([("P1", "Cairo", i) for i in range(5)])
+    assert vault.verify_sector_ledger()["blocks"] == 6
+
+    # History behind the checkpoint is trusted by incremental passes
+    segment = tmp_path / "fbc_sector_ledger.jsonl"
+    _rewrite_block(segment, 2, amount=9.0)
+    vault.generate_proof("P1", "Cairo", 7)
+
+    assert vault.verify_sector_ledger()["blocks"] == 7
+    assert vault.verify_sector_ledger(full=True) == {
+        "status": "TAMPER_DETECTED",
+        "block_index": 2,
+    }
+
+
+def test_incremental_verification_checks_new_blocks(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    vault.generate_proof("P1", "Cairo", 1)
+    vault.verify_sector_ledger()
+
+    vault.generate_proofs([("P1", "Cairo", 2), ("P1", "Cairo", 3)])
+    _rewrite_block(tmp_path / "fbc_sector_ledger.jsonl", 3, node="Forged")
+
+    assert vault.verify_sector_ledger() == {
+        "status": "TAMPER_DETECTED",
+        "block_index": 3,
+    }
+
+
+def test_forged_checkpoint_is_ignored(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    vault.generate_proofs([("P1", "Cairo", 1), ("P1", "Cairo", 2)])
+    vault.verify_sector_ledger()
+
+    checkpoint = tmp_path / "fbc_sector_ledger.jsonl.checkpoint"
+    forged = json.loads(checkpoint.read_text())
+    forged["position"] = 0
+    checkpoint.write_text(json.dumps(forged))
+
+    _rewrite_block(tmp_path / "fbc_sector_ledger.jsonl", 1, amount=5.0)
+    assert vault.verify_sector_ledger()["status"] == "TAMPER_DETECTED"
+
+
+def test_global_vault_incremental_verification(tmp_path: Path) -> None:
+    vault = GlobalSecureVault(base_path=tmp_path)
+    vault.generate_proof("PROJECT_IV", "Cairo", 1)
+
+    assert vault.verify_global_ledger()["blocks"] == 2
+    vault.generate_proof("PROJECT_IV", "Cairo", 2)
+    assert vault.verify_global_ledger()["blocks"] == 3
+    assert vault.verify_global_ledger(full=True)["blocks"] == 3
+
+
+# =========================================================
+# PARALLEL CHUNKED VERIFICATION
+# =========================================================
+@pytest.mark.parametrize("storage", ["jsonl", "json", "sqlite"])
+@pytest.mark.parametrize("position", [1, 7, 13, 39])
+@pytest.mark.parametrize("status", ["TAMPER_DETECTED", "CHAIN_BROKEN"])
+def test_parallel_verification_matches_sequential(
+    tmp_path: Path, storage: str, position: int, status: str
+) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage=storage)
+    vault.generate_proofs([("P1", f"N{i}", i) for i in range(39)])
+    assert vault.verify_sector_ledger(full=True, workers=4)["blocks"] == 40
+
+    ledger = vault._load_ledger()
+
+    if status == "TAMPER_DETECTED":
+        ledger[position]["amount"] = 1e9
+    else:
+        # Correctly re-signed block with a wrong link
+        forged = dict(ledger[position], previous_hash="f" * 64)
+        del forged["audit_hash"], forged["status"]
+        forged["audit_hash"] = vault._canonical_hash(forged)
+        ledger[position] = forged
+
+    vault._storage.import_blocks(ledger)
+
+    expected = {"status": status, "block_index": position}
+    assert vault.verify_sector_ledger(full=True) == expected
+    assert vault.verify_sector_ledger(full=True, workers=4) == expected
+
+
+def test_global_vault_parallel_verification(tmp_path: Path) -> None:
+    vault = GlobalSecureVault(base_path=tmp_path)
+    vault.generate_proofs([("PROJECT_IV", f"N{i}", i) for i in range(20)])
+
+    result = vault.verify_global_ledger(full=True, workers=3)
+    assert result["status"] == "GLOBAL_LEDGER_VERIFIED"
+    assert result["blocks"] == 21
+
+
+# =========================================================
+# CONCURRENT WRITERS (THREADS & PROCESSES)
+# =========================================================
+def _append_from_process(base_path: Path, worker: int) -> int:
+    vault = FBCSecureVault(base_path=base_path, storage="jsonl")
+    for i in range(20):
+        vault.generate_proof("MP", f"W{worker}", i)
+    return worker
+
+
+def test_concurrent_processes_do_not_fork_chain(tmp_path: Path) -> None:
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_append_from_process, [tmp_path] * 4, range(4)))
+
+    result = FBCSecureVault(base_path=tmp_path).verify_sector_ledger(full=True)
+    assert result["status"] == "LEDGER_VERIFIED"
+    assert result["blocks"] == 81
+
+
+def test_concurrent_threads_group_commit(vault: FBCSecureVault) -> None:
+    def worker(n: int) -> list:
+        return [vault.generate_proof("MT", f"T{n}", i)["index"] for i in range(25)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        indexes = [i for batch in pool.map(worker, range(8)) for i in batch]
+
+    assert sorted(indexes) == list(range(1, 201))
+    assert vault.verify_sector_ledger(full=True)["blocks"] == 201
+
+    metrics = vault.writer_metrics()
+    assert metrics["committed_blocks"] == 200
+    assert metrics["committed_groups"] <= 200
+    assert metrics["rejected_batches"] == 0
+
+
+# =========================================================
+# INDEXED LOOKUPS
+# =========================================================
+def test_find_by_project_node_and_time(vault: FBCSecureVault) -> None:
+    vault.generate_proofs(
+        [("P1", "Cairo", 1), ("P2", "Cairo", 2), ("P1", "Dubai", 3)]
+    )
+    vault.generate_proof("P2", "Dubai", 4)
+
+    assert [b["amount"] for b in vault.find(project_id="P1")] == [1, 3]
+    assert [b["amount"] for b in vault.find(node="Dubai")] == [3, 4]
+    assert [b["amount"] for b in vault.find("P2", "Dubai")] == [4]
+    assert vault.find(project_id="UNKNOWN") == []
+
+    ledger = vault._load_ledger()
+    stamp = ledger[-1]["timestamp"]
+    expected = [b for b in ledger if b["timestamp"] == stamp]
+    assert vault.find(since=stamp, until=stamp) == expected
+    assert vault.find(until="2000-01-01T00:00:00+00:00") == []
+
+
+def test_find_sees_appends_from_other_writers(tmp_path: Path) -> None:
+    reader = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    reader.generate_proof("P1", "Cairo", 1)
+    assert len(reader.find(project_id="P1")) == 1
+
+    FBCSecureVault(base_path=tmp_path, storage="jsonl").generate_proof(
+        "P1", "Dubai", 2
+    )
+    reader.generate_proof("P1", "Austin-TX", 3)
+
+    nodes = [b["node"] for b in reader.find(project_id="P1")]
+    assert nodes == ["Cairo", "Dubai", "Austin-TX"]
+
+
+def test_global_vault_find(tmp_path: Path) -> None:
+    vault = GlobalSecureVault(base_path=tmp_path)
+    vault.generate_proofs([("PROJECT_IV", "Cairo", 1), ("PROJECT_V", "Cairo", 2)])
+
+    assert [b["value"] for b in vault.find(project_id="PROJECT_V")] == [2]
+    assert len(vault.find(node="Cairo")) == 2
+
+
+# =========================================================
+# SEGMENT ROTATION & MERKLE SUMMARIES
+# =========================================================
+def _rfc6962_root(leaves: list) -> bytes:
+    if len(leaves) == 1:
+        return hashlib.sha256(b"\x00" + leaves[0]).digest()
+    k = 1
+    while k * 2 < len(leaves):
+        k *= 2
+    left, right = _rfc6962_root(leaves[:k]), _rfc6962_root(leaves[k:])
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def test_streaming_merkle_root_matches_recursive_definition() -> None:
+    blocks = [{"index": i, "amount": i * 1.5, "status": "X"} for i in range(33)]
+    leaves = [
+        json.dumps({"amount": b["amount"], "index": b["index"]}, separators=(",", ":")).encode()
+        for b in blocks
+    ]
+    for n in range(1, 34):
+        assert merkle_root(blocks[:n]) == _rfc6962_root(leaves[:n]).hex()
+
+
+def test_sealed_segment_is_archived_and_verified(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    sealed = vault.generate_proofs([("P1", f"N{i}", i) for i in range(10)])
+    seal = vault.seal_segment()
+    vault.generate_proofs([("P2", "Cairo", 1), ("P2", "Cairo", 2)])
+
+    summary = seal["segments"][0]
+    archive = tmp_path / "fbc_sector_ledger.segments" / summary["file"]
+    with gzip.open(archive, "rt") as f:
+        archived = [json.loads(line) for line in f]
+
+    assert seal["index"] == 11 and seal["previous_hash"] == sealed[-1]["audit_hash"]
+    assert summary["blocks"] == 11
+    assert summary["merkle_root"] == merkle_root(archived)
+
+    # Hot path only sees the active segment; find() covers sealed history
+    assert [b["index"] for b in vault._load_ledger()] == [11, 12, 13]
+    assert vault.find(project_id="P1") == sealed
+    assert [b["index"] for b in vault.find(node="Cairo")] == [12, 13]
+    assert [b["index"] for b in vault.find()] == list(range(14))
+
+    for kwargs in ({}, {"full": True}, {"archives": True}):
+        result = vault.verify_sector_ledger(**kwargs)
+        assert result["status"] == "LEDGER_VERIFIED"
+        assert result["blocks"] == 14
+
+
+def test_repeated_rotation_chains_segments(tmp_path: Path) -> None:
+    vault = GlobalSecureVault(base_path=tmp_path)
+    for round_ in range(3):
+        vault.generate_proofs([("PROJECT_IV", f"R{round_}", i) for i in range(4)])
+        seal = vault.seal_segment()
+
+    assert [s["sequence"] for s in seal["segments"]] == [1, 2, 3]
+    result = vault.verify_global_ledger(archives=True)
+    assert result["status"] == "GLOBAL_LEDGER_VERIFIED"
+    assert result["blocks"] == 16
+
+
+def test_find_spans_sealed_segments(tmp_path: Path) -> None:
+    vault = GlobalSecureVault(base_path=tmp_path)
+    for round_ in range(3):
+        vault.generate_proofs([("PROJECT_IV", f"R{round_}", i) for i in range(4)])
+        vault.seal_segment()
+    vault.generate_proof("PROJECT_IV", "R0", 9)
+
+    matches = vault.find(project_id="PROJECT_IV", node="R0")
+    assert [b["value"] for b in matches] == [0.0, 1.0, 2.0, 3.0, 9.0]
+
+    reopened = GlobalSecureVault(base_path=tmp_path)
+    start = matches[0]["timestamp"]
+    assert reopened.find(since=start) == [b for b in vault.find() if b["timestamp"] >= start]
+    assert len(vault.find(project_id="PROJECT_IV")) == 13
+
+    # An edited sidecar is ignored and the archive re-indexed
+    sidecars = sorted((tmp_path / "fbc_global_ledger.segments").glob("*.idx.json"))
+    assert len(sidecars) == 3
+    sidecars[0].write_text('{"projects": {}, "nodes": {}, "times": []}')
+    assert GlobalSecureVault(base_path=tmp_path).find(node="R0") == matches
+
+
+def test_archive_tampering_is_detected(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    vault.generate_proofs([("P1", "Cairo", i) for i in range(5)])
+    archive_name = vault.seal_segment()["segments"][0]["file"]
+    archive = tmp_path / "fbc_sector_ledger.segments" / archive_name
+
+    with gzip.open(archive, "rt") as f:
+        blocks = [json.loads(line) for line in f]
+    blocks[3]["amount"] = 1e9
+    with gzip.open(archive, "wt") as f:
+        f.writelines(json.dumps(b, separators=(",", ":")) + "\n" for b in blocks)
+
+    assert vault.verify_sector_ledger()["status"] == "LEDGER_VERIFIED"
+    assert vault.verify_sector_ledger(full=True) == {
+        "status": "ARCHIVE_TAMPERED",
+        "segment": archive_name,
+    }
+
+    archive.unlink()
+    assert vault.verify_sector_ledger(archives=True)["status"] == "ARCHIVE_MISSING"
+
+
+def test_segment_rotates_past_size_threshold(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(secure_vault, "DEFAULT_SEGMENT_BYTES", 2048)
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+
+    for i in range(30):
+        vault.generate_proof("P1", "Cairo", i)
+
+    archives = list((tmp_path / "fbc_sector_ledger.segments").glob("*.gz"))
+    assert archives
+    assert len(vault._load_ledger()) < 30
+
+    # 30 proofs + genesis + one seal block per archive
+    result = vault.verify_sector_ledger(archives=True)
+    assert result["blocks"] == 31 + len(archives)
+
+
+def test_sqlite_import_replays_sealed_segments(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    vault.generate_proofs([("P1", "Cairo", i) for i in range(4)])
+    vault.seal_segment()
+    vault.generate_proofs([("P2", "Dubai", i) for i in range(2)])
+
+    migrated = FBCSecureVault(base_path=tmp_path, storage="sqlite")
+    blocks = migrated._load_ledger()
+
+    assert [b["index"] for b in blocks] == list(range(8))
+    assert blocks[0]["status"] == "GENESIS"
+    assert migrated.verify_sector_ledger()["status"] == "LEDGER_VERIFIED"
+    assert len(migrated.find(project_id="P1")) == 4
+
+
+def test_sqlite_import_refuses_altered_archive(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    vault.generate_proof("P1", "Cairo", 1)
+    archive = tmp_path / "fbc_sector_ledger.segments" / vault.seal_segment()["segments"][0]["file"]
+    archive.unlink()
+
+    with pytest.raises(ValueError):
+        FBCSecureVault(base_path=tmp_path, storage="sqlite")
+
+
+def test_rotation_requires_append_only_storage(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        FBCSecureVault(base_path=tmp_path, storage="sqlite").seal_segment()
+
+
+# =========================================================
+# MERKLE INCLUSION PROOFS
+# =========================================================
+def test_inclusion_proofs_verify_offline(vault: FBCSecureVault) -> None:
+    vault.generate_proofs([("P1", f"N{i}", i) for i in range(12)])
+    head = vault.tree_head()
+    assert vault.verify_tree_head(head) and head["tree_size"] == 13
+
+    for index in (0, 5, 12):
+        proof = vault.inclusion_proof(index, head["tree_size"])
+        record = proof["record"]
+
+        assert "root" not in proof and proof["tree_size"] == 13
+        assert len(proof["path"]) <= 4
+        assert FBCSecureVault.verify_inclusion(record, proof, head["root"])
+
+        forged = dict(record, audit_hash="a" * 64)
+        assert not FBCSecureVault.verify_inclusion(forged, proof, head["root"])
+        assert not FBCSecureVault.verify_inclusion(record, proof, "b" * 64)
+
+    with pytest.raises(ValueError):
+        vault.inclusion_proof(99)
+
+
+def test_inclusion_proof_rejects_tampered_content(vault: FBCSecureVault) -> None:
+    vault.generate_proofs([("P1", "Cairo", 10), ("P1", "Dubai", 20)])
+    head = vault.tree_head()
+    proof = vault.inclusion_proof(1, head["tree_size"])
+    record = proof["record"]
+
+    assert FBCSecureVault.verify_inclusion(record, proof, head["root"])
+    for field, value in (("amount", 1e9), ("node", "Austin-TX"), ("project_id", "P2")):
+        # audit_hash left untouched: the leaf is re-derived from content
+        tampered = dict(record, **{field: value})
+        assert not FBCSecureVault.verify_inclusion(tampered, proof, head["root"])
+
+
+def test_sqlite_tree_is_read_from_persisted_hashes(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="sqlite")
+    for count in (1, 2, 5, 3):
+        # Group commits starting at odd and even leaf offsets
+        vault.generate_proofs([("P1", f"N{i}", i) for i in range(count)])
+        head = vault.tree_head()
+        assert head["root"] == merkle_root(vault._load_ledger())
+
+    assert not vault._index._cursors and not vault._index._by_project
+    proof = vault.inclusion_proof(7, head["tree_size"])
+    assert vault.verify_inclusion(proof["record"], proof, head["root"])
+
+    # Tables written before subtree hashes were stored are backfilled
+    vault._storage._connection().execute("DELETE FROM merkle")
+    assert vault.tree_head()["root"] == head["root"]
+
+
+def test_signed_head_pins_proofs_across_appends(tmp_path: Path) -> None:
+    vault = FBCSecureVault(base_path=tmp_path, storage="jsonl")
+    old = vault.tree_head()
+
+    FBCSecureVault(base_path=tmp_path, storage="jsonl").generate_proof("P1", "A", 1)
+    vault.generate_proof("P1", "B", 2)
+
+    new = vault.tree_head()
+    assert new["tree_size"] == 3 and new["root"] != old["root"]
+
+    # A proof against the older signed head still verifies
+    pinned = vault.inclusion_proof(0, old["tree_size"])
+    assert vault.verify_inclusion(pinned["record"], pinned, old["root"])
+    assert not vault.verify_inclusion(pinned["record"], pinned, new["root"])
+
+    forged = dict(new, root=old["root"])
+    assert not vault.verify_tree_head(forged)
+    assert not GlobalSecureVault(base_path=tmp_path).verify_tree_head(new)
+
+
+def test_archived_inclusion_proof_uses_sealed_root(tmp_path: Path) -> None:
+    vault = GlobalSecureVault(base_path=tmp_path)
+    vault.generate_proofs([("PROJECT_IV", f"N{i}", i) for i in range(6)])
+    summary = vault.seal_segment()["segments"][0]
+    vault.generate_proof("PROJECT_IV", "Cairo", 7)
+
+    proof = vault.inclusion_proof(3)
+    assert proof["segment"] == summary["file"]
+    assert proof["root"] == summary["merkle_root"]
+    assert GlobalSecureVault.verify_inclusion(
+        proof["record"], proof, summary["merkle_root"]
+    )
+
+    live = vault.inclusion_proof(8)
+    assert live["segment"] is None and live["leaf_index"] == 1
@@ -0,0 +1,403 @@
+# =========================================================
+# PATH: tests/test_simulation.py
+# DESCRIPTION: Global Simulation Engine Tests
+# VERSION: v5.1.0-ENTERPRISE-LTS
+# ROLE: Batch vs Scalar Engine Parity & Bulk Persistence
+# =========================================================
+
+import asyncio
+import dataclasses
+import json
+import multiprocessing
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+import run_simulation
+import simulation_config
+import simulation_engine
+from data_core import core, query_results
+from data_core.feed import ChangeFeed
+from data_core.persistence import MemoryBackend
+from data_core.query import ResultIndex
+from data_core.ring_buffer import RingBuffer
+from data_core.rollups import Rollups
+from data_sources import population_data, weather_api
+from data_sources.population_cache import PopulationCache
+from simulation_config import CITY_NODES, CityNode
+from Projects.Project_I_Urban_Revenue.revenue_optimizer import RevenueOptimizer
+from Projects.Project_II_Private_Districts.energy_forecast import predict_energy_savings
+from Projects.Project_III_Traffic_Intelligence import accident_pred
+from Projects.Project_III_Traffic_Intelligence.accident_pred import TrafficRiskEngine
+
+
+WEATHER = {"Cairo": 0.9, "Dubai": 0.1}
+
+
+def offline_weather(city: str) -> dict:
+    return {
+        "weather_state": "Stub",
+        "weather_factor": WEATHER.get(city, 0.3),
+        "data_mode": "TEST",
+    }
+
+
+def offline_population(country_code: str) -> dict:
+    return {"population": 0, "provider": "FALLBACK", "data_mode": "TEST"}
+
+
+async def offline_population_async(country_code: str) -> dict:
+    return offline_population(country_code)
+
+
+# =========================================================
+# FIXTURES (NO NETWORK, ISOLATED STORE)
+# =========================================================
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.setattr(simulation_engine, "get_live_weather", offline_weather)
+    monkeypatch.setattr(accident_pred, "get_live_weather", offline_weather)
+
+    monkeypatch.setattr(simulation_config, "fetch_population", offline_population)
+    monkeypatch.setattr(simulation_config, "fetch_population_async", offline_population_async)
+    monkeypatch.setattr(
+        simulation_config, "POPULATION_CACHE", PopulationCache(tmp_path / "population.json")
+    )
+    monkeypatch.setattr(simulation_config, "_UNAVAILABLE", set())
+
+    monkeypatch.setattr(core, "_DATA_STORE", RingBuffer(core._MAX_RECORDS))
+    monkeypatch.setattr(core, "_DATA_INDEX", ResultIndex(core._MAX_RECORDS))
+    monkeypatch.setattr(core, "_BACKEND", MemoryBackend())
+    monkeypatch.setattr(core, "_COLUMNAR", {})
+    monkeypatch.setattr(core, "_ROLLUPS", Rollups())
+    monkeypatch.setattr(core, "_PENDING", deque())
+    monkeypatch.setattr(core, "_ROLLUP_PENDING", deque())
+    monkeypatch.setattr(core, "_FEED", ChangeFeed(capacity=8))
+
+
+# =========================================================
+# BATCH ENGINE PARITY
+# =========================================================
+def test_batch_engine_matches_scalar_engines() -> None:
+    nodes = (
+        list(CITY_NODES)
+        + simulation_engine.manifest_city_nodes(CITY_NODES)
+        + simulation_engine.synthetic_city_nodes(50, seed=7)
+    )
+    outputs = simulation_engine.simulate_batch(simulation_engine.CityBatch.from_nodes(nodes))
+
+    for i, node in enumerate(nodes):
+        revenue = RevenueOptimizer(node.name).project_incremental_gain(node.base_revenue)
+        energy = predict_energy_savings(node.base_energy_bill)
+        risk = TrafficRiskEngine(node.name).analyze_real_time_risk(node.base_traffic_density)
+
+        assert outputs["revenue_gain"][i] == pytest.approx(revenue["Total_City_Gain"], abs=0.01)
+        assert outputs["energy_savings"][i] == pytest.approx(energy["ai_predicted_savings"])
+        assert outputs["risk_score"][i] == pytest.approx(risk["risk_score"], abs=1e-4)
+
+
+def test_manifest_and_synthetic_nodes() -> None:
+    manifest = simulation_engine.manifest_city_nodes(CITY_NODES)
+    names = [node.name for node in manifest]
+
+    # Austin and Dubai are already configured
+    assert names == ["Toronto", "Riyadh", "Singapore", "Berlin", "Tokyo"]
+    assert manifest[1].base_revenue == 12_000_000.0
+
+    assert simulation_engine.synthetic_city_nodes(20, seed=1) == \
+        simulation_engine.synthetic_city_nodes(20, seed=1)
+
+    with pytest.raises(ValueError):
+        simulation_engine.CityBatch.from_nodes(
+            [CityNode("X", "ZZ", 0.0, 1.0, 1, 0)]
+        )
+
+
+# =========================================================
+# MULTI-YEAR HORIZON
+# =========================================================
+def test_horizon_steps_match_scalar_engines_each_year() -> None:
+    nodes = list(CITY_NODES) + simulation_engine.synthetic_city_nodes(20, seed=3)
+    batch = simulation_engine.CityBatch.from_nodes(nodes)
+    horizon = simulation_engine.simulate_horizon(
+        batch, years=6, start_year=2030,
+        revenue_growth=0.05, energy_drift=-0.02, traffic_growth=0.1,
+    )
+
+    assert horizon.years.tolist() == list(range(2030, 2036))
+    assert horizon.risk_score.shape == (len(nodes), 6)
+
+    # Year 0 is the static single-year simulation
+    static = simulation_engine.simulate_batch(batch)
+    assert horizon.revenue_gain[:, 0].tolist() == static["revenue_gain"].tolist()
+
+    for i, node in enumerate(nodes):
+        revenue = node.base_revenue
+        bill = node.base_energy_bill
+        density = node.base_traffic_density
+        for t in range(6):
+            expected_revenue = RevenueOptimizer(node.name).project_incremental_gain(revenue)
+            expected_risk = TrafficRiskEngine(node.name).analyze_real_time_risk(density)
+
+            assert horizon.revenue_gain[i, t] == pytest.approx(
+                expected_revenue["Total_City_Gain"], abs=0.01
+            )
+            assert horizon.energy_savings[i, t] == pytest.approx(
+                predict_energy_savings(bill)["ai_predicted_savings"]
+            )
+            assert horizon.risk_score[i, t] == pytest.approx(expected_risk["risk_score"], abs=1e-4)
+
+            revenue *= 1.05
+            bill *= 0.98
+            density *= 1.1
+
+
+def test_horizon_accepts_per_city_rates() -> None:
+    batch = simulation_engine.CityBatch.from_nodes(list(CITY_NODES))
+    horizon = simulation_engine.simulate_horizon(
+        batch, years=3, revenue_growth=np.array([0.0, 0.1, 0.2])
+    )
+
+    assert horizon.revenue[:, -1] == pytest.approx(
+        batch.base_revenue * np.array([1.0, 1.1 ** 2, 1.2 ** 2])
+    )
+
+    with pytest.raises(ValueError):
+        simulation_engine.simulate_horizon(batch, years=0)
+
+
+# =========================================================
+# ORCHESTRATOR (BULK PERSISTENCE)
+# =========================================================
+def test_run_global_simulation_persists_every_node() -> None:
+    nodes = run_simulation.default_city_nodes(synthetic_nodes=2_000)
+    results = run_simulation.run_global_simulation(nodes, years=10)
+
+    assert [r["city"] for r in results] == [node.name for node in nodes]
+    assert results[0]["data_mode"] == "REALISTIC-DETERMINISTIC"
+    assert results[0]["end_year"] - results[0]["start_year"] == 9
+    assert results[0]["final_revenue_gain"] > results[0]["revenue_gain"]
+
+    stored = query_results(engine=run_simulation.SIMULATION_ENGINE)["results"]
+    assert len(stored) == len(nodes)
+    assert stored[0]["payload"]["city"] == "Cairo"
+    assert stored[-1]["payload"]["risk_score"] == results[-1]["risk_score"]
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_per_city_executors_match_vector_in_order(executor: str) -> None:
+    nodes = list(CITY_NODES) + simulation_engine.synthetic_city_nodes(40, seed=5)
+    vector = run_simulation.run_global_simulation(nodes, persist=False)
+    pooled = run_simulation.run_global_simulation(
+        nodes, persist=False, executor=executor, workers=2
+    )
+
+    assert all(row["elapsed_ms"] >= 0 for row in pooled)
+    for row in pooled:
+        del row["elapsed_ms"], row["executed_at"]
+    for row in vector:
+        del row["executed_at"]
+    assert pooled == vector
+
+    with pytest.raises(ValueError):
+        run_simulation.run_global_simulation(nodes, executor="gpu")
+
+
+def test_process_executor_does_not_rely_on_fork(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Spawned workers see none of this process's monkeypatches
+    spawn = multiprocessing.get_context("spawn")
+    monkeypatch.setattr(
+        run_simulation, "ProcessPoolExecutor", partial(ProcessPoolExecutor, mp_context=spawn)
+    )
+    nodes = list(CITY_NODES)
+
+    vector = run_simulation.run_global_simulation(nodes, persist=False)
+    pooled = run_simulation.run_global_simulation(
+        nodes, persist=False, executor="process", workers=2
+    )
+
+    assert [row["risk_score"] for row in pooled] == [row["risk_score"] for row in vector]
+    assert [row["population"] for row in pooled] == [row["population"] for row in vector]
+
+
+# =========================================================
+# ASYNC ORCHESTRATOR (LOCAL STUB HTTP SERVER)
+# =========================================================
+STUB_DELAY_SECONDS = 0.3
+
+
+class StubProviders(BaseHTTPRequestHandler):
+    """Open-Meteo and World Bank stand-ins with a fixed delay."""
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def do_GET(self) -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        time.sleep(STUB_DELAY_SECONDS)
+        with cls.lock:
+            cls.in_flight -= 1
+
+        if self.path.startswith("/v1/forecast"):
+            body = json.dumps({"current_weather": {"weathercode": 61}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            body = json.dumps([{"page": 1}, [{"value": 123456}]]).encode()
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for part in (body[:10], body[10:], b""):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(part), part))
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch: pytest.MonkeyPatch):
+    StubProviders.peak = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubProviders)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(
+        simulation_config, "fetch_population_async", population_data.fetch_population_async
+    )
+    monkeypatch.setattr(weather_api, "OPEN_METEO_BASE_URL", base + "/v1/forecast")
+    monkeypatch.setattr(
+        population_data, "WORLD_BANK_BASE_URL",
+        base + "/v2/country/{}/indicator/SP.POP.TOTL?format=json",
+    )
+    yield StubProviders
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_simulation_overlaps_external_lookups(stub_server) -> None:
+    nodes = list(CITY_NODES) + simulation_engine.synthetic_city_nodes(100)
+
+    started = time.perf_counter()
+    results = asyncio.run(run_simulation.run_global_simulation_async(nodes, concurrency=8))
+    elapsed = time.perf_counter() - started
+
+    # 3 weather + 3 population calls, run side by side
+    assert stub_server.peak == 6
+    assert elapsed < 3 * STUB_DELAY_SECONDS
+
+    cairo = results[0]
+    assert cairo["population"] == 123456
+    assert simulation_config.POPULATION_CACHE.get("EG") == 123456
+    assert cairo["risk_score"] == 1.0  # 180 / 300 + 0.6 (rain)
+    assert results[3]["risk_score"] == min(round(nodes[3].base_traffic_density / 300 + 0.3, 4), 1.0)
+
+    stored = query_results(engine=run_simulation.SIMULATION_ENGINE)["results"]
+    assert len(stored) == len(nodes)
+
+
+def test_async_simulation_respects_concurrency_limit(stub_server) -> None:
+    asyncio.run(run_simulation.run_global_simulation_async(
+        list(CITY_NODES), persist=False, concurrency=2
+    ))
+    assert stub_server.peak == 2
+
+    assert asyncio.run(weather_api.get_live_weather_async("Atlantis"))["weather_factor"] == 0.3
+
+
+# =========================================================
+# LAZY, CACHED POPULATION
+# =========================================================
+def test_import_does_not_touch_the_network() -> None:
+    guard = (
+        "import socket\n"
+        "def refuse(*args, **kwargs):\n"
+        "    raise AssertionError('network access during import')\n"
+        "socket.socket.connect = refuse\n"
+        "socket.create_connection = refuse\n"
+        "import simulation_config, run_simulation\n"
+        "assert len(simulation_config.CITY_NODES) == 3\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", guard], capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
+
+
+def test_population_resolves_lazily_through_the_cache(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    def counting(country_code: str) -> dict:
+        calls.append(country_code)
+        return {"population": 42_000_000}
+
+    monkeypatch.setattr(simulation_config, "fetch_population", counting)
+
+    node = CityNode("Cairo", "EG", 1.0, 1.0, 1, population_fallback=7)
+    assert calls == []
+    assert node.population == 42_000_000
+    assert node.population == 42_000_000
+    assert calls == ["EG"]
+
+    # Persisted: a fresh cache on the same file needs no lookup
+    reopened = PopulationCache(tmp_path / "population.json")
+    assert reopened.get("EG") == 42_000_000
+
+    # Expired entries are looked up again
+    monkeypatch.setattr(
+        simulation_config, "POPULATION_CACHE",
+        PopulationCache(tmp_path / "population.json", ttl_seconds=-1),
+    )
+    assert node.population == 42_000_000
+    assert calls == ["EG", "EG"]
+
+    # Fallbacks are used, and not retried within the process
+    failing = CityNode("Nowhere", "QQ", 1.0, 1.0, 1, population_fallback=7)
+    monkeypatch.setattr(simulation_config, "fetch_population", offline_population)
+    assert failing.population == 7
+    assert "QQ" in simulation_config._UNAVAILABLE
+
+
+def test_population_keyword_pins_the_value(monkeypatch) -> None:
+    monkeypatch.setattr(simulation_config, "fetch_population", offline_population)
+
+    node = CityNode(
+        name="Cairo", country_code="EG", base_revenue=1.0,
+        base_energy_bill=1.0, base_traffic_density=1, population=21_000_000,
+    )
+    assert node.population == 21_000_000
+    assert dataclasses.replace(node, name="Giza").population == 21_000_000
+    assert "EG" not in simulation_config._UNAVAILABLE
+
+
+def test_prefetch_populations_fetches_misses_concurrently(monkeypatch) -> None:
+    started = []
+
+    async def slow(country_code: str) -> dict:
+        started.append(country_code)
+        await asyncio.sleep(0.2)
+        return {"population": len(started) * 1000}
+
+    monkeypatch.setattr(simulation_config, "fetch_population_async", slow)
+    simulation_config.POPULATION_CACHE.put_many({"EG": 5})
+
+    began = time.perf_counter()
+    resolved = simulation_config.prefetch_populations(["EG", "US", "AE", "US", "ZZ"])
+
+    assert time.perf_counter() - began < 0.4
+    assert sorted(started) == ["AE", "US"]
+    assert resolved["EG"] == 5 and set(resolved) == {"EG", "US", "AE"}
+    assert simulation_config.POPULATION_CACHE.get_many(["US", "AE"]) == {
+        code: resolved[code] for code in ("US", "AE")
+    }